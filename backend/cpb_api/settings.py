@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/6.0/ref/settings/
 
 from pathlib import Path
 import importlib.util
+import os
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -32,6 +33,7 @@ ALLOWED_HOSTS = []
 # Application definition
 
 HAS_CORSHEADERS = importlib.util.find_spec("corsheaders") is not None
+HAS_ZSTANDARD = importlib.util.find_spec("zstandard") is not None
 
 INSTALLED_APPS = [
     'django.contrib.admin',
@@ -48,15 +50,40 @@ if HAS_CORSHEADERS:
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "parser.api.authentication.CachedJWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticated",
     ),
+    # orjson-backed JSON when installed, stdlib json otherwise.
+    "DEFAULT_RENDERER_CLASSES": (
+        "parser.api.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "parser.api.renderers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
+}
+
+SIMPLE_JWT = {
+    # Embeds the user-version claim so cached users can be revalidated.
+    "TOKEN_OBTAIN_SERIALIZER": "parser.api.auth_serializers.VersionedTokenObtainPairSerializer",
 }
 
+# Seconds an authenticated user is served from the per-process cache before
+# the database is consulted again. Cached users are checked against versions
+# kept in the JWT_USER_CACHE_ALIAS cache; with several workers it must be a
+# shared backend (Redis, Memcached, database) for deactivations and deletes
+# to reach every worker at once.
+JWT_USER_CACHE_TTL = 30
+JWT_USER_CACHE_ALIAS = "default"
+
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'parser.middleware.CompressionMiddleware',
+    'parser.middleware.TaxonomyPinMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -65,7 +92,15 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 if HAS_CORSHEADERS:
-    MIDDLEWARE.insert(1, 'corsheaders.middleware.CorsMiddleware')
+    MIDDLEWARE.insert(2, 'corsheaders.middleware.CorsMiddleware')
+
+# Responses at least this large are compressed (brotli when the optional
+# `brotli` package is installed, gzip otherwise) if the client accepts it.
+RESPONSE_COMPRESSION_MIN_BYTES = 1024
+
+# Profile exports are cached per resume revision along with precompressed
+# gzip/brotli bodies for the export endpoint.
+EXPORT_CACHE_TIMEOUT = 3600
 
 
 ROOT_URLCONF = 'cpb_api.urls'
@@ -94,11 +129,85 @@ WSGI_APPLICATION = 'cpb_api.wsgi.application'
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        # CPB_SQLITE_PATH lets tooling such as `manage.py loadtest` use a scratch database.
+        'NAME': os.environ.get('CPB_SQLITE_PATH', BASE_DIR / 'db.sqlite3'),
     }
 }
 
 
+# Resume.raw_text and Resume.parsed_data are stored compressed. zstd is used
+# when the optional `zstandard` package is installed; zlib otherwise. Existing
+# rows stay readable after switching codecs.
+RESUME_COMPRESSION_CODEC = 'zstd' if HAS_ZSTANDARD else 'zlib'
+
+# Resumes parsed by an older parser/taxonomy version are refreshed from raw_text
+# by `manage.py reparse_stale` and, when read (detail/export views), by a
+# per-process background queue of at most RESUME_REPARSE_QUEUE_SIZE rows.
+# Confirmed or user-edited resumes are never re-parsed. The sweeper rate is in
+# rows/second.
+RESUME_REPARSE_ON_READ = True
+RESUME_REPARSE_RATE = 2.0
+RESUME_REPARSE_QUEUE_SIZE = 1000
+
+# Per-process admission control for POST /api/parse-resume/. Parses beyond
+# MAX_CONCURRENT wait in a FIFO queue of MAX_QUEUE for up to QUEUE_TIMEOUT
+# seconds before a 503; a user holding PER_USER_LIMIT slots gets a 429.
+PARSE_ADMISSION = {
+    'MAX_CONCURRENT': 4,
+    'MAX_QUEUE': 16,
+    'QUEUE_TIMEOUT': 10.0,
+    'PER_USER_LIMIT': 2,
+}
+
+# Per-request time budget (seconds, None for no limit) for POST /api/parse-resume/,
+# counted from arrival and including the admission queue. Parser stages not
+# started in time are skipped and the partial resume is stored for
+# `manage.py reparse_stale` to finish; text extraction past it answers 503.
+PARSE_TIME_BUDGET = 20.0
+
+# Idempotency-Key support for POST /api/parse-resume/, stored in the database
+# so every worker sees the same keys. Keys and their responses are kept for
+# IDEMPOTENCY_KEY_TTL seconds; a concurrent duplicate waits up to
+# IDEMPOTENCY_WAIT_TIMEOUT seconds for the original before a 409. Once
+# IDEMPOTENCY_MAX_KEYS unexpired keys exist, new keys get a 503. Each worker
+# deletes expired keys at most every IDEMPOTENCY_CLEANUP_INTERVAL seconds.
+IDEMPOTENCY_KEY_TTL = 24 * 3600
+IDEMPOTENCY_WAIT_TIMEOUT = 30.0
+IDEMPOTENCY_MAX_KEYS = 100_000
+IDEMPOTENCY_CLEANUP_INTERVAL = 300.0
+
+# POST /api/resumes/rank/ keeps a skill/term matrix per user in each process;
+# at most this many users' matrices are held (least recently used evicted).
+RANK_INDEX_MAX_USERS = 64
+
+# Parser stage output memoized per process, keyed by each stage's input lines
+# (see parser.services.section_cache). Least recently used entries are evicted
+# once their pickled output exceeds this many bytes; 0 disables it.
+PARSER_SECTION_CACHE_BYTES = 8 * 1024 * 1024
+# Per-line extractor output (skill hits, experience date spans, project URL
+# spans) memoized per process, keyed by the normalized line and shared by all
+# requests (see parser.services.line_cache). Least recently used lines are
+# evicted once the entries exceed this many bytes; 0 disables it.
+PARSER_LINE_CACHE_BYTES = 4 * 1024 * 1024
+
+# Compiled skill/section-header taxonomy (`manage.py compile_taxonomy`), memory-
+# mapped read-only by every worker. Ignored, and the JSON compiled in memory
+# instead, when missing or built from different skills/section_headers JSON.
+PARSER_TAXONOMY_PATH = os.environ.get('CPB_TAXONOMY_PATH', BASE_DIR / 'parser' / 'data' / 'taxonomy.bin')
+# Directory with the skills.json (skills and their aliases, by category) and
+# section_headers.json the taxonomy is compiled from; point it at a larger
+# skill taxonomy without editing the bundled data.
+PARSER_TAXONOMY_DATA_DIR = os.environ.get('CPB_TAXONOMY_DATA_DIR', BASE_DIR / 'parser' / 'data')
+# Seconds between checks for replaced taxonomy files. A changed file is loaded
+# in the background and used for requests that start after it is ready;
+# 0 disables reloading.
+PARSER_TAXONOMY_RELOAD_INTERVAL = float(os.environ.get('CPB_TAXONOMY_RELOAD_INTERVAL', 5))
+# Load the URLconf, document libraries and taxonomy when cpb_api.wsgi is
+# imported instead of on first use. With `gunicorn --preload` this happens
+# once before workers are forked.
+PARSER_WARMUP = os.environ.get('CPB_WARMUP', '') == '1'
+
+
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
 
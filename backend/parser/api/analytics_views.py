@@ -0,0 +1,31 @@
+from rest_framework import permissions
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from parser.models import SkillAnalyticsSnapshot
+from parser.services.skill_analytics import BUCKETS, summarize
+
+
+class SkillAnalyticsView(APIView):
+    """Latest corpus-wide skill snapshot (staff only: it spans every user)."""
+
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        bucket = request.query_params.get("bucket", "month")
+        if bucket not in BUCKETS:
+            raise ValidationError({"bucket": f"Must be one of: {', '.join(BUCKETS)}."})
+        try:
+            limit = min(max(int(request.query_params.get("limit", 20)), 1), 100)
+        except ValueError:
+            raise ValidationError({"limit": "Must be an integer."})
+
+        snapshot = SkillAnalyticsSnapshot.objects.filter(bucket=bucket).order_by("-created_at", "-pk").first()
+        if snapshot is None:
+            raise NotFound("No analytics snapshot yet. Run `manage.py skill_analytics`.")
+
+        skill = request.query_params.get("skill")
+        if skill is not None and skill not in {name for _, name in snapshot.skills}:
+            raise ValidationError({"skill": "Unknown skill."})
+        return Response(summarize(snapshot, skill=skill, limit=limit))
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import threading
+import time
+from typing import Dict, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+
+USER_VERSION_CLAIM = "uv"
+# Seconds a user's shared version is kept; once it expires the next request
+# looks the user up again and republishes it.
+SHARED_VERSION_TIMEOUT = 24 * 3600
+
+
+def user_version(user) -> str:
+    """Short digest that changes on password change or (de)activation."""
+    return hashlib.sha1(f"{user.password}:{user.is_active}".encode("utf-8")).hexdigest()[:12]
+
+
+class _UserCache:
+    """Process-local TTL cache of authenticated users keyed by user id.
+
+    Entries are checked against each user's current version, kept in the
+    Django cache named by ``JWT_USER_CACHE_ALIAS``. Saving or deleting a user
+    updates that version, so with a cache shared by the workers (Redis,
+    Memcached, the database) every worker stops serving the stale user on its
+    next request. A missing version counts as a miss.
+    """
+
+    def __init__(self, max_entries: int = 10_000):
+        self.max_entries = max_entries
+        self._entries: Dict[str, Tuple[float, str, object]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id: str, version: str | None):
+        """The cached user, unless expired or superseded.
+
+        ``version`` is the token's user-version claim; tokens issued without
+        one are checked against the shared version only.
+        """
+        with self._lock:
+            entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        expires_at, cached_version, user = entry
+        if expires_at < time.monotonic() or version not in (None, cached_version):
+            return None
+        if self._shared().get(self._key(user_id)) != cached_version:
+            return None
+        return user
+
+    def put(self, user_id: str, user) -> None:
+        ttl = getattr(settings, "JWT_USER_CACHE_TTL", 30)
+        version = user_version(user)
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                # Dicts keep insertion order, so this drops the oldest entry.
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[user_id] = (time.monotonic() + ttl, version, user)
+        # ``add`` never replaces a version published by a save that raced
+        # this read; at worst the user is looked up again.
+        self._shared().add(self._key(user_id), version, SHARED_VERSION_TIMEOUT)
+
+    def publish(self, user) -> None:
+        """Record ``user``'s new version for every worker; called when it is saved."""
+        self._shared().set(self._key(user.pk), user_version(user), SHARED_VERSION_TIMEOUT)
+        self.evict(user.pk)
+
+    def forget(self, user_id) -> None:
+        """Drop ``user_id`` for every worker; called when the user is deleted."""
+        self._shared().delete(self._key(user_id))
+        self.evict(user_id)
+
+    def evict(self, user_id) -> None:
+        with self._lock:
+            self._entries.pop(str(user_id), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _key(user_id) -> str:
+        return f"jwt-user-version:{user_id}"
+
+    @staticmethod
+    def _shared():
+        return caches[getattr(settings, "JWT_USER_CACHE_ALIAS", "default")]
+
+
+user_cache = _UserCache()
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """JWTAuthentication that skips the per-request user query on cache hits.
+
+    The database is consulted on a cache miss, after ``JWT_USER_CACHE_TTL``
+    seconds, or when the cached user's version differs from the shared one
+    (the user was saved or deleted on any worker) or from the token's
+    user-version claim. Tokens issued before the claim existed carry none and
+    are checked against the shared version alone.
+    """
+
+    def get_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if user_id is not None:
+            cached = user_cache.get(str(user_id), validated_token.get(USER_VERSION_CLAIM))
+            if cached is not None:
+                return copy.copy(cached)
+
+        user = super().get_user(validated_token)
+        user_cache.put(str(user_id), user)
+        return user
@@ -0,0 +1,24 @@
+from rest_framework import permissions
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from parser.services.admission import parse_admission
+from parser.services.line_cache import line_cache
+from parser.services.resume_reparse import reparse_queue
+from parser.services.section_cache import section_cache
+from parser.services.taxonomy import taxonomy_registry
+
+
+class MetricsView(APIView):
+    """In-process counters for this worker (staff only)."""
+
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        return Response({
+            "parse_admission": parse_admission().snapshot(),
+            "section_cache": section_cache.snapshot(),
+            "line_cache": line_cache.snapshot(),
+            "taxonomy": taxonomy_registry.snapshot(),
+            "reparse_queue": reparse_queue.snapshot(),
+        })
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import math
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+# Types orjson would encode itself but DRF's encoder formats differently
+# (datetimes end in "Z" for UTC; dataclasses are not serializable).
+OPTIONS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    if orjson is not None else 0
+)
+
+
+def _has_non_finite(data) -> bool:
+    """Whether ``data`` holds a NaN or infinite float, which orjson renders as null."""
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if type(value) is float:
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return False
+
+
+class FastJSONRenderer(JSONRenderer):
+    """JSONRenderer backed by orjson, falling back to the stdlib renderer.
+
+    Output matches ``JSONRenderer`` byte for byte except for float spelling
+    (``1.5e-7`` for ``1.5e-07``): dates, times and other non-native types go
+    through DRF's encoder. The stdlib path is used for indented output
+    (``?format=json; indent=N`` negotiation and the browsable API), which
+    orjson only supports at width 2, and for NaN and infinity, which it
+    rejects or writes as DRF's settings say.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        encoder = self.encoder_class()
+        rendered = orjson.dumps(data, default=encoder.default, option=OPTIONS)
+        # orjson writes NaN and infinity as null; only then is the walk needed.
+        if b"null" in rendered and _has_non_finite(data):
+            return super().render(data, accepted_media_type, renderer_context)
+        # Match the stdlib renderer: keep output a strict JavaScript subset.
+        return rendered.replace("\u2028".encode(), b"\\u2028").replace("\u2029".encode(), b"\\u2029")
+
+
+class FastJSONParser(JSONParser):
+    """JSONParser backed by orjson, falling back to the stdlib parser."""
+
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if orjson is None:
+            return super().parse(stream, media_type, parser_context)
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError("JSON parse error - %s" % str(exc))
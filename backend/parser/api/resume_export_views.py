@@ -1,9 +1,15 @@
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
 from rest_framework import permissions
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.shortcuts import get_object_or_404
 
+from parser.compression import negotiate
 from parser.models import Resume
+from parser.services.export_cache import ExportCache
+from parser.services.resume_reparse import reparse_queue
 from parser.services.resume_workflow import ResumeWorkflowService
 
 
@@ -13,13 +19,23 @@ class ResumeExportView(APIView):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.workflow = ResumeWorkflowService()
+        self.export_cache = ExportCache(exporter=self.workflow.exporter)
 
     def get(self, request, pk: int):
         resume = get_object_or_404(Resume, pk=pk, user=request.user)
-        exports = self.workflow.build_exports(resume.parsed_data)
-        return Response(
-            {
-                "resume_id": resume.id,
-                "profile_exports": exports,
-            }
-        )
+        if settings.RESUME_REPARSE_ON_READ:
+            reparse_queue.submit(resume)
+
+        cached = self.export_cache.get(resume)
+        if request.accepted_renderer.format != "json":
+            return Response({"resume_id": resume.id, "profile_exports": cached.exports})
+
+        # Serve the cached JSON body, compressed once per revision and coding
+        # when the client allows it.
+        response = HttpResponse(cached.body, content_type="application/json")
+        patch_vary_headers(response, ("Accept-Encoding",))
+        coding = negotiate(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        if coding is not None:
+            response.content = self.export_cache.encoded(resume, coding, cached.body)
+            response.headers["Content-Encoding"] = coding
+        return response
@@ -0,0 +1,15 @@
+from rest_framework import permissions
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from parser.services.ranking import rank_resumes
+from .serializers import ResumeRankSerializer
+
+
+class ResumeRankView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        serializer = ResumeRankSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        return Response(rank_resumes(request.user, **serializer.validated_data))
@@ -0,0 +1,55 @@
+from django.db import transaction
+from django.shortcuts import get_object_or_404
+from rest_framework import permissions
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from parser.models import Resume
+from parser.services.admission import parse_admission
+from parser.services.parser_version import current_parser_version
+from parser.services.resume_health import HEALTH_RULES_VERSION
+from parser.services.resume_stats import ResumeStatsService, StatsContribution
+from parser.services.resume_workflow import ResumeWorkflowService
+from .serializers import ResumeCreateSerializer, ResumeReparseSerializer
+
+
+class ResumeReparseView(APIView):
+    """Re-parse a resume from edited text, re-running only the changed stages."""
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.workflow = ResumeWorkflowService()
+        self.stats = ResumeStatsService()
+
+    def post(self, request, pk):
+        resume = get_object_or_404(Resume, pk=pk, user=request.user)
+        serializer = ResumeReparseSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        raw_text = serializer.validated_data["raw_text"]
+
+        with parse_admission().admit(request.user.pk):
+            result = self.workflow.process_text(resume, raw_text)
+        parsed = result["parsed_data"]
+
+        before = StatsContribution.of_resume(resume)
+        # Changed parsed data needs a fresh review; an identical parse keeps
+        # the confirmation.
+        if parsed != resume.parsed_data:
+            resume.is_confirmed = False
+        resume.raw_text = raw_text
+        resume.parsed_data = parsed
+        resume.resume_health = parsed.get("resume_health", {})
+        resume.health_rules = {}
+        resume.health_version = HEALTH_RULES_VERSION
+        resume.parser_version = current_parser_version()
+        # The parsed data reflects the text again.
+        resume.is_edited = False
+        for name, value in result["signature"].items():
+            setattr(resume, name, value)
+        with transaction.atomic():
+            resume.save()
+            self.stats.record(resume.user_id, before, StatsContribution.of_resume(resume))
+
+        return Response({**ResumeCreateSerializer(resume).data, "stages": result["stages"]})
@@ -0,0 +1,14 @@
+from rest_framework import permissions
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from parser.services.resume_stats import ResumeStatsService
+from .serializers import UserResumeStatsSerializer
+
+
+class ResumeStatsView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        stats = ResumeStatsService().for_user(request.user)
+        return Response(UserResumeStatsSerializer(stats).data)
@@ -1,5 +1,10 @@
+from django.conf import settings
+from django.db import transaction
 from rest_framework import generics, permissions
+from rest_framework.response import Response
 from parser.models import Resume
+from parser.services.resume_reparse import reparse_queue
+from parser.services.resume_stats import ResumeStatsService, StatsContribution
 from .serializers import ResumeCreateSerializer
 
 class ResumeListView(generics.ListAPIView):
@@ -16,3 +21,15 @@ class ResumeDetailView(generics.RetrieveDestroyAPIView):
     def get_queryset(self):
         # ✅ prevents accessing other users' resumes
         return Resume.objects.filter(user=self.request.user)
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        if settings.RESUME_REPARSE_ON_READ:
+            reparse_queue.submit(instance)
+        return Response(self.get_serializer(instance).data)
+
+    def perform_destroy(self, instance):
+        before = StatsContribution.of_resume(instance)
+        with transaction.atomic():
+            instance.delete()
+            ResumeStatsService().record(instance.user_id, before, None)
@@ -1,7 +1,10 @@
+from django.db import transaction
 from rest_framework import serializers
-from parser.models import Resume
-from parser.services.profile_export import ResumeProfileExporter
-from parser.services.resume_health import score_resume
+from parser.models import Resume, UserResumeStats
+from parser.services.export_cache import ExportCache
+from parser.services.profile_export import EXPORT_INPUTS
+from parser.services.resume_health import HEALTH_RULES_VERSION, changed_keys, rescore
+from parser.services.resume_stats import HISTOGRAM_BUCKET, ResumeStatsService, StatsContribution
 
 class ResumeUploadSerializer(serializers.Serializer):
     file = serializers.FileField()
@@ -14,18 +17,24 @@ class ResumeUploadSerializer(serializers.Serializer):
             raise serializers.ValidationError("File size exceeds the 5 MB limit.")
         return value
     
+class ResumeRankSerializer(serializers.Serializer):
+    job_description = serializers.CharField(max_length=50_000)
+    top_k = serializers.IntegerField(min_value=1, max_value=100, default=10)
+
+class ResumeReparseSerializer(serializers.Serializer):
+    raw_text = serializers.CharField(max_length=200_000, trim_whitespace=False)
+
 class ResumeCreateSerializer(serializers.ModelSerializer):
     profile_exports = serializers.SerializerMethodField()
 
     class Meta:
         model = Resume
         fields = ["id", "file_name", "raw_text", "parsed_data", "resume_health",
-                  "is_confirmed", "created_at", "updated_at", "profile_exports"]
-        read_only_fields = ["id", "created_at", "updated_at"]
+                  "is_confirmed", "near_duplicate_of", "created_at", "updated_at", "profile_exports"]
+        read_only_fields = ["id", "near_duplicate_of", "created_at", "updated_at"]
 
     def get_profile_exports(self, obj):
-        exporter = ResumeProfileExporter()
-        return exporter.export(obj.parsed_data)
+        return ExportCache().exports(obj)
 
 class ResumeUpdateSerializer(serializers.ModelSerializer):
     class Meta:
@@ -38,9 +47,64 @@ class ResumeUpdateSerializer(serializers.ModelSerializer):
         return value
 
     def update(self, instance, validated_data):
+        # Top-level parsed_data keys this update changed, for callers reporting a diff.
+        self.changed_keys = set()
         parsed_data = validated_data.get("parsed_data")
         if parsed_data is not None:
+            self.changed_keys = changed_keys(instance.parsed_data, parsed_data)
             if "resume_health" not in validated_data:
-                validated_data["resume_health"] = score_resume(parsed_data)
+                previous = instance.health_rules if instance.health_version == HEALTH_RULES_VERSION else None
+                health, rules, _ = rescore(parsed_data, self.changed_keys, previous)
+                validated_data["resume_health"] = health
+                validated_data["health_rules"] = rules
+                validated_data["health_version"] = HEALTH_RULES_VERSION
             validated_data["parsed_data"] = {**parsed_data, "resume_health": validated_data["resume_health"]}
-        return super().update(instance, validated_data)
+            # Hand-edited data must never be replaced by a background re-parse.
+            validated_data["is_edited"] = True
+        if "resume_health" in validated_data and "health_rules" not in validated_data:
+            # A client-supplied summary no longer matches the per-rule results.
+            validated_data["health_rules"] = {}
+
+        before = StatsContribution.of_resume(instance)
+        export_cache = ExportCache()
+        previous_exports = export_cache.key(instance)
+        with transaction.atomic():
+            instance = super().update(instance, validated_data)
+            ResumeStatsService().record(instance.user_id, before, StatsContribution.of_resume(instance))
+        if not self.changed_keys.intersection(EXPORT_INPUTS):
+            export_cache.carry_over(previous_exports, instance)
+        return instance
+
+
+def _by_count(counts):
+    return dict(sorted(counts.items(), key=lambda item: (-item[1], item[0])))
+
+class UserResumeStatsSerializer(serializers.ModelSerializer):
+    average_score = serializers.SerializerMethodField()
+    score_histogram = serializers.SerializerMethodField()
+    skills = serializers.SerializerMethodField()
+    warnings = serializers.SerializerMethodField()
+    sections = serializers.SerializerMethodField()
+
+    class Meta:
+        model = UserResumeStats
+        fields = ["resume_count", "average_score", "score_histogram", "skills", "warnings", "sections", "updated_at"]
+
+    def get_average_score(self, obj):
+        return round(obj.score_sum / obj.scored_count, 1) if obj.scored_count else None
+
+    def get_score_histogram(self, obj):
+        histogram = {}
+        for low in range(0, 100, HISTOGRAM_BUCKET):
+            high = 100 if low + HISTOGRAM_BUCKET >= 100 else low + HISTOGRAM_BUCKET - 1
+            histogram[f"{low}-{high}"] = obj.score_histogram.get(str(low), 0)
+        return histogram
+
+    def get_skills(self, obj):
+        return {category: _by_count(counts) for category, counts in sorted(obj.skill_counts.items())}
+
+    def get_warnings(self, obj):
+        return _by_count(obj.warning_counts)
+
+    def get_sections(self, obj):
+        return _by_count(obj.section_counts)
@@ -5,12 +5,22 @@ from .auth_views import RegisterView
 from .resume_views import ResumeListView, ResumeDetailView
 from .view_resume_edit import ResumeUpdateView
 from .resume_export_views import ResumeExportView
+from .metrics_views import MetricsView
+from .analytics_views import SkillAnalyticsView
+from .resume_rank_views import ResumeRankView
+from .resume_stats_views import ResumeStatsView
+from .resume_reparse_views import ResumeReparseView
 
 urlpatterns = [
     path("parse-resume/", ParseResumeView.as_view(), name="parse-resume"),
     path("resumes/", ResumeListView.as_view(), name="resume-list"),
+    path("resumes/rank/", ResumeRankView.as_view(), name="resume-rank"),
+    path("resumes/stats/", ResumeStatsView.as_view(), name="resume-stats"),
     path("resumes/<int:pk>/", ResumeDetailView.as_view(), name="resume-detail"),
     path("resumes/<int:pk>/edit/", ResumeUpdateView.as_view(), name="resume-update"),
+    path("resumes/<int:pk>/reparse/", ResumeReparseView.as_view(), name="resume-reparse"),
     path("resumes/<int:pk>/exports/", ResumeExportView.as_view(), name="resume-export"),
     path("register/", RegisterView.as_view(), name="register"),
+    path("metrics/", MetricsView.as_view(), name="metrics"),
+    path("analytics/skills/", SkillAnalyticsView.as_view(), name="skill-analytics"),
 ]
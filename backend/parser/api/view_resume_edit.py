@@ -1,8 +1,19 @@
 from rest_framework import generics, permissions
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from parser.models import Resume
+from parser.services.export_cache import ExportCache
+from parser.services.profile_export import EXPORT_INPUTS
 from .serializers import ResumeCreateSerializer, ResumeUpdateSerializer
 
+RESPONSE_MODES = ("full", "changes")
+
+
+def version_tag(resume) -> str:
+    """Opaque tag that changes on every save of ``resume``."""
+    return f"{int(resume.updated_at.timestamp() * 1_000_000):x}"
+
+
 class ResumeUpdateView(generics.UpdateAPIView):
     serializer_class = ResumeUpdateSerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -11,9 +22,34 @@ class ResumeUpdateView(generics.UpdateAPIView):
         return Resume.objects.filter(user=self.request.user)
 
     def update(self, request, *args, **kwargs):
+        mode = request.query_params.get("response", "full")
+        if mode not in RESPONSE_MODES:
+            raise ValidationError({"response": f"Must be one of: {', '.join(RESPONSE_MODES)}."})
+
         partial = kwargs.pop("partial", True)
         instance = self.get_object()
+        before = {"resume_health": instance.resume_health, "is_confirmed": instance.is_confirmed}
         serializer = self.get_serializer(instance, data=request.data, partial=partial)
         serializer.is_valid(raise_exception=True)
         self.perform_update(serializer)
-        return Response(ResumeCreateSerializer(instance).data)
+
+        if mode == "full":
+            data = ResumeCreateSerializer(instance).data
+        else:
+            data = {"id": instance.pk, "version": version_tag(instance), "changed": self._changes(serializer, before)}
+        response = Response(data)
+        response["ETag"] = f'"{version_tag(instance)}"'
+        return response
+
+    @staticmethod
+    def _changes(serializer, before):
+        instance = serializer.instance
+        changed = {}
+        if serializer.changed_keys:
+            changed["parsed_data"] = {key: instance.parsed_data.get(key) for key in sorted(serializer.changed_keys)}
+        for name, value in before.items():
+            if getattr(instance, name) != value:
+                changed[name] = getattr(instance, name)
+        if serializer.changed_keys.intersection(EXPORT_INPUTS):
+            changed["profile_exports"] = ExportCache().exports(instance)
+        return changed
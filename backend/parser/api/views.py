@@ -1,9 +1,22 @@
+import hashlib
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import transaction
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status, permissions
+from rest_framework.exceptions import ValidationError
 
 from parser.models import Resume
 from .serializers import ResumeUploadSerializer
+from parser.services.admission import ParsingUnavailable, parse_admission
+from parser.services.build_output import OUTPUT_FIELDS
+from parser.services.deadline import Deadline, DeadlineExceeded
+from parser.services.idempotency import MAX_KEY_LENGTH, idempotency_store
+from parser.services.parser_version import current_parser_version
+from parser.services.resume_health import HEALTH_RULES_VERSION
+from parser.services.resume_stats import ResumeStatsService, StatsContribution
 from parser.services.resume_workflow import ResumeWorkflowService
 
 
@@ -13,24 +26,104 @@ class ParseResumeView(APIView):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.workflow = ResumeWorkflowService()
+        self.stats = ResumeStatsService()
 
     def post(self, request):
         serializer = ResumeUploadSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-
         upload = serializer.validated_data["file"]
-        result = self.workflow.process_upload(upload)
+        # The budget covers the whole request, including the admission queue.
+        deadline = Deadline.after(getattr(settings, "PARSE_TIME_BUDGET", None))
+
+        fields = self._requested_fields(request)
+        if fields is not None:
+            # Selective extraction is a read-only preview: nothing is stored,
+            # so there is nothing for an Idempotency-Key to replay.
+            with self._admitted(request, deadline):
+                return Response(self.workflow.extract_fields(upload, fields, deadline=deadline))
+
+        key = request.headers.get("Idempotency-Key")
+        if not key:
+            return Response(self._parse(request, upload, deadline), status=status.HTTP_201_CREATED)
+        if len(key) > MAX_KEY_LENGTH:
+            raise ValidationError({"Idempotency-Key": f"Must be at most {MAX_KEY_LENGTH} characters."})
+
+        # Retries replay the original response instead of parsing again; the
+        # check runs before admission so duplicates never take a parse slot.
+        with idempotency_store.claim(request.user.pk, key, self._fingerprint(upload)) as claim:
+            if claim.replayed:
+                response = Response(claim.body, status=claim.status)
+                response["Idempotent-Replayed"] = "true"
+                return response
+
+            payload = self._parse(request, upload, deadline)
+            claim.complete(status.HTTP_201_CREATED, payload)
+        return Response(payload, status=status.HTTP_201_CREATED)
+
+    @contextmanager
+    def _admitted(self, request, deadline):
+        admission = parse_admission()
+        with admission.admit(request.user.pk, timeout=deadline.remaining()):
+            try:
+                yield
+            except DeadlineExceeded as exc:
+                # Without the full text there is nothing worth storing.
+                raise ParsingUnavailable(wait=admission.retry_after(), detail=str(exc)) from exc
+
+    def _parse(self, request, upload, deadline):
+        # Validation runs before admission so malformed uploads never queue.
+        with self._admitted(request, deadline):
+            result = self.workflow.process_upload(upload, user=request.user, deadline=deadline)
         raw_text = result["raw_text"]
         parsed = result["parsed_data"]
         profile_exports = result["profile_exports"]
+        near_duplicate = result["near_duplicate"]
 
-        resume = Resume.objects.create(
-            user=request.user,
-            file_name=upload.name,
-            raw_text=raw_text,
-            parsed_data=parsed,
-            resume_health=parsed.get("resume_health", {}),
-        )
+        with transaction.atomic():
+            resume = Resume.objects.create(
+                user=request.user,
+                file_name=upload.name,
+                raw_text=raw_text,
+                parsed_data=parsed,
+                resume_health=parsed.get("resume_health", {}),
+                health_version=HEALTH_RULES_VERSION,
+                # A partial parse is stale from the start, so reparse_stale finishes it.
+                parser_version="" if result["incomplete"] else current_parser_version(),
+                near_duplicate_of=near_duplicate.resume if near_duplicate else None,
+                **result["signature"],
+            )
+            self.stats.record(request.user.pk, None, StatsContribution.of_resume(resume))
 
-        payload = {"resume_id": resume.id, **parsed, "raw_text": raw_text, "profile_exports": profile_exports}
-        return Response(payload, status=status.HTTP_201_CREATED)
+        relationship = None
+        if near_duplicate is not None:
+            relationship = {
+                "resume_id": near_duplicate.resume.pk,
+                "distance": near_duplicate.distance,
+                "reused_sections": result["reused_sections"],
+            }
+        return {
+            "resume_id": resume.id,
+            **parsed,
+            "raw_text": raw_text,
+            "profile_exports": profile_exports,
+            "near_duplicate_of": relationship,
+        }
+
+    @staticmethod
+    def _requested_fields(request):
+        value = request.query_params.get("fields")
+        if value is None:
+            return None
+        fields = [name.strip() for name in value.split(",") if name.strip()]
+        unknown = [name for name in fields if name not in OUTPUT_FIELDS]
+        if not fields or unknown:
+            raise ValidationError({"fields": f"Choose from: {', '.join(OUTPUT_FIELDS)}."})
+        return fields
+
+    @staticmethod
+    def _fingerprint(upload) -> str:
+        digest = hashlib.sha256(upload.name.encode("utf-8"))
+        for chunk in upload.chunks():
+            digest.update(chunk)
+        upload.seek(0)
+        return digest.hexdigest()
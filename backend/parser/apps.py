@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class ParserConfig(AppConfig):
     name = 'parser'
+
+    def ready(self):
+        from parser import signals  # noqa: F401
@@ -0,0 +1,90 @@
+"""Benchmark suites run via ``manage.py benchmark <suite>``.
+
+Each suite module exposes ``run(**options) -> list[BenchResult]``. Results are
+compared against ``baselines.json`` by the management command; a suite may also
+expose ``check(results) -> list[str]`` for invariants that hold without a
+baseline (each returned string is reported as a failure).
+
+Baselines are wall-clock times from whichever machine stored them, together
+with that machine's :func:`calibrate` time. A run is compared after scaling
+the baseline by the ratio of its own calibration to the stored one, so a
+machine that is uniformly slower does not report regressions.
+"""
+
+from __future__ import annotations
+
+import importlib
+import re
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List
+
+SUITES = {
+    "auth": "parser.benchmarks.auth",
+    "imports": "parser.benchmarks.imports",
+    "line_cache": "parser.benchmarks.line_cache",
+    "preprocess": "parser.benchmarks.preprocess",
+    "ranking": "parser.benchmarks.ranking",
+    "records": "parser.benchmarks.records",
+    "regex": "parser.benchmarks.regex",
+    "similarity": "parser.benchmarks.similarity",
+    "stages": "parser.benchmarks.stages",
+    "taxonomy": "parser.benchmarks.taxonomy",
+}
+
+
+@dataclass(slots=True)
+class BenchResult:
+    name: str
+    seconds: float
+    peak_kib: float | None = None
+    throughput_mb_s: float | None = None
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+
+def load_suite(name: str) -> Callable[..., List[BenchResult]]:
+    return importlib.import_module(SUITES[name]).run
+
+
+def load_check(name: str) -> Callable[[List[BenchResult]], List[str]] | None:
+    return getattr(importlib.import_module(SUITES[name]), "check", None)
+
+
+def best_of(repeat: int, func: Callable[[], Any]) -> float:
+    """Minimum wall time of ``repeat`` calls, in seconds."""
+    best = float("inf")
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def calibrate(repeat: int = 20) -> float:
+    """Best wall time of a fixed CPU-bound workload (string, dict and regex work), in seconds."""
+    text = " ".join(f"word{index % 97} {index}" for index in range(20_000))
+    pattern = re.compile(r"word(\d+) (\d+)")
+
+    def work() -> None:
+        counts: Dict[str, int] = {}
+        for token in text.split():
+            counts[token] = counts.get(token, 0) + 1
+        sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+        sum(int(first) + int(second) for first, second in pattern.findall(text))
+
+    return best_of(repeat, work)
+
+
+def peak_kib(func: Callable[[], Any]) -> float:
+    """Peak traced allocation of one call, in KiB."""
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    if not already_tracing:
+        tracemalloc.stop()
+    return (peak - baseline) / 1024
@@ -0,0 +1,58 @@
+"""Queries and time per authenticated request, stock vs cached JWT authentication.
+
+Runs inside a rolled-back transaction so the configured database is left
+untouched.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, List
+
+from django.contrib.auth.models import User
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+from parser.api.auth_serializers import VersionedTokenObtainPairSerializer
+from parser.api.authentication import CachedJWTAuthentication, user_cache
+from parser.api.resume_views import ResumeListView
+from parser.benchmarks import BenchResult
+
+
+class _Rollback(Exception):
+    pass
+
+
+def _measure(auth_class, token: str, requests: int) -> BenchResult:
+    view = ResumeListView.as_view(authentication_classes=[auth_class])
+    factory = APIRequestFactory()
+    user_cache.clear()
+    with CaptureQueriesContext(connection) as queries:
+        started = time.perf_counter()
+        for _ in range(requests):
+            request = factory.get("/api/resumes/", HTTP_AUTHORIZATION=f"Bearer {token}")
+            response = view(request)
+            assert response.status_code == 200, response.status_code
+        elapsed = time.perf_counter() - started
+    return BenchResult(
+        name=auth_class.__name__,
+        seconds=elapsed / requests,
+        extra={"queries_per_request": round(len(queries) / requests, 2)},
+    )
+
+
+def run(repeat: int = 5, **_: Any) -> List[BenchResult]:
+    requests = max(50, repeat * 20)
+    results: List[BenchResult] = []
+    try:
+        with transaction.atomic():
+            user = User.objects.create_user(username="__bench_auth__", password="bench-password")
+            token = str(VersionedTokenObtainPairSerializer.get_token(user).access_token)
+            for auth_class in (JWTAuthentication, CachedJWTAuthentication):
+                results.append(_measure(auth_class, token, requests))
+            raise _Rollback
+    except _Rollback:
+        pass
+    return results
@@ -0,0 +1,131 @@
+"""Seeded generator of realistic synthetic resumes for benchmarks."""
+
+from __future__ import annotations
+
+import random
+from typing import List
+
+from parser.services.taxonomy import get_taxonomy
+
+# Roughly one printed page of resume text.
+PAGE_CHARS = 3000
+
+FIRST_NAMES = ["Jane", "Omar", "Aung", "Priya", "Lucas", "Mei", "Tomasz", "Amara", "Diego", "Sofia"]
+LAST_NAMES = ["Doe", "Haddad", "Kyaw", "Sharma", "Silva", "Chen", "Nowak", "Okafor", "Ruiz", "Rossi"]
+COMPANIES = [
+    "Acme Corp", "Globex Inc", "Initech LLC", "Umbrella Technologies", "Stark Solutions",
+    "Wayne Systems", "RocketOps", "Northwind Ltd", "Hooli", "Vandelay Industries",
+]
+TITLES = [
+    "Software Engineer", "Senior Backend Engineer", "Data Analyst", "Frontend Developer",
+    "DevOps Engineer", "Engineering Manager", "QA Engineer", "Full Stack Developer",
+]
+LOCATIONS = ["Remote", "Yangon", "Berlin", "New York, NY", "Singapore", "London"]
+SCHOOLS = ["ABC University", "Northern Institute of Technology", "City College", "State University"]
+DEGREES = ["BSc", "Bachelor of Science", "MSc", "Master of Science", "MBA", "PhD", "Diploma"]
+FIELDS = ["Computer Science", "Information Systems", "Mathematics", "Electrical Engineering"]
+VERBS = ["Built", "Reduced", "Led", "Designed", "Migrated", "Automated", "Improved", "Scaled", "Shipped"]
+OBJECTS = [
+    "the billing pipeline", "API latency", "a team of 6 engineers", "the CI/CD workflow",
+    "search relevance", "onboarding flow", "data ingestion jobs", "the design system",
+]
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+BULLETS = ["-", "•", "*", "▪"]
+EXTRA_SECTIONS = {
+    "Certifications": ["AWS Certified Developer", "Certified Scrum Master", "CKA Kubernetes Administrator"],
+    "Awards": ["Employee of the Year 2021", "Hackathon winner, 1st place"],
+    "Interests": ["Open source", "Chess", "Running"],
+}
+
+
+def generate_resume(seed: int, pages: int = 1, skill_density: float | None = None) -> str:
+    """Return resume text of roughly ``pages`` pages; the same seed gives the same text."""
+    rng = random.Random(seed)
+    density = skill_density if skill_density is not None else rng.uniform(0.05, 0.4)
+    all_skills = [skill for _, skill, _ in get_taxonomy().skills()]
+
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    lines: List[str] = [
+        first,
+        last,
+        f"{first.lower()}.{last.lower()}@example.com | +1 ({rng.randint(200, 999)}) {rng.randint(100, 999)}-{rng.randint(1000, 9999)}",
+        f"https://github.com/{first.lower()}{last.lower()} | https://www.linkedin.com/in/{first.lower()}-{last.lower()}",
+        "",
+        rng.choice(["SUMMARY", "Professional Summary", "P R O F I L E"]),
+        f"{rng.choice(TITLES)} with {rng.randint(2, 15)} years of experience building products.",
+        "",
+        rng.choice(["Skills", "Technical Skills", "Core Skills:"]),
+    ]
+    picked = rng.sample(all_skills, max(3, int(len(all_skills) * density)))
+    for start in range(0, len(picked), 6):
+        lines.append(", ".join(picked[start : start + 6]))
+    lines.append("")
+
+    target = pages * PAGE_CHARS
+    sections = [_experience, _projects, _education]
+    year = 2024
+    while sum(len(line) + 1 for line in lines) < target:
+        for build in sections:
+            header, body, year = build(rng, all_skills, year)
+            lines.extend([header, *body, ""])
+        if rng.random() < 0.5:
+            title, items = rng.choice(list(EXTRA_SECTIONS.items()))
+            lines.extend([title, *items, ""])
+        year = max(year, 1975)
+
+    return "\n".join(lines)
+
+
+def generate_corpus(seed: int, pages: List[int], per_size: int = 1) -> List[str]:
+    return [generate_resume(seed + offset, size) for size in pages for offset in range(per_size)]
+
+
+def _date(rng: random.Random, year: int) -> str:
+    if rng.random() < 0.6:
+        return f"{rng.choice(MONTHS)} {year}"
+    return str(year)
+
+
+def _bullet(rng: random.Random, all_skills: List[str]) -> str:
+    text = f"{rng.choice(VERBS)} {rng.choice(OBJECTS)}"
+    if rng.random() < 0.6:
+        text += f" by {rng.randint(5, 90)}%"
+    if rng.random() < 0.4:
+        text += f" using {rng.choice(all_skills)}"
+    return f"{rng.choice(BULLETS)} {text}"
+
+
+def _experience(rng: random.Random, all_skills: List[str], year: int):
+    body: List[str] = []
+    for _ in range(rng.randint(1, 3)):
+        start = year - rng.randint(1, 4)
+        end = "Present" if year == 2024 and rng.random() < 0.5 else _date(rng, year)
+        dates = f"{_date(rng, start)} - {end}"
+        title, company, location = rng.choice(TITLES), rng.choice(COMPANIES), rng.choice(LOCATIONS)
+        if rng.random() < 0.5:
+            body.append(f"{title} | {company} | {dates} | {location}")
+        else:
+            body.extend([f"{title}, {company}", dates])
+        body.extend(_bullet(rng, all_skills) for _ in range(rng.randint(2, 6)))
+        year = start
+    return rng.choice(["Experience", "Work Experience", "EMPLOYMENT"]), body, year
+
+
+def _projects(rng: random.Random, all_skills: List[str], year: int):
+    body: List[str] = []
+    for index in range(rng.randint(1, 3)):
+        name = f"{rng.choice(['Atlas', 'Beacon', 'Comet', 'Drift', 'Ember'])} {rng.choice(['API', 'App', 'Engine'])}"
+        body.append(f"{name} https://github.com/example/{name.lower().replace(' ', '-')}-{index}")
+        body.append(f"Tech: {', '.join(rng.sample(all_skills, 3))}")
+        body.extend(_bullet(rng, all_skills) for _ in range(rng.randint(1, 3)))
+        body.append("")
+    return "Projects", body, year
+
+
+def _education(rng: random.Random, all_skills: List[str], year: int):
+    start = year - 4
+    body = [
+        rng.choice(SCHOOLS),
+        f"{rng.choice(DEGREES)} in {rng.choice(FIELDS)}, {start} - {year}",
+    ]
+    return "Education", body, start
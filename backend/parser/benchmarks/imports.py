@@ -0,0 +1,110 @@
+"""Cold-start import cost, read from ``python -X importtime`` in fresh interpreters.
+
+Targets:
+
+- ``setup``: ``django.setup()``, paid by every management command and worker.
+- ``urls``: setup plus the URLconf, what a worker loads for its first request.
+- ``warmup``: ``parser.warmup.warm_up()``, everything the parser loads on first use.
+
+Each result is the summed cumulative time of the top-level imports, best of
+``repeat`` runs; ``extra`` has the module count and the slowest top-level
+imports. ``check`` enforces ``IMPORT_BUDGET_SECONDS`` and that the modules in
+``DEFERRED_MODULES`` are not imported before their first use. The budgets are
+wall-clock times and only hold on a quiet machine, so the unit tests check
+``DEFERRED_MODULES`` with :func:`loaded_modules` and leave timing to
+``manage.py benchmark imports``.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from typing import Any, Dict, List, Sequence, Tuple
+
+from django.conf import settings
+
+from parser.benchmarks import BenchResult
+
+SETUP = "import django; django.setup()"
+TARGETS = {
+    "setup": SETUP,
+    "urls": f"{SETUP}; import cpb_api.urls",
+    "warmup": f"{SETUP}; from parser.warmup import warm_up; warm_up()",
+}
+IMPORT_BUDGET_SECONDS = {"setup": 0.5, "urls": 1.0}
+# Modules a target must not import; they are loaded on first use instead.
+DEFERRED_MODULES = {
+    "setup": ("numpy", "pdfplumber", "docx"),
+    "urls": ("pdfplumber", "docx"),
+}
+SLOWEST = 5
+
+
+def _run(code: str, *args: str) -> str:
+    env = {**os.environ, "DJANGO_SETTINGS_MODULE": os.environ.get("DJANGO_SETTINGS_MODULE", "cpb_api.settings")}
+    completed = subprocess.run(
+        [sys.executable, *args, "-c", code],
+        cwd=settings.BASE_DIR, env=env, capture_output=True, text=True, check=True,
+    )
+    return completed.stdout + completed.stderr
+
+
+def loaded_modules(code: str) -> set[str]:
+    """Names in ``sys.modules`` after running ``code`` in a fresh interpreter."""
+    return set(_run(f"{code}; import sys; print(*sys.modules, sep=chr(10))").split())
+
+
+def import_times(code: str) -> Tuple[Dict[str, float], List[Tuple[str, float]]]:
+    """Cumulative seconds per imported module and for each top-level import, in import order."""
+    modules: Dict[str, float] = {}
+    top_level: List[Tuple[str, float]] = []
+    for line in _run(code, "-X", "importtime").splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():  # the header line
+            continue
+        seconds = int(cumulative) / 1_000_000
+        modules[name.strip()] = seconds
+        if not name[1:].startswith(" "):
+            top_level.append((name.strip(), seconds))
+    return modules, top_level
+
+
+def run(repeat: int = 5, targets: Sequence[str] = tuple(TARGETS), **_: Any) -> List[BenchResult]:
+    results: List[BenchResult] = []
+    for target in targets:
+        best = None
+        for _ in range(max(1, min(repeat, 3))):
+            modules, top_level = import_times(TARGETS[target])
+            total = sum(seconds for _, seconds in top_level)
+            if best is None or total < best[0]:
+                best = (total, modules, top_level)
+        total, modules, top_level = best
+        slowest = sorted(top_level, key=lambda item: item[1], reverse=True)[:SLOWEST]
+        results.append(BenchResult(
+            name=f"import/{target}",
+            seconds=total,
+            extra={
+                "modules": len(modules),
+                "slowest": ",".join(f"{name}:{seconds * 1000:.0f}ms" for name, seconds in slowest),
+                "deferred_loaded": ",".join(
+                    name for name in DEFERRED_MODULES.get(target, ()) if name in modules
+                ) or "-",
+            },
+        ))
+    return results
+
+
+def check(results: List[BenchResult]) -> List[str]:
+    """Targets over their import budget or importing a module that should be deferred."""
+    failures = []
+    for result in results:
+        target = result.name.split("/", 1)[1]
+        budget = IMPORT_BUDGET_SECONDS.get(target)
+        if budget is not None and result.seconds > budget:
+            failures.append(f"{result.name}: {result.seconds * 1000:.1f}ms > {budget * 1000:.1f}ms budget")
+        if result.extra["deferred_loaded"] != "-":
+            failures.append(f"{result.name}: imports {result.extra['deferred_loaded']} before first use")
+    return failures
@@ -0,0 +1,80 @@
+"""Parse time per resume with the per-line extractor cache off, cold and warm.
+
+The corpus is parsed with the section cache disabled, so only the line cache
+is measured: ``off`` with ``PARSER_LINE_CACHE_BYTES = 0``, ``cold`` from an
+empty cache (hits come only from lines resumes share), ``warm`` a second
+pass over the same resumes. ``extra`` has the hit rate per kind and the
+cache size. ``check`` fails when a warm pass is not faster than an uncached
+one or the cache outgrows its byte budget.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List
+
+from django.test import override_settings
+
+from parser.benchmarks import BenchResult, best_of
+from parser.benchmarks.corpus import generate_corpus
+from parser.services.build_output import ResumeParser
+from parser.services.line_cache import line_cache
+from parser.services.preprocess import preprocess
+
+RESUMES = 40
+CACHE_BYTES = 4 * 1024 * 1024
+
+
+def _hit_rates(func: Callable[[], Any]) -> Dict[str, Any]:
+    """Overall and per-kind hit rate of the line cache during one call of ``func``."""
+    before = line_cache.snapshot()
+    func()
+    after = line_cache.snapshot()
+    rates: Dict[str, Any] = {}
+    for kind, stats in {"": after, **{f".{kind}": stats for kind, stats in after["kinds"].items()}}.items():
+        previous = before if not kind else before["kinds"].get(kind[1:], {"hits": 0, "misses": 0})
+        hits, misses = stats["hits"] - previous["hits"], stats["misses"] - previous["misses"]
+        rates[f"hit_rate{kind}"] = round(hits / (hits + misses), 4) if hits + misses else 0.0
+    return rates
+
+
+def run(seed: int = 1, repeat: int = 5, resumes: int = RESUMES, **_: Any) -> List[BenchResult]:
+    documents = [preprocess(text) for text in generate_corpus(seed, [1, 5], per_size=resumes // 2)]
+    parser = ResumeParser(section_cache=None)
+
+    def parse_all() -> None:
+        for lines in documents:
+            parser.parse(lines)
+
+    def cold() -> None:
+        line_cache.clear()
+        parse_all()
+
+    results: List[BenchResult] = []
+    with override_settings(PARSER_LINE_CACHE_BYTES=0):
+        results.append(BenchResult(name="parse/off", seconds=best_of(repeat, parse_all) / len(documents)))
+    with override_settings(PARSER_LINE_CACHE_BYTES=CACHE_BYTES):
+        cold_seconds = best_of(repeat, cold) / len(documents)
+        line_cache.clear()
+        results.append(BenchResult(name="parse/cold", seconds=cold_seconds, extra=_hit_rates(parse_all)))
+        warm_seconds = best_of(repeat, parse_all) / len(documents)
+        snapshot = line_cache.snapshot()
+        results.append(BenchResult(
+            name="parse/warm",
+            seconds=warm_seconds,
+            extra={**_hit_rates(parse_all), "entries": snapshot["entries"], "kib": round(snapshot["bytes"] / 1024, 1)},
+        ))
+        line_cache.clear()
+    return results
+
+
+def check(results: List[BenchResult]) -> List[str]:
+    """A warm cache that does not beat no cache, or a cache over its byte budget."""
+    failures = []
+    by_name = {result.name: result for result in results}
+    off, warm = by_name["parse/off"], by_name["parse/warm"]
+    if warm.seconds >= off.seconds:
+        failures.append(f"parse/warm: {warm.seconds * 1000:.3f}ms >= {off.seconds * 1000:.3f}ms without the cache")
+    for result in results:
+        if result.extra.get("kib", 0) * 1024 > CACHE_BYTES:
+            failures.append(f"{result.name}: cache holds {result.extra['kib']}KiB > {CACHE_BYTES // 1024}KiB")
+    return failures
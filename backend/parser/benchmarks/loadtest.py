@@ -0,0 +1,265 @@
+"""End-to-end HTTP load test against a local (or given) API server.
+
+The harness starts ``manage.py runserver`` on a scratch SQLite database,
+registers users, logs them in for JWTs and drives a weighted, seeded mix of
+parse/list/detail/edit/export calls at a fixed concurrency.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from parser.benchmarks.corpus import generate_resume
+
+MANAGE_PY = Path(__file__).resolve().parents[2] / "manage.py"
+DEFAULT_MIX = {"parse": 1, "list": 3, "detail": 8, "edit": 2, "export": 4}
+
+
+@dataclass(slots=True)
+class EndpointStats:
+    latencies_ms: List[float] = field(default_factory=list)
+    errors: int = 0
+
+    def summary(self, wall_seconds: float) -> Dict[str, Any]:
+        ordered = sorted(self.latencies_ms)
+        count = len(ordered)
+        return {
+            "requests": count,
+            "p50_ms": round(_percentile(ordered, 50), 1),
+            "p95_ms": round(_percentile(ordered, 95), 1),
+            "p99_ms": round(_percentile(ordered, 99), 1),
+            "error_rate": round(self.errors / count, 4) if count else 0.0,
+            "throughput_rps": round(count / wall_seconds, 1) if wall_seconds else 0.0,
+        }
+
+
+def _percentile(ordered: List[float], pct: float) -> float:
+    if not ordered:
+        return 0.0
+    # Nearest-rank percentile.
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def parse_mix(spec: str) -> Dict[str, int]:
+    mix: Dict[str, int] = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in DEFAULT_MIX:
+            raise ValueError(f"Unknown endpoint in mix: {name}")
+        mix[name] = int(weight or 1)
+    return mix
+
+
+def resume_docx(seed: int, pages: int) -> bytes:
+    return text_docx(generate_resume(seed, pages))
+
+
+def text_docx(text: str) -> bytes:
+    from docx import Document
+
+    document = Document()
+    for line in text.split("\n"):
+        document.add_paragraph(line)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+class LocalServer:
+    """Runs migrate + runserver against a throwaway SQLite file."""
+
+    def __init__(self, port: int | None = None):
+        self.port = port or _free_port()
+        self._tmp = tempfile.TemporaryDirectory(prefix="cpb-loadtest-")
+        self._process: subprocess.Popen | None = None
+        self.env = {**os.environ, "CPB_SQLITE_PATH": os.path.join(self._tmp.name, "loadtest.sqlite3")}
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def __enter__(self) -> "LocalServer":
+        subprocess.run(
+            [sys.executable, str(MANAGE_PY), "migrate", "--noinput", "-v", "0"],
+            env=self.env,
+            check=True,
+        )
+        self._process = subprocess.Popen(
+            [sys.executable, str(MANAGE_PY), "runserver", f"127.0.0.1:{self.port}", "--noreload"],
+            env=self.env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            try:
+                with socket.create_connection(("127.0.0.1", self.port), timeout=0.5):
+                    return self
+            except OSError:
+                time.sleep(0.2)
+        self.__exit__(None, None, None)
+        raise RuntimeError("Local server did not start within 30s.")
+
+    def __exit__(self, *exc_info) -> None:
+        if self._process is not None:
+            self._process.terminate()
+            self._process.wait(timeout=10)
+        self._tmp.cleanup()
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class ApiClient:
+    def __init__(self, base_url: str, token: str | None = None):
+        self.base_url = base_url.rstrip("/")
+        self.token = token
+
+    def request(self, method: str, path: str, body: bytes | None = None,
+                content_type: str = "application/json") -> Tuple[int, Any]:
+        headers = {"Accept": "application/json"}
+        if body is not None:
+            headers["Content-Type"] = content_type
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        req = urllib.request.Request(self.base_url + path, data=body, method=method, headers=headers)
+        try:
+            with urllib.request.urlopen(req, timeout=60) as response:
+                return response.status, _decode(response.read())
+        except urllib.error.HTTPError as exc:
+            return exc.code, _decode(exc.read())
+
+    def json(self, method: str, path: str, payload: Any) -> Tuple[int, Any]:
+        return self.request(method, path, json.dumps(payload).encode("utf-8"))
+
+    def upload(self, path: str, filename: str, content: bytes) -> Tuple[int, Any]:
+        boundary = uuid.uuid4().hex
+        body = (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+            "Content-Type: application/vnd.openxmlformats-officedocument.wordprocessingml.document\r\n\r\n"
+        ).encode("utf-8") + content + f"\r\n--{boundary}--\r\n".encode("utf-8")
+        return self.request("POST", path, body, f"multipart/form-data; boundary={boundary}")
+
+
+def _decode(raw: bytes) -> Any:
+    try:
+        return json.loads(raw) if raw else None
+    except ValueError:
+        return None
+
+
+@dataclass(slots=True)
+class _UserSession:
+    client: ApiClient
+    resume_ids: List[int]
+    parsed_data: Dict[str, Any]
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+def _login(base_url: str, index: int, run_id: str, upload: bytes) -> _UserSession:
+    anon = ApiClient(base_url)
+    credentials = {"username": f"load-{run_id}-{index}", "password": "load-test-password"}
+    status, _ = anon.json("POST", "/api/register/", {**credentials, "email": ""})
+    if status != 201:
+        raise RuntimeError(f"Registration failed with HTTP {status}.")
+    status, tokens = anon.json("POST", "/api/auth/login/", credentials)
+    if status != 200:
+        raise RuntimeError(f"Login failed with HTTP {status}.")
+
+    client = ApiClient(base_url, tokens["access"])
+    status, created = client.upload("/api/parse-resume/", "seed.docx", upload)
+    if status != 201:
+        raise RuntimeError(f"Seed upload failed with HTTP {status}.")
+    parsed = {key: created.get(key) for key in ("contact", "skills", "education", "experience", "projects")}
+    return _UserSession(client=client, resume_ids=[created["resume_id"]], parsed_data=parsed)
+
+
+def _call(session: _UserSession, endpoint: str, rng: random.Random, upload: bytes) -> int:
+    client = session.client
+    with session.lock:
+        resume_id = rng.choice(session.resume_ids)
+    if endpoint == "parse":
+        status, created = client.upload("/api/parse-resume/", "resume.docx", upload)
+        if status == 201:
+            with session.lock:
+                session.resume_ids.append(created["resume_id"])
+        return status
+    if endpoint == "list":
+        return client.request("GET", "/api/resumes/")[0]
+    if endpoint == "detail":
+        return client.request("GET", f"/api/resumes/{resume_id}/")[0]
+    if endpoint == "edit":
+        return client.json("PATCH", f"/api/resumes/{resume_id}/edit/", {"parsed_data": session.parsed_data})[0]
+    return client.request("GET", f"/api/resumes/{resume_id}/exports/")[0]
+
+
+def run_load_test(
+    base_url: str,
+    users: int = 4,
+    concurrency: int = 8,
+    requests: int = 400,
+    mix: Dict[str, int] | None = None,
+    seed: int = 1,
+    pages: int = 2,
+) -> Dict[str, Any]:
+    mix = mix or DEFAULT_MIX
+    rng = random.Random(seed)
+    upload = resume_docx(seed, pages)
+    run_id = uuid.uuid4().hex[:8]
+    sessions = [_login(base_url, index, run_id, upload) for index in range(users)]
+
+    endpoints = sorted(mix)
+    plan = rng.choices(endpoints, weights=[mix[name] for name in endpoints], k=requests)
+    stats = {name: EndpointStats() for name in endpoints}
+    stats_lock = threading.Lock()
+
+    def worker(index: int) -> None:
+        worker_rng = random.Random(seed * 1000 + index)
+        for position in range(index, len(plan), concurrency):
+            endpoint = plan[position]
+            session = sessions[position % len(sessions)]
+            started = time.perf_counter()
+            try:
+                ok = 200 <= _call(session, endpoint, worker_rng, upload) < 300
+            except OSError:
+                ok = False
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            with stats_lock:
+                stats[endpoint].latencies_ms.append(elapsed_ms)
+                if not ok:
+                    stats[endpoint].errors += 1
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(worker, range(concurrency)))
+    wall_seconds = time.perf_counter() - started
+
+    return {
+        "config": {"users": users, "concurrency": concurrency, "requests": requests,
+                   "mix": {name: mix[name] for name in endpoints}, "seed": seed, "pages": pages},
+        "wall_seconds": round(wall_seconds, 2),
+        "endpoints": {name: stats[name].summary(wall_seconds) for name in endpoints},
+    }
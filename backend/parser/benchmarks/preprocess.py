@@ -0,0 +1,106 @@
+"""``preprocess`` throughput on ~1 MB inputs, against the multi-pass original.
+
+``legacy_preprocess`` is the implementation the single-pass normalizer
+replaced. It is kept verbatim as the golden reference: ``parser.tests``
+checks that both give identical lines on the synthetic corpus and on
+whitespace/bullet edge cases.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, List, Sequence
+
+from parser.benchmarks import BenchResult, best_of, peak_kib
+from parser.benchmarks.corpus import PAGE_CHARS, generate_resume
+from parser.services.preprocess import BROKEN_HEADER_RE, BULLETS, NAME_TOKEN_RE, preprocess
+from parser.services.taxonomy import read_sources
+
+# ~1 MB of resume text per input.
+INPUT_PAGES = 1_000_000 // PAGE_CHARS
+# The per-process header set the original read from section_headers.json.
+HEADER_VARIANTS = {variant.lower() for values in read_sources()[1].values() for variant in values}
+
+
+def _looks_like_header(line: str) -> bool:
+    normalized = line.strip().lower().rstrip(":")
+    return normalized in HEADER_VARIANTS
+
+
+def _can_merge_name_lines(cur: str, nxt: str) -> bool:
+    if _looks_like_header(cur) or _looks_like_header(nxt):
+        return False
+    cur_tokens = cur.split()
+    nxt_tokens = nxt.split()
+    if len(cur_tokens) != 1 or len(nxt_tokens) != 1:
+        return False
+    return bool(NAME_TOKEN_RE.match(cur_tokens[0]) and NAME_TOKEN_RE.match(nxt_tokens[0]))
+
+
+def legacy_preprocess(raw_text: str) -> List[str]:
+    if not raw_text:
+        return []
+
+    text = raw_text.replace('\r','\n')
+    for b in BULLETS:
+        text = text.replace(b, '-')
+
+    text=re.sub(r"[ \t]+", " ", text)
+    text=re.sub(r"\n{3,}", "\n\n", text)
+
+    lines = [ln.strip() for ln in text.split("\n")]
+    lines = [ln for ln in lines if ln]
+
+    def _unsplit(line: str) -> str:
+        if BROKEN_HEADER_RE.match(line):
+            return line.replace(" ", "")
+        return line
+
+    lines = [_unsplit(ln) for ln in lines]
+
+    joined: list[str] = []
+    i=0
+    while i < len(lines):
+        cur = lines[i]
+        nxt = lines[i+1] if i+1 < len(lines) else ""
+        if cur and nxt and _can_merge_name_lines(cur, nxt):
+            joined.append(cur + " " +nxt)
+            i += 2
+        else:
+            joined.append(cur)
+            i += 1
+    return joined
+
+
+def _inputs(seed: int) -> List[tuple[str, str]]:
+    resume = generate_resume(seed, INPUT_PAGES)
+    # Extraction output from table-heavy PDFs: CRLF, tabs, wide space runs, bullets.
+    table = "\r\n".join(
+        f"•\t{row}  \t  {row * 7 % 1000}\t\t·  cell ▪ value   {row}" for row in range(len(resume) // 48)
+    )
+    return [("resume", resume), ("table", table)]
+
+
+def run(seed: int = 1, repeat: int = 5, **_: Any) -> List[BenchResult]:
+    results: List[BenchResult] = []
+    for name, raw_text in _inputs(seed):
+        megabytes = len(raw_text.encode("utf-8")) / 1_000_000
+        for label, func in (("preprocess", preprocess), ("legacy_preprocess", legacy_preprocess)):
+            seconds = best_of(repeat, lambda: func(raw_text))
+            results.append(BenchResult(
+                name=f"{label}/{name}@1MB",
+                seconds=seconds,
+                peak_kib=peak_kib(lambda: func(raw_text)),
+                throughput_mb_s=megabytes / seconds if seconds else None,
+            ))
+    return results
+
+
+def check(results: Sequence[BenchResult]) -> List[str]:
+    """Inputs on which the single-pass normalizer is slower than the original."""
+    seconds = {result.name: result.seconds for result in results}
+    return [
+        f"{name}: {seconds[name] * 1000:.1f}ms >= legacy {seconds['legacy_' + name] * 1000:.1f}ms"
+        for name in seconds
+        if name.startswith("preprocess/") and seconds[name] >= seconds["legacy_" + name]
+    ]
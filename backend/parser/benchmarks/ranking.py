@@ -0,0 +1,66 @@
+"""Job-description ranking: vectorized index vs a per-resume Python loop.
+
+Resumes are in-memory ``Resume`` instances built from a pool of synthetic
+documents, so the suite measures scoring only (no database reads).
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Sequence
+
+from parser.benchmarks import BenchResult, best_of, peak_kib
+from parser.benchmarks.corpus import generate_resume
+from parser.models import Resume
+from parser.services.build_output import ResumeParser
+from parser.services.extract_skills import extract_skills
+from parser.services.preprocess import preprocess
+from parser.services.ranking import ResumeRankIndex, term_counts
+
+POOL = 200
+ROW_COUNTS = (1_000, 10_000)
+JOB_DESCRIPTION = (
+    "Senior Backend Engineer. We are looking for a Python developer with Django, PostgreSQL, "
+    "Docker and AWS experience to scale our billing pipeline and improve API latency."
+)
+
+
+def _naive_rank(documents: Sequence[Dict[str, Any]], top_k: int = 10) -> List[int]:
+    """What ranking costs without the index: compare each stored resume in turn."""
+    wanted = {skill for items in extract_skills(preprocess(JOB_DESCRIPTION)).categories.values() for skill in items}
+    query_terms = term_counts(JOB_DESCRIPTION)
+    scores = []
+    for document in documents:
+        have = {skill for items in document["parsed_data"]["skills"]["categories"].values() for skill in items}
+        terms = term_counts(document["raw_text"])
+        overlap = sum(min(count, terms.get(bucket, 0)) for bucket, count in query_terms.items())
+        scores.append((len(wanted & have) / max(1, len(wanted)) + overlap / 1000, document["pk"]))
+    return [pk for _, pk in sorted(scores, reverse=True)[:top_k]]
+
+
+def run(seed: int = 1, repeat: int = 5, **_: Any) -> List[BenchResult]:
+    parser = ResumeParser()
+    pool = []
+    for offset in range(POOL):
+        raw_text = generate_resume(seed + offset, 1)
+        pool.append((raw_text, parser.parse(preprocess(raw_text))))
+
+    results: List[BenchResult] = []
+    for rows in ROW_COUNTS:
+        documents = [
+            {"pk": pk, "raw_text": pool[pk % POOL][0], "parsed_data": pool[pk % POOL][1]} for pk in range(1, rows + 1)
+        ]
+        index = ResumeRankIndex(user_id=0)
+        for document in documents:
+            index.upsert(Resume(file_name=f"{document['pk']}.pdf", **document))
+        index.rank(JOB_DESCRIPTION)
+
+        results.append(BenchResult(
+            name=f"rank@{rows}rows",
+            seconds=best_of(repeat, lambda: index.rank(JOB_DESCRIPTION)),
+            peak_kib=peak_kib(lambda: index.rank(JOB_DESCRIPTION)),
+        ))
+        results.append(BenchResult(
+            name=f"naive_rank@{rows}rows",
+            seconds=best_of(1, lambda: _naive_rank(documents)),
+        ))
+    return results
@@ -0,0 +1,66 @@
+"""Parse-result records vs their JSON dict shape: memory per resume and batch cost.
+
+Profiles are parsed once from the synthetic corpus. Retained memory counts the
+containers of one deep copy per resume (strings are shared by both shapes);
+the batch timings score and export every resume from each shape, as the
+pipeline does after a parse (records) and as stored data used to be read
+(dicts).
+"""
+
+from __future__ import annotations
+
+import copy
+import tracemalloc
+from typing import Any, Callable, List
+
+from parser.benchmarks import BenchResult, best_of
+from parser.benchmarks.corpus import generate_resume
+from parser.services.build_output import ResumeParser
+from parser.services.preprocess import preprocess
+from parser.services.profile_export import ResumeProfileExporter
+from parser.services.resume_health import score_resume
+
+BATCH = 200
+
+
+def _retained_kib(build: Callable[[], Any]) -> float:
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    kept = build()
+    after, _ = tracemalloc.get_traced_memory()
+    del kept
+    if not already_tracing:
+        tracemalloc.stop()
+    return (after - before) / 1024
+
+
+def run(seed: int = 1, repeat: int = 5, **_: Any) -> List[BenchResult]:
+    parser = ResumeParser(section_cache=None)
+    records = [parser.parse_with_report(preprocess(generate_resume(seed + offset, 1))).record for offset in range(BATCH)]
+    dicts = [record.to_dict() for record in records]
+    exporter = ResumeProfileExporter()
+
+    results: List[BenchResult] = []
+    for label, profiles in (("records", records), ("dicts", dicts)):
+        retained = _retained_kib(lambda: copy.deepcopy(profiles))
+        results.append(BenchResult(
+            name=f"retained/{label}@{BATCH}",
+            seconds=0.0,
+            peak_kib=retained,
+            extra={"kib_per_resume": round(retained / BATCH, 2)},
+        ))
+
+        def batch() -> None:
+            for profile in profiles:
+                score_resume(profile)
+                exporter.export(profile)
+
+        seconds = best_of(repeat, batch)
+        results.append(BenchResult(
+            name=f"score_export/{label}@{BATCH}",
+            seconds=seconds,
+            extra={"resumes_per_s": round(BATCH / seconds) if seconds else None},
+        ))
+    return results
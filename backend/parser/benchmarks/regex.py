@@ -0,0 +1,95 @@
+"""Contact/date scanners on adversarial input, against the backtracking regexes.
+
+Each input family is generated at several sizes; a linear scanner keeps its
+time per KiB flat as the input grows, which ``check`` enforces. The reference
+regexes are only timed at the smallest size, since some are quadratic.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Any, Callable, Dict, List, Tuple
+
+from parser.benchmarks import BenchResult, best_of
+from parser.services.scanners import (
+    DATE_RANGE_PATTERN,
+    DATE_RANGE_SCANNER,
+    EMAIL_PATTERN,
+    EMAIL_SCANNER,
+    PHONE_PATTERN,
+    PHONE_SCANNER,
+)
+
+SIZES_KIB = (4, 16, 64)
+# Allowed growth of time per KiB between the smallest and the largest size.
+MAX_PER_KIB_GROWTH = 3.0
+
+
+def _repeat(unit: str) -> Callable[[random.Random, int], str]:
+    return lambda rng, size: (unit * (size // len(unit) + 1))[:size]
+
+
+def _digit_table(rng: random.Random, size: int) -> str:
+    """Table-like rows of short numbers, dots and spaces that never end in a digit."""
+    cells = []
+    while sum(map(len, cells)) < size:
+        cells.append(f"{rng.randint(0, 99)}.{rng.randint(0, 9)} " + " " * rng.randint(0, 6) + "(. -")
+    return "".join(cells)[:size]
+
+
+def _random_dates(rng: random.Random, size: int) -> str:
+    pieces = ["jan", "Sept", "2019", " ", "-", "–", "present", "x", "\t"]
+    return "".join(rng.choice(pieces) for _ in range(size // 3))[:size]
+
+
+INPUTS: Dict[str, List[Tuple[str, Callable[[random.Random, int], str]]]] = {
+    "phone": [("digit_table", _digit_table), ("digit_spaces", _repeat("1" + " " * 63 + "x"))],
+    "email": [("local_run", _repeat("a.b-c_d%e+")), ("dangling_at", _repeat("a@b.c1@"))],
+    "date_range": [("month_run", _repeat("jan")), ("years_no_end", _repeat("2020 - x ")),
+                   ("random", _random_dates)],
+}
+SCANNERS = {
+    "phone": (PHONE_SCANNER, PHONE_PATTERN),
+    "email": (EMAIL_SCANNER, EMAIL_PATTERN),
+    "date_range": (DATE_RANGE_SCANNER, DATE_RANGE_PATTERN),
+}
+
+
+def run(seed: int = 1, repeat: int = 5, **_: Any) -> List[BenchResult]:
+    results: List[BenchResult] = []
+    for pattern, inputs in INPUTS.items():
+        scanner, reference = SCANNERS[pattern]
+        for input_name, generate in inputs:
+            for size_kib in SIZES_KIB:
+                text = generate(random.Random(seed), size_kib * 1024)
+                seconds = best_of(repeat, lambda: scanner.sub("", text))
+                results.append(BenchResult(
+                    name=f"{pattern}/{input_name}@{size_kib}KiB",
+                    seconds=seconds,
+                    throughput_mb_s=len(text.encode("utf-8")) / 1_000_000 / seconds if seconds else None,
+                    extra={"us_per_kib": round(seconds * 1_000_000 / size_kib, 2)},
+                ))
+            text = generate(random.Random(seed), SIZES_KIB[0] * 1024)
+            results.append(BenchResult(
+                name=f"{pattern}/{input_name}@{SIZES_KIB[0]}KiB/re",
+                seconds=best_of(1, lambda: reference.sub("", text)),
+            ))
+    return results
+
+
+def check(results: List[BenchResult]) -> List[str]:
+    """Inputs whose time per KiB grew more than ``MAX_PER_KIB_GROWTH`` across sizes."""
+    per_kib: Dict[str, Dict[int, float]] = {}
+    for result in results:
+        if result.name.endswith("/re"):
+            continue
+        family, size = result.name.rsplit("@", 1)
+        per_kib.setdefault(family, {})[int(size.removesuffix("KiB"))] = result.extra["us_per_kib"]
+
+    failures = []
+    for family, by_size in per_kib.items():
+        smallest, largest = by_size[min(by_size)], by_size[max(by_size)]
+        if smallest and largest / smallest > MAX_PER_KIB_GROWTH:
+            failures.append(f"{family}: {largest:.2f}us/KiB at {max(by_size)}KiB vs "
+                            f"{smallest:.2f}us/KiB at {min(by_size)}KiB")
+    return failures
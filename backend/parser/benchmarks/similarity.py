@@ -0,0 +1,75 @@
+"""SimHash signature cost per document size and LSH lookup latency at table scale.
+
+Lookup rows are bulk-inserted inside a rolled-back transaction, spread over
+many users with a few "heavy" users holding most of the table.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Any, List, Sequence
+
+from django.contrib.auth.models import User
+from django.db import transaction
+
+from parser.benchmarks import BenchResult, best_of, peak_kib
+from parser.benchmarks.corpus import generate_resume
+from parser.models import Resume
+from parser.services.preprocess import preprocess
+from parser.services.similarity import find_near_duplicate, signature_bands, simhash
+
+INSERT_BATCH = 5_000
+USERS = 100
+
+
+class _Rollback(Exception):
+    pass
+
+
+def _random_signature(rng: random.Random) -> int:
+    return rng.getrandbits(64) - (1 << 63)
+
+
+def _fill(users: Sequence[User], rows: int, rng: random.Random) -> None:
+    pending: List[Resume] = []
+    for index in range(rows):
+        # Half of all rows belong to the first user, the worst case for a per-user probe.
+        user = users[0] if index % 2 else users[index % len(users)]
+        signature = _random_signature(rng)
+        pending.append(Resume(
+            user=user, file_name="bench.docx", raw_text="", parsed_data={}, resume_health={},
+            simhash=signature, **signature_bands(signature),
+        ))
+        if len(pending) >= INSERT_BATCH:
+            Resume.objects.bulk_create(pending)
+            pending.clear()
+    Resume.objects.bulk_create(pending)
+
+
+def run(seed: int = 1, pages: Sequence[int] = (1, 5, 50), repeat: int = 5, rows: int = 100_000,
+        **_: Any) -> List[BenchResult]:
+    results: List[BenchResult] = []
+    for page_count in pages:
+        lines = preprocess(generate_resume(seed, page_count))
+        results.append(BenchResult(
+            name=f"simhash@{page_count}p",
+            seconds=best_of(repeat, lambda: simhash(lines)),
+            peak_kib=peak_kib(lambda: simhash(lines)),
+        ))
+
+    rng = random.Random(seed)
+    try:
+        with transaction.atomic():
+            users = [User.objects.create(username=f"__bench_similarity_{index}__") for index in range(USERS)]
+            _fill(users, rows, rng)
+            probes = [_random_signature(rng) for _ in range(200)]
+            heavy = best_of(repeat, lambda: [find_near_duplicate(users[0], probe) for probe in probes])
+            light = best_of(repeat, lambda: [find_near_duplicate(users[1], probe) for probe in probes])
+            results.append(BenchResult(name=f"lookup@{rows}rows", seconds=heavy / len(probes),
+                                       extra={"user_rows": rows // 2}))
+            results.append(BenchResult(name=f"lookup_small_user@{rows}rows", seconds=light / len(probes),
+                                       extra={"user_rows": rows // 2 // USERS}))
+            raise _Rollback
+    except _Rollback:
+        pass
+    return results
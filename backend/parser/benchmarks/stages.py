@@ -0,0 +1,65 @@
+"""Per-stage timings of the parsing pipeline on the synthetic corpus.
+
+The line cache is disabled, so repeated runs measure the extractors rather
+than cache hits (the ``line_cache`` suite measures the cache).
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, List, Sequence, Tuple
+
+from django.test import override_settings
+
+from parser.benchmarks import BenchResult, best_of, peak_kib
+from parser.benchmarks.corpus import generate_resume
+from parser.services.build_output import ResumeParser
+from parser.services.extract_contact import extract_contact
+from parser.services.extract_education import extract_education
+from parser.services.extract_experience import extract_experience
+from parser.services.extract_projects import extract_projects
+from parser.services.extract_skills import extract_skills
+from parser.services.preprocess import preprocess
+from parser.services.profile_export import ResumeProfileExporter
+from parser.services.resume_health import score_resume
+from parser.services.section_splitter import split_sections
+
+
+def _stages(raw_text: str) -> List[Tuple[str, Callable[[], Any]]]:
+    lines = preprocess(raw_text)
+    sections = split_sections(lines)
+    profile = ResumeParser().parse_with_report(lines).record
+    exporter = ResumeProfileExporter()
+
+    def section(name: str) -> List[str]:
+        return sections.get(name) or sections.get("unknown", [])
+
+    return [
+        ("preprocess", lambda: preprocess(raw_text)),
+        ("split_sections", lambda: split_sections(lines)),
+        ("extract_contact", lambda: extract_contact(lines)),
+        ("extract_skills", lambda: extract_skills(lines, sections.get("skills"))),
+        ("extract_education", lambda: extract_education(section("education"))),
+        ("extract_experience", lambda: extract_experience(section("experience"))),
+        ("extract_projects", lambda: extract_projects(section("projects"))),
+        ("score_resume", lambda: score_resume(profile)),
+        ("export", lambda: exporter.export(profile)),
+    ]
+
+
+@override_settings(PARSER_LINE_CACHE_BYTES=0)
+def run(seed: int = 1, pages: Sequence[int] = (1, 5, 50), repeat: int = 5, **_: Any) -> List[BenchResult]:
+    results: List[BenchResult] = []
+    for size in pages:
+        raw_text = generate_resume(seed, size)
+        megabytes = len(raw_text.encode("utf-8")) / 1_000_000
+        for name, func in _stages(raw_text):
+            seconds = best_of(repeat, func)
+            results.append(
+                BenchResult(
+                    name=f"{name}@{size}p",
+                    seconds=seconds,
+                    peak_kib=peak_kib(func),
+                    throughput_mb_s=megabytes / seconds if seconds else None,
+                )
+            )
+    return results
@@ -0,0 +1,120 @@
+"""Skill taxonomy compile, load and match cost at 1k, 10k and 100k entries.
+
+Each taxonomy is the bundled ``skills.json`` padded with seeded synthetic
+skills (about half with aliases, some multi-word and starting with common
+resume words, so term heads collide with ordinary text). Matching runs over
+every line of a one-page synthetic corpus (more text than the skills section
+``extract_skills`` reads). ``check`` enforces that matching costs about the
+same at every size and stays within ``MATCH_BUDGET_SECONDS`` per resume, that
+opening the compiled file stays within ``OPEN_BUDGET_SECONDS``, and compiling
+within ``COMPILE_BUDGET_SECONDS`` per 1k entries.
+"""
+
+from __future__ import annotations
+
+import random
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+from parser.benchmarks import BenchResult, best_of, peak_kib
+from parser.benchmarks.corpus import generate_corpus
+from parser.services.taxonomy import (
+    compile_taxonomy,
+    normalize_skill,
+    open_taxonomy,
+    read_sources,
+    write_taxonomy,
+)
+
+SIZES = (1_000, 10_000, 100_000)
+RESUMES = 20
+MATCH_BUDGET_SECONDS = 0.002
+# Allowed growth of match time per resume between the smallest and the largest taxonomy.
+MAX_MATCH_GROWTH = 2.0
+OPEN_BUDGET_SECONDS = 0.005
+COMPILE_BUDGET_SECONDS = 0.05
+
+SYLLABLES = ["ka", "lo", "mi", "zen", "tri", "vex", "or", "qua", "ny", "sol", "bit", "flux", "ar", "dyn"]
+SUFFIXES = ["", "", "", ".js", "DB", " Cloud", "-ml", " Studio", "++", " SDK"]
+# Common resume words; synthetic skills starting with them make term heads match often.
+PREFIXES = ["data", "the", "api", "google", "team", "design", "senior", "cloud"]
+
+
+def _name(rng: random.Random) -> str:
+    word = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))).capitalize()
+    if rng.random() < 0.2:
+        word = f"{rng.choice(PREFIXES).capitalize()} {word}"
+    return word + rng.choice(SUFFIXES)
+
+
+def synthetic_skills(size: int, seed: int = 1) -> Dict[str, List[Any]]:
+    """The bundled skills plus synthetic ones, ``size`` canonical entries in total."""
+    rng = random.Random(seed)
+    skills, _ = read_sources()
+    total = sum(len(entries) for entries in skills.values())
+    categories = list(skills)
+    seen = {normalize_skill(entry if isinstance(entry, str) else entry["name"])
+            for entries in skills.values() for entry in entries}
+    while total < size:
+        name = _name(rng)
+        if normalize_skill(name) in seen:
+            continue
+        seen.add(normalize_skill(name))
+        entry: Any = name
+        if rng.random() < 0.5:
+            entry = {"name": name, "aliases": ["".join(part[0] for part in name.split()) + str(rng.randint(1, 99)),
+                                               name.replace(" ", "")]}
+        skills[rng.choice(categories)].append(entry)
+        total += 1
+    return skills
+
+
+def run(seed: int = 1, repeat: int = 5, sizes: Sequence[int] = SIZES, **_: Any) -> List[BenchResult]:
+    _, headers = read_sources()
+    texts = [normalize_skill(text) for text in generate_corpus(seed, [1], per_size=RESUMES)]
+    results: List[BenchResult] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            skills = synthetic_skills(size, seed)
+            data = compile_taxonomy(skills, headers)
+            results.append(BenchResult(
+                name=f"compile@{size}",
+                seconds=best_of(min(repeat, 2), lambda: compile_taxonomy(skills, headers)),
+                extra={"bytes": len(data)},
+            ))
+
+            path = Path(tmp) / f"taxonomy-{size}.bin"
+            write_taxonomy(path, data)
+            results.append(BenchResult(name=f"open@{size}", seconds=best_of(repeat, lambda: open_taxonomy(path).close())))
+
+            taxonomy = open_taxonomy(path)
+            match_all = lambda: [taxonomy.match_skills(text) for text in texts]  # noqa: E731
+            results.append(BenchResult(
+                name=f"match@{size}",
+                seconds=best_of(repeat, match_all) / len(texts),
+                peak_kib=peak_kib(match_all) / len(texts),
+                extra={"hits": sum(len(hits) for hits in match_all()) // len(texts)},
+            ))
+            taxonomy.close()
+    return results
+
+
+def check(results: List[BenchResult]) -> List[str]:
+    """Sizes whose match, open or compile time exceeds its budget, and match time growing with size."""
+    failures = []
+    matches = {int(result.name.split("@")[1]): result.seconds for result in results if result.name.startswith("match@")}
+    smallest, largest = matches[min(matches)], matches[max(matches)]
+    if smallest and largest / smallest > MAX_MATCH_GROWTH:
+        failures.append(f"match: {largest * 1000:.3f}ms at {max(matches)} entries vs "
+                        f"{smallest * 1000:.3f}ms at {min(matches)}")
+    for result in results:
+        kind, size = result.name.split("@")
+        budget = {
+            "match": MATCH_BUDGET_SECONDS,
+            "open": OPEN_BUDGET_SECONDS,
+            "compile": COMPILE_BUDGET_SECONDS * int(size) / 1000,
+        }[kind]
+        if result.seconds > budget:
+            failures.append(f"{result.name}: {result.seconds * 1000:.3f}ms > {budget * 1000:.3f}ms budget")
+    return failures
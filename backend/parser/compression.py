@@ -0,0 +1,58 @@
+"""HTTP content-coding negotiation and encoders (gzip, optional brotli)."""
+
+from __future__ import annotations
+
+from typing import Dict
+
+from django.utils.text import compress_string
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+# Quality 5 is both faster and smaller than gzip on resume JSON. Cached exports
+# are compressed once per revision and coding, on the first request that asks
+# for it, so they get a higher but still bounded quality.
+BROTLI_DYNAMIC_QUALITY = 5
+BROTLI_STATIC_QUALITY = 9
+GZIP_MAX_RANDOM_BYTES = 100
+
+
+def supported_codings() -> tuple[str, ...]:
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate(accept_encoding: str) -> str | None:
+    """Pick the best supported coding from an Accept-Encoding header, or None."""
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        weights[coding] = quality
+
+    best, best_quality = None, 0.0
+    for coding in supported_codings():
+        quality = weights.get(coding, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def encode(content: bytes, coding: str, static: bool = False) -> bytes:
+    if coding == "br":
+        quality = BROTLI_STATIC_QUALITY if static else BROTLI_DYNAMIC_QUALITY
+        return brotli.compress(content, quality=quality)
+    if coding == "gzip":
+        return compress_string(content, max_random_bytes=GZIP_MAX_RANDOM_BYTES)
+    raise ValueError(f"Unsupported content coding: {coding}")
+
@@ -0,0 +1,180 @@
+"""Model fields that keep large resume payloads compressed at rest.
+
+Values are stored as a one-byte codec tag followed by the compressed body, so
+rows written with zlib stay readable after switching to zstd (and vice versa).
+Reads are lazy: the database value is kept as raw bytes on the instance and only
+decompressed the first time the attribute is accessed. Saving an instance whose
+compressed attribute was never touched writes the original bytes back without a
+decompress/recompress round trip.
+
+The database only sees opaque blobs, so these fields can't be filtered on:
+every lookup and transform except ``isnull`` (``parsed_data__contact=...``,
+``raw_text__contains=...``) raises ``FieldError`` instead of silently comparing
+compressed bytes. ``None`` is only accepted when the field is ``null=True``.
+"""
+
+from __future__ import annotations
+
+import json
+import zlib
+from abc import ABCMeta, abstractmethod
+from typing import Any
+
+from django.conf import settings
+from django.db import models
+from django.db.models.query_utils import DeferredAttribute
+
+ZLIB_TAG = b"z"
+ZSTD_TAG = b"s"
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 3
+
+
+def _codec() -> str:
+    return getattr(settings, "RESUME_COMPRESSION_CODEC", "zlib")
+
+
+def compress_bytes(payload: bytes) -> bytes:
+    if _codec() == "zstd":
+        import zstandard
+
+        return ZSTD_TAG + zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(payload)
+    return ZLIB_TAG + zlib.compress(payload, ZLIB_LEVEL)
+
+
+def decompress_bytes(blob: bytes) -> bytes:
+    tag, body = blob[:1], blob[1:]
+    if tag == ZLIB_TAG:
+        return zlib.decompress(body)
+    if tag == ZSTD_TAG:
+        import zstandard
+
+        return zstandard.ZstdDecompressor().decompress(body)
+    raise ValueError(f"Unknown compression tag: {tag!r}")
+
+
+def _as_blob(value: Any) -> bytes | None:
+    if isinstance(value, memoryview):
+        return value.tobytes()
+    if isinstance(value, (bytes, bytearray)):
+        return bytes(value)
+    return None
+
+
+class LazyDecompressAttribute(DeferredAttribute):
+    """Decompresses the stored blob on first access and caches the result."""
+
+    def __get__(self, instance, cls=None):
+        if instance is None:
+            return self
+        value = super().__get__(instance, cls)
+        blob = _as_blob(value)
+        if blob is None:
+            return value
+        value = self.field.decode_blob(blob)
+        instance.__dict__[self.field.attname] = value
+        return value
+
+    def __set__(self, instance, value):
+        # Defining __set__ makes this a data descriptor, so reads go through
+        # __get__ even when the raw blob is already in the instance __dict__.
+        instance.__dict__[self.field.attname] = value
+
+
+# ABCMeta rather than an ``abc.ABC`` base: ABC's empty ``__slots__`` changes the
+# instance layout, which breaks the ``__class__`` swap in ``Field.__copy__``.
+class CompressedFieldMixin(metaclass=ABCMeta):
+    """Compressed storage for a model field; subclasses define the value encoding."""
+
+    descriptor_class = LazyDecompressAttribute
+
+    def get_internal_type(self):
+        return "BinaryField"
+
+    def get_lookup(self, lookup_name):
+        # Only NULL checks mean the same on the blob as on the value.
+        if lookup_name == "isnull":
+            return super().get_lookup(lookup_name)
+        return None
+
+    def get_transform(self, name):
+        return None
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        blob = _as_blob(value)
+        if blob is not None:
+            # Stay compressed until the attribute is read.
+            return blob
+        # Rows written before compression was enabled.
+        return self.decode_legacy(value)
+
+    def pre_save(self, model_instance, add):
+        # Read the raw slot so untouched blobs are written back as-is.
+        if self.attname in model_instance.__dict__:
+            return model_instance.__dict__[self.attname]
+        return super().pre_save(model_instance, add)
+
+    def get_prep_value(self, value):
+        if value is None and not self.null:
+            raise ValueError(f"{self.model.__name__}.{self.name} can't be None; the column is NOT NULL.")
+        return value
+
+    def get_db_prep_save(self, value, connection):
+        # Skip JSONField's shortcut that sends None straight to the database.
+        return models.Field.get_db_prep_save(self, value, connection)
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        if not prepared:
+            value = self.get_prep_value(value)
+        if value is None:
+            return None
+        blob = _as_blob(value)
+        if blob is None:
+            blob = compress_bytes(self.encode_value(value))
+        return connection.Database.Binary(blob)
+
+    @abstractmethod
+    def decode_blob(self, blob: bytes) -> Any:
+        ...
+
+    def decode_legacy(self, value: Any) -> Any:
+        return value
+
+    @abstractmethod
+    def encode_value(self, value: Any) -> bytes:
+        ...
+
+
+class CompressedTextField(CompressedFieldMixin, models.TextField):
+    """TextField stored as a compressed blob."""
+
+    def decode_blob(self, blob: bytes) -> str:
+        return decompress_bytes(blob).decode("utf-8")
+
+    def encode_value(self, value: Any) -> bytes:
+        return str(value).encode("utf-8")
+
+
+class CompressedJSONField(CompressedFieldMixin, models.JSONField):
+    """JSONField stored as compact, compressed JSON text."""
+
+    def decode_blob(self, blob: bytes) -> Any:
+        return json.loads(decompress_bytes(blob), cls=self.decoder)
+
+    def decode_legacy(self, value: Any) -> Any:
+        if isinstance(value, str):
+            return json.loads(value, cls=self.decoder)
+        return value
+
+    def encode_value(self, value: Any) -> bytes:
+        return json.dumps(value, cls=self.encoder, separators=(",", ":")).encode("utf-8")
+
+
+def decompress_value(field: models.Field, value: Any) -> Any:
+    """Decode a raw value from ``.values()``/``.values_list()`` querysets."""
+    blob = _as_blob(value)
+    if blob is None:
+        return value
+    return field.decode_blob(blob)
@@ -0,0 +1,90 @@
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from parser.benchmarks import SUITES, calibrate, load_check, load_suite
+
+BASELINES_PATH = Path(__file__).resolve().parents[2] / "benchmarks" / "baselines.json"
+
+# Differences below these floors are treated as noise.
+SECONDS_FLOOR = 0.0002
+KIB_FLOOR = 64.0
+
+
+class Command(BaseCommand):
+    help = "Run a benchmark suite and fail if it regresses against the stored baselines."
+
+    def add_arguments(self, parser):
+        parser.add_argument("suite", choices=sorted(SUITES))
+        parser.add_argument("--seed", type=int, default=1)
+        parser.add_argument("--pages", type=int, nargs="+", default=[1, 5, 50])
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--rows", type=int, default=100_000, help="Table size for lookup benchmarks.")
+        parser.add_argument("--tolerance", type=float, default=1.5, help="Allowed slowdown factor.")
+        parser.add_argument("--memory-tolerance", type=float, default=1.25, help="Allowed peak-memory growth factor.")
+        parser.add_argument("--update-baseline", action="store_true", help="Store this run as the new baseline.")
+        parser.add_argument("--no-compare", action="store_true", help="Only print results.")
+        parser.add_argument("--json", action="store_true", help="Print results as JSON lines.")
+
+    def handle(self, *args, **options):
+        suite = options["suite"]
+        # Calibrated on both sides of the suite; the faster run is the least disturbed.
+        calibration = calibrate()
+        results = load_suite(suite)(**options)
+        calibration = min(calibration, calibrate())
+
+        if options["json"]:
+            for result in results:
+                self.stdout.write(json.dumps({"suite": suite, "name": result.name, "seconds": result.seconds,
+                                              "peak_kib": result.peak_kib, "throughput_mb_s": result.throughput_mb_s,
+                                              **result.extra}, sort_keys=True))
+        else:
+            self.stdout.write(f"{'benchmark':<32} {'ms':>10} {'MB/s':>10} {'peak KiB':>10}")
+            for result in results:
+                throughput = f"{result.throughput_mb_s:.2f}" if result.throughput_mb_s is not None else "-"
+                peak = f"{result.peak_kib:.1f}" if result.peak_kib is not None else "-"
+                extra = " ".join(f"{key}={value}" for key, value in sorted(result.extra.items()))
+                self.stdout.write(f"{result.name:<32} {result.seconds * 1000:>10.3f} {throughput:>10} {peak:>10} {extra}".rstrip())
+            self.stdout.write(f"calibration: {calibration * 1000:.3f}ms")
+
+        baselines = json.loads(BASELINES_PATH.read_text()) if BASELINES_PATH.exists() else {}
+        if options["update_baseline"]:
+            baselines.setdefault("calibration", {})[suite] = round(calibration, 6)
+            stored = baselines.setdefault(suite, {})
+            for result in results:
+                stored[result.name] = {"seconds": round(result.seconds, 6)}
+                if result.peak_kib is not None:
+                    stored[result.name]["peak_kib"] = round(result.peak_kib, 1)
+            BASELINES_PATH.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+            self.stdout.write(self.style.SUCCESS(f"Updated {suite} baselines in {BASELINES_PATH.name}."))
+            return
+        if options["no_compare"]:
+            return
+
+        stored_calibration = baselines.get("calibration", {}).get(suite)
+        if baselines.get(suite) and not stored_calibration:
+            raise CommandError(f"No calibration stored for {suite}; rerun it with --update-baseline.")
+        # How much slower this machine is than the one that stored the baselines.
+        scale = calibration / stored_calibration if stored_calibration else 1.0
+        if not options["json"]:
+            self.stdout.write(f"Baselines scaled by {scale:.2f}x for this machine.")
+
+        check = load_check(suite)
+        regressions = list(check(results)) if check else []
+        for result in results:
+            baseline = baselines.get(suite, {}).get(result.name)
+            if not baseline:
+                continue
+            allowed = baseline["seconds"] * scale * options["tolerance"]
+            if result.seconds > allowed and result.seconds - baseline["seconds"] * scale > SECONDS_FLOOR:
+                regressions.append(f"{result.name}: {result.seconds * 1000:.3f}ms > {allowed * 1000:.3f}ms")
+            base_peak = baseline.get("peak_kib")
+            if base_peak is not None and result.peak_kib is not None:
+                allowed_peak = base_peak * options["memory_tolerance"]
+                if result.peak_kib > allowed_peak and result.peak_kib - base_peak > KIB_FLOOR:
+                    regressions.append(f"{result.name}: peak {result.peak_kib:.1f}KiB > {allowed_peak:.1f}KiB")
+
+        if regressions:
+            raise CommandError("Benchmark regressions:\n  " + "\n  ".join(regressions))
+        self.stdout.write(self.style.SUCCESS("No regressions against baseline."))
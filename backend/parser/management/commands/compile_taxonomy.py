@@ -0,0 +1,22 @@
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+
+from parser.services.taxonomy import Taxonomy, compile_sources, taxonomy_path, write_taxonomy
+
+
+class Command(BaseCommand):
+    help = "Compile skills.json and section_headers.json into the memory-mapped taxonomy file workers load."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--output", type=Path, help="Where to write the file (default: PARSER_TAXONOMY_PATH).")
+
+    def handle(self, *args, **options):
+        path = options["output"] or taxonomy_path()
+        data = compile_sources()
+        compiled = Taxonomy(data)
+        write_taxonomy(path, data)
+        self.stdout.write(
+            f"Wrote {path} ({len(data)} bytes, {len(compiled.categories())} categories, "
+            f"fingerprint {compiled.fingerprint})."
+        )
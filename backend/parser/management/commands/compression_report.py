@@ -0,0 +1,42 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from parser.fields import decompress_value
+from parser.models import Resume
+
+
+class Command(BaseCommand):
+    help = "Report at-rest size savings and decompression cost for compressed Resume columns."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sample", type=int, default=1000, help="Number of most recent rows to inspect.")
+
+    def handle(self, *args, **options):
+        fields = ["raw_text", "parsed_data"]
+        rows = list(
+            Resume.objects.order_by("-pk").values_list(*fields)[: options["sample"]]
+        )
+        if not rows:
+            self.stdout.write("No resumes to inspect.")
+            return
+
+        for index, name in enumerate(fields):
+            field = Resume._meta.get_field(name)
+            stored = 0
+            plain = 0
+            started = time.perf_counter()
+            for row in rows:
+                blob = row[index]
+                stored += len(blob)
+                value = decompress_value(field, blob)
+                plain += len(field.encode_value(value))
+            elapsed = time.perf_counter() - started
+
+            ratio = plain / stored if stored else 0.0
+            saved = 100 * (1 - stored / plain) if plain else 0.0
+            self.stdout.write(
+                f"{name}: rows={len(rows)} plain={plain}B stored={stored}B "
+                f"ratio={ratio:.2f}x saved={saved:.1f}% "
+                f"decode={1000 * elapsed / len(rows):.3f}ms/row"
+            )
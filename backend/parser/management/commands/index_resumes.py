@@ -0,0 +1,48 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from parser.models import Resume
+from parser.services.preprocess import preprocess
+from parser.services.similarity import BANDS, signature_fields
+
+SIGNATURE_FIELDS = ["simhash", *(f"simhash_band{band}" for band in range(BANDS))]
+
+
+class Command(BaseCommand):
+    help = "Compute near-duplicate (SimHash) signatures for resumes that do not have one."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=500, help="Rows fetched and written per transaction.")
+        parser.add_argument("--force", action="store_true", help="Recompute signatures that already exist.")
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        queryset = Resume.objects.order_by("pk").only("pk", "raw_text", *SIGNATURE_FIELDS)
+        if not options["force"]:
+            queryset = queryset.filter(simhash__isnull=True)
+
+        total = queryset.count()
+        self.stdout.write(f"Indexing {total} resume(s).")
+        done = 0
+        last_pk = 0
+        started = time.perf_counter()
+        while True:
+            chunk = list(queryset.filter(pk__gt=last_pk)[:chunk_size])
+            if not chunk:
+                break
+            last_pk = chunk[-1].pk
+
+            for resume in chunk:
+                for name, value in signature_fields(preprocess(resume.raw_text)).items():
+                    setattr(resume, name, value)
+            with transaction.atomic():
+                Resume.objects.bulk_update(chunk, SIGNATURE_FIELDS)
+
+            done += len(chunk)
+            elapsed = time.perf_counter() - started
+            self.stdout.write(f"  {done}/{total} indexed ({done / elapsed:.0f} rows/s)")
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f"Indexed {done} resume(s) in {elapsed:.2f}s."))
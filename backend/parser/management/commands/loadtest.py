@@ -0,0 +1,48 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from parser.benchmarks.loadtest import DEFAULT_MIX, LocalServer, parse_mix, run_load_test
+
+
+class Command(BaseCommand):
+    help = "Drive a weighted mix of API calls at a fixed concurrency and report per-endpoint latency."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--url", help="Target an already running server instead of starting one.")
+        parser.add_argument("--users", type=int, default=4)
+        parser.add_argument("--concurrency", type=int, default=8)
+        parser.add_argument("--requests", type=int, default=400)
+        parser.add_argument(
+            "--mix",
+            default=",".join(f"{name}={weight}" for name, weight in DEFAULT_MIX.items()),
+            help="Endpoint weights, e.g. parse=1,list=3,detail=8,edit=2,export=4.",
+        )
+        parser.add_argument("--seed", type=int, default=1)
+        parser.add_argument("--pages", type=int, default=2, help="Size of the uploaded synthetic resume.")
+        parser.add_argument("--json", action="store_true", help="Print the report as sorted JSON.")
+
+    def handle(self, *args, **options):
+        try:
+            mix = parse_mix(options["mix"])
+        except ValueError as exc:
+            raise CommandError(str(exc)) from exc
+
+        kwargs = {key: options[key] for key in ("users", "concurrency", "requests", "seed", "pages")}
+        if options["url"]:
+            report = run_load_test(options["url"], mix=mix, **kwargs)
+        else:
+            with LocalServer() as server:
+                report = run_load_test(server.base_url, mix=mix, **kwargs)
+
+        if options["json"]:
+            self.stdout.write(json.dumps(report, indent=2, sort_keys=True))
+            return
+
+        self.stdout.write(f"{report['config']}  wall={report['wall_seconds']}s")
+        self.stdout.write(f"{'endpoint':<10} {'n':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'err %':>7} {'req/s':>8}")
+        for name, row in report["endpoints"].items():
+            self.stdout.write(
+                f"{name:<10} {row['requests']:>6} {row['p50_ms']:>9.1f} {row['p95_ms']:>9.1f} "
+                f"{row['p99_ms']:>9.1f} {row['error_rate'] * 100:>7.2f} {row['throughput_rps']:>8.1f}"
+            )
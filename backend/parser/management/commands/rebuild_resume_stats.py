@@ -0,0 +1,45 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from parser.models import UserResumeStats
+from parser.services.resume_stats import ResumeStatsService
+
+STATS_FIELDS = [
+    "resume_count", "scored_count", "score_sum", "score_histogram", "skill_counts", "warning_counts", "section_counts",
+]
+
+
+class Command(BaseCommand):
+    help = "Recompute per-user resume aggregates from scratch and repair any drift."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--check", action="store_true", help="Only report drift; exit non-zero if any is found.")
+        parser.add_argument("--chunk-size", type=int, default=500, help="Resumes fetched per query.")
+
+    def handle(self, *args, **options):
+        fresh = ResumeStatsService().rebuild(chunk_size=options["chunk_size"])
+        stored = {stats.user_id: stats for stats in UserResumeStats.objects.all()}
+        for user_id in stored.keys() - fresh.keys():
+            # Users whose resumes were all deleted keep an all-zero row.
+            fresh[user_id] = UserResumeStats(user_id=user_id)
+
+        drifted = [
+            user_id
+            for user_id, stats in fresh.items()
+            if user_id not in stored
+            or any(getattr(stats, name) != getattr(stored[user_id], name) for name in STATS_FIELDS)
+        ]
+        self.stdout.write(f"Checked {len(fresh)} user(s); {len(drifted)} out of date.")
+        if options["check"]:
+            if drifted:
+                raise CommandError(f"Resume stats drifted for user(s): {', '.join(map(str, sorted(drifted)))}")
+            return
+
+        with transaction.atomic():
+            for user_id in drifted:
+                stats = fresh[user_id]
+                if user_id in stored:
+                    stats.save(force_update=True)
+                else:
+                    stats.save(force_insert=True)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt stats for {len(drifted)} user(s)."))
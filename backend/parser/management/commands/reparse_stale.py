@@ -0,0 +1,66 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from parser.services.parser_version import current_parser_version
+from parser.services.resume_reparse import ResumeReparseService
+
+
+class Command(BaseCommand):
+    help = "Re-parse resumes produced by an older parser/taxonomy version, at a bounded rate."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rate",
+            type=float,
+            default=None,
+            help="Maximum rows re-parsed per second (default: RESUME_REPARSE_RATE).",
+        )
+        parser.add_argument("--batch-size", type=int, default=100, help="Rows fetched per query.")
+        parser.add_argument("--limit", type=int, default=None, help="Stop after this many rows.")
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep sweeping, sleeping --idle-sleep seconds when nothing is stale.",
+        )
+        parser.add_argument("--idle-sleep", type=float, default=60.0)
+
+    def handle(self, *args, **options):
+        rate = options["rate"] if options["rate"] is not None else settings.RESUME_REPARSE_RATE
+        interval = 1.0 / rate if rate > 0 else 0.0
+        service = ResumeReparseService(other_taxonomies=True)
+        self.stdout.write(f"Sweeping to parser version {current_parser_version()} at <= {rate:g} rows/s.")
+
+        refreshed = 0
+        while True:
+            swept = self._sweep(service, options["batch_size"], interval, options["limit"], refreshed)
+            refreshed += swept
+            if options["limit"] is not None and refreshed >= options["limit"]:
+                break
+            if not options["loop"]:
+                break
+            if not swept:
+                time.sleep(options["idle_sleep"])
+
+        self.stdout.write(self.style.SUCCESS(f"Re-parsed {refreshed} resume(s)."))
+
+    def _sweep(self, service, batch_size, interval, limit, refreshed):
+        swept = 0
+        last_pk = 0
+        next_slot = time.monotonic()
+        while True:
+            batch = list(service.stale_queryset().filter(pk__gt=last_pk).order_by("pk")[:batch_size])
+            if not batch:
+                return swept
+            for resume in batch:
+                last_pk = resume.pk
+                if limit is not None and refreshed + swept >= limit:
+                    return swept
+                delay = next_slot - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                next_slot = max(next_slot, time.monotonic()) + interval
+                if service.reparse(resume):
+                    swept += 1
+                    self.stdout.write(f"  resume {resume.pk} re-parsed")
@@ -0,0 +1,92 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from parser.models import Resume
+from parser.services.resume_health import HEALTH_RULES_VERSION, score_resume
+from parser.services.resume_stats import ResumeStatsService, StatsContribution, StatsDelta
+
+
+class Command(BaseCommand):
+    help = "Recompute stored resume_health for rows scored with older health rules."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=500, help="Rows fetched and written per transaction.")
+        parser.add_argument("--workers", type=int, default=1, help="Scoring processes; 1 scores in-process.")
+        parser.add_argument("--force", action="store_true", help="Rescore rows that are already current.")
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        queryset = Resume.objects.order_by("pk").only(
+            "pk", "user_id", "parsed_data", "resume_health", "health_version", "updated_at"
+        )
+        if not options["force"]:
+            queryset = queryset.exclude(health_version=HEALTH_RULES_VERSION)
+
+        total = queryset.count()
+        self.stdout.write(f"Rescoring {total} resume(s) to health rules v{HEALTH_RULES_VERSION}.")
+        if not total:
+            return
+
+        stats = ResumeStatsService()
+        executor = ProcessPoolExecutor(max_workers=options["workers"]) if options["workers"] > 1 else None
+        done = skipped = 0
+        last_pk = 0
+        started = time.perf_counter()
+        try:
+            while True:
+                chunk = list(queryset.filter(pk__gt=last_pk)[:chunk_size])
+                if not chunk:
+                    break
+                last_pk = chunk[-1].pk
+
+                payloads = [resume.parsed_data for resume in chunk]
+                if executor is not None:
+                    scores = list(executor.map(score_resume, payloads, chunksize=max(1, len(payloads) // 16)))
+                else:
+                    scores = [score_resume(payload) for payload in payloads]
+
+                with transaction.atomic():
+                    # Scoring ran unlocked; rows edited since they were read
+                    # keep the edit and are left for the next run.
+                    current = dict(
+                        Resume.objects.select_for_update()
+                        .filter(pk__in=[resume.pk for resume in chunk])
+                        .values_list("pk", "updated_at")
+                    )
+                    now = timezone.now()
+                    rescored = []
+                    deltas = {}
+                    for resume, health in zip(chunk, scores):
+                        if current.get(resume.pk) != resume.updated_at:
+                            continue
+                        delta = deltas.setdefault(resume.user_id, StatsDelta())
+                        delta.add(StatsContribution.of_resume(resume), -1)
+                        resume.resume_health = health
+                        resume.health_rules = {}
+                        resume.parsed_data = {**resume.parsed_data, "resume_health": health}
+                        resume.health_version = HEALTH_RULES_VERSION
+                        # Moves the export cache key along with the new health.
+                        resume.updated_at = now
+                        delta.add(StatsContribution.of_resume(resume))
+                        rescored.append(resume)
+                    Resume.objects.bulk_update(
+                        rescored, ["parsed_data", "resume_health", "health_rules", "health_version", "updated_at"]
+                    )
+                    stats.apply(deltas)
+
+                done += len(rescored)
+                skipped += len(chunk) - len(rescored)
+                elapsed = time.perf_counter() - started
+                self.stdout.write(f"  {done}/{total} rescored ({done / elapsed:.0f} rows/s)")
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        elapsed = time.perf_counter() - started
+        if skipped:
+            self.stdout.write(f"Skipped {skipped} resume(s) edited while rescoring.")
+        self.stdout.write(self.style.SUCCESS(f"Rescored {done} resume(s) in {elapsed:.2f}s."))
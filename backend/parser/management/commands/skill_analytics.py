@@ -0,0 +1,39 @@
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand
+
+from parser.models import SkillAnalyticsSnapshot
+from parser.services.skill_analytics import BUCKETS, SkillAnalyticsAccumulator, iter_skill_rows
+
+
+class Command(BaseCommand):
+    help = "Compute corpus-wide skill co-occurrence and trend analytics and store a snapshot."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--bucket", choices=BUCKETS, default="month", help="Trend period size.")
+        parser.add_argument("--chunk-size", type=int, default=1000, help="Resumes decoded per vectorized batch.")
+        parser.add_argument("--keep", type=int, default=10, help="Snapshots retained per bucket, newest first.")
+
+    def handle(self, *args, **options):
+        accumulator = SkillAnalyticsAccumulator(bucket=options["bucket"])
+        tracemalloc.start()
+        started = time.perf_counter()
+        for rows in iter_skill_rows(options["chunk_size"], accumulator.vocabulary):
+            accumulator.add_chunk(rows)
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        snapshot = accumulator.snapshot()
+        snapshot.save()
+        stale = SkillAnalyticsSnapshot.objects.filter(bucket=snapshot.bucket).order_by("-created_at", "-pk")
+        stale_ids = list(stale.values_list("pk", flat=True)[options["keep"]:])
+        SkillAnalyticsSnapshot.objects.filter(pk__in=stale_ids).delete()
+
+        rate = accumulator.resume_count / elapsed if elapsed else 0.0
+        self.stdout.write(
+            f"Analysed {accumulator.resume_count} resume(s) across {len(snapshot.periods)} {snapshot.bucket}(s) "
+            f"in {elapsed:.2f}s ({rate:.0f} rows/s, peak {peak / 1024:.0f} KiB)."
+        )
+        self.stdout.write(self.style.SUCCESS(f"Stored snapshot {snapshot.pk}."))
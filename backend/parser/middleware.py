@@ -0,0 +1,57 @@
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+
+from parser.compression import encode, negotiate
+from parser.services.taxonomy import pinned_taxonomy
+
+
+class CompressionMiddleware:
+    """Compress large responses with brotli or gzip, as negotiated by the client.
+
+    Responses smaller than ``RESPONSE_COMPRESSION_MIN_BYTES``, streaming
+    responses and responses that already carry a Content-Encoding (e.g.
+    precompressed exports) are passed through unchanged.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        if response.streaming or response.has_header("Content-Encoding"):
+            return response
+        if len(response.content) < getattr(settings, "RESPONSE_COMPRESSION_MIN_BYTES", 1024):
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        coding = negotiate(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        if coding is None:
+            return response
+
+        compressed = encode(response.content, coding)
+        if len(compressed) >= len(response.content):
+            return response
+        response.content = compressed
+        response.headers["Content-Length"] = str(len(compressed))
+        response.headers["Content-Encoding"] = coding
+
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        return response
+
+
+class TaxonomyPinMiddleware:
+    """Serve each request from one taxonomy version.
+
+    A taxonomy reload that lands mid-request takes effect for the next
+    request; the current one keeps the version it started with.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with pinned_taxonomy():
+            return self.get_response(request)
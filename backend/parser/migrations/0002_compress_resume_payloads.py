@@ -0,0 +1,61 @@
+from django.db import migrations, models
+
+import parser.fields
+
+CHUNK_SIZE = 500
+
+
+def _copy_in_chunks(apps, pairs):
+    Resume = apps.get_model("parser", "Resume")
+    last_pk = 0
+    while True:
+        chunk = list(
+            Resume.objects.filter(pk__gt=last_pk)
+            .order_by("pk")
+            .only("pk", *[source for source, _ in pairs])[:CHUNK_SIZE]
+        )
+        if not chunk:
+            break
+        for resume in chunk:
+            for source, target in pairs:
+                setattr(resume, target, getattr(resume, source))
+        Resume.objects.bulk_update(chunk, [target for _, target in pairs])
+        last_pk = chunk[-1].pk
+
+
+def compress_rows(apps, schema_editor):
+    _copy_in_chunks(apps, [("raw_text_plain", "raw_text"), ("parsed_data_plain", "parsed_data")])
+
+
+def decompress_rows(apps, schema_editor):
+    _copy_in_chunks(apps, [("raw_text", "raw_text_plain"), ("parsed_data", "parsed_data_plain")])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("parser", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RenameField(model_name="resume", old_name="raw_text", new_name="raw_text_plain"),
+        migrations.RenameField(model_name="resume", old_name="parsed_data", new_name="parsed_data_plain"),
+        # Nullable so the reverse migration can re-add the column to a populated
+        # table before the data is copied back.
+        migrations.AlterField(model_name="resume", name="parsed_data_plain", field=models.JSONField(null=True)),
+        migrations.AddField(
+            model_name="resume",
+            name="raw_text",
+            field=parser.fields.CompressedTextField(blank=True, default=""),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="resume",
+            name="parsed_data",
+            field=parser.fields.CompressedJSONField(default=dict),
+            preserve_default=False,
+        ),
+        migrations.RunPython(compress_rows, decompress_rows),
+        migrations.RemoveField(model_name="resume", name="raw_text_plain"),
+        migrations.RemoveField(model_name="resume", name="parsed_data_plain"),
+    ]
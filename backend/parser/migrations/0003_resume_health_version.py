@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("parser", "0002_compress_resume_payloads"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="resume",
+            name="health_version",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("parser", "0003_resume_health_version"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="resume",
+            name="parser_version",
+            field=models.CharField(blank=True, db_index=True, default="", max_length=32),
+        ),
+        migrations.AddField(
+            model_name="resume",
+            name="is_edited",
+            field=models.BooleanField(default=False),
+        ),
+    ]
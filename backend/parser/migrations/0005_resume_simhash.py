@@ -0,0 +1,64 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("parser", "0004_resume_parser_version"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="resume",
+            name="simhash",
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="resume",
+            name="simhash_band0",
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="resume",
+            name="simhash_band1",
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="resume",
+            name="simhash_band2",
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="resume",
+            name="simhash_band3",
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="resume",
+            name="near_duplicate_of",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="near_duplicates",
+                to="parser.resume",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="resume",
+            index=models.Index(fields=["user", "simhash_band0"], name="resume_user_simhash_b0"),
+        ),
+        migrations.AddIndex(
+            model_name="resume",
+            index=models.Index(fields=["user", "simhash_band1"], name="resume_user_simhash_b1"),
+        ),
+        migrations.AddIndex(
+            model_name="resume",
+            index=models.Index(fields=["user", "simhash_band2"], name="resume_user_simhash_b2"),
+        ),
+        migrations.AddIndex(
+            model_name="resume",
+            index=models.Index(fields=["user", "simhash_band3"], name="resume_user_simhash_b3"),
+        ),
+    ]
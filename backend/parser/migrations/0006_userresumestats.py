@@ -0,0 +1,37 @@
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("parser", "0005_resume_simhash"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserResumeStats",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="resume_stats",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                ("resume_count", models.PositiveIntegerField(default=0)),
+                ("scored_count", models.PositiveIntegerField(default=0)),
+                ("score_sum", models.PositiveIntegerField(default=0)),
+                ("score_histogram", models.JSONField(default=dict)),
+                ("skill_counts", models.JSONField(default=dict)),
+                ("warning_counts", models.JSONField(default=dict)),
+                ("section_counts", models.JSONField(default=dict)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,26 @@
+import parser.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("parser", "0006_userresumestats"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SkillAnalyticsSnapshot",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("created_at", models.DateTimeField(auto_now_add=True, db_index=True)),
+                ("bucket", models.CharField(max_length=8)),
+                ("resume_count", models.PositiveIntegerField()),
+                ("skills", models.JSONField()),
+                ("cooccurrence", parser.fields.CompressedJSONField()),
+                ("periods", models.JSONField()),
+                ("period_totals", models.JSONField()),
+                ("frequencies", parser.fields.CompressedJSONField()),
+            ],
+        ),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("parser", "0007_skillanalyticssnapshot"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="resume",
+            name="health_rules",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -1,18 +1,111 @@
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 from django.contrib.auth.models import User
 
+from parser.fields import CompressedJSONField, CompressedTextField
+
 class Resume(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="resumes")
 
     file_name = models.CharField(max_length=255)
-    raw_text = models.TextField(blank=True)
+    raw_text = CompressedTextField(blank=True)
 
-    parsed_data = models.JSONField()
+    parsed_data = CompressedJSONField()
     resume_health = models.JSONField()
+    health_version = models.PositiveIntegerField(default=0)
+    # Per-rule results behind resume_health, so an edit re-runs only the rules
+    # reading the keys it changed. Emptied by writes that rescore from scratch.
+    health_rules = models.JSONField(default=dict, blank=True)
+    parser_version = models.CharField(max_length=32, blank=True, default="", db_index=True)
 
     is_confirmed = models.BooleanField(default=False)
+    is_edited = models.BooleanField(default=False)
+
+    # SimHash of the preprocessed lines, split into 16-bit LSH bands (see
+    # parser.services.similarity). Null for rows not yet indexed.
+    simhash = models.BigIntegerField(null=True, blank=True)
+    simhash_band0 = models.PositiveIntegerField(null=True, blank=True)
+    simhash_band1 = models.PositiveIntegerField(null=True, blank=True)
+    simhash_band2 = models.PositiveIntegerField(null=True, blank=True)
+    simhash_band3 = models.PositiveIntegerField(null=True, blank=True)
+    near_duplicate_of = models.ForeignKey(
+        "self", null=True, blank=True, on_delete=models.SET_NULL, related_name="near_duplicates"
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", f"simhash_band{band}"], name=f"resume_user_simhash_b{band}")
+            for band in range(4)
+        ]
+
     def __str__(self):
         return f"{self.id} - {self.user.username} - {self.file_name}"
+
+
+class UserResumeStats(models.Model):
+    """Per-user aggregates over all of a user's resumes, maintained incrementally.
+
+    See ``parser.services.resume_stats``; ``manage.py rebuild_resume_stats``
+    recomputes them from scratch.
+    """
+
+    user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name="resume_stats")
+    resume_count = models.PositiveIntegerField(default=0)
+    scored_count = models.PositiveIntegerField(default=0)
+    score_sum = models.PositiveIntegerField(default=0)
+    # Counters keyed by score bucket ("0".."90"), "category/skill", warning and section name.
+    score_histogram = models.JSONField(default=dict)
+    skill_counts = models.JSONField(default=dict)
+    warning_counts = models.JSONField(default=dict)
+    section_counts = models.JSONField(default=dict)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.user_id} - {self.resume_count} resume(s)"
+
+
+class SkillAnalyticsSnapshot(models.Model):
+    """Corpus-wide skill co-occurrence and per-period frequencies.
+
+    Written by ``manage.py skill_analytics``; matrices are indexed by the
+    position of each ``[category, skill]`` entry in ``skills`` and hold only
+    their nonzero entries (see ``parser.services.skill_analytics``).
+    """
+
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    bucket = models.CharField(max_length=8)
+    resume_count = models.PositiveIntegerField()
+    skills = models.JSONField()
+    cooccurrence = CompressedJSONField()
+    periods = models.JSONField()
+    period_totals = models.JSONField()
+    frequencies = CompressedJSONField()
+
+    def __str__(self):
+        return f"{self.created_at:%Y-%m-%d %H:%M} - {self.resume_count} resume(s) by {self.bucket}"
+
+
+class IdempotencyKey(models.Model):
+    """An Idempotency-Key claimed by a resume upload and the response it produced.
+
+    Kept in the database so a retry landing on any worker sees the claim; see
+    ``parser.services.idempotency``. ``response_status`` is null while the
+    request that claimed the key is still running.
+    """
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="idempotency_keys")
+    key = models.CharField(max_length=255)
+    # SHA-256 of the request body, so a key reused for another upload is refused.
+    fingerprint = models.CharField(max_length=64)
+    created_at = models.DateTimeField(db_index=True)
+    response_status = models.PositiveSmallIntegerField(null=True, blank=True)
+    response_body = CompressedJSONField(null=True, blank=True, encoder=DjangoJSONEncoder)
+
+    class Meta:
+        constraints = [models.UniqueConstraint(fields=["user", "key"], name="idempotency_user_key")]
+
+    def __str__(self):
+        return f"{self.user_id} - {self.key}"
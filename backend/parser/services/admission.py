@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Hashable, Iterator
+
+from django.conf import settings
+from rest_framework import status
+from rest_framework.exceptions import APIException, Throttled
+
+
+class ParsingUnavailable(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "The parser is busy. Please retry shortly."
+    default_code = "parser_busy"
+
+    def __init__(self, wait: int, detail=None):
+        super().__init__(detail)
+        # DRF's exception handler turns `wait` into a Retry-After header.
+        self.wait = wait
+
+
+@dataclass(slots=True)
+class AdmissionController:
+    """Bounds concurrent parses per process with a FIFO wait queue.
+
+    ``max_concurrent`` parses run at once and up to ``max_queue`` more wait
+    (for at most ``queue_timeout`` seconds). When the queue is full or the
+    wait times out the caller gets a 503. Each user may hold at most
+    ``per_user_limit`` running-or-queued slots; beyond that they get a 429, so
+    one bulk uploader cannot fill the queue.
+    """
+
+    max_concurrent: int = 4
+    max_queue: int = 16
+    queue_timeout: float = 10.0
+    per_user_limit: int = 2
+    _condition: threading.Condition = field(default_factory=threading.Condition)
+    _queue: Deque[object] = field(default_factory=deque)
+    _active: int = 0
+    # Running-or-queued slots per user; users holding none have no entry.
+    _per_user: Dict[Hashable, int] = field(default_factory=dict)
+    _counters: Dict[str, float] = field(default_factory=lambda: defaultdict(float))
+    _avg_service_seconds: float = 1.0
+
+    @contextmanager
+    def admit(self, user_key: Hashable, timeout: float | None = None) -> Iterator[None]:
+        """Hold a parse slot; ``timeout`` can shorten the queue wait below ``queue_timeout``."""
+        self._acquire(user_key, self.queue_timeout if timeout is None else min(timeout, self.queue_timeout))
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self._release(user_key, time.monotonic() - started)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._condition:
+            return {
+                "active": self._active,
+                "queue_depth": len(self._queue),
+                "max_concurrent": self.max_concurrent,
+                "max_queue": self.max_queue,
+                "admitted": int(self._counters["admitted"]),
+                "rejected_queue_full": int(self._counters["rejected_queue_full"]),
+                "rejected_timeout": int(self._counters["rejected_timeout"]),
+                "rejected_user_limit": int(self._counters["rejected_user_limit"]),
+                "peak_queue_depth": int(self._counters["peak_queue_depth"]),
+                "avg_wait_ms": round(
+                    1000 * self._counters["wait_seconds"] / self._counters["admitted"], 1
+                ) if self._counters["admitted"] else 0.0,
+                "avg_service_ms": round(1000 * self._avg_service_seconds, 1),
+            }
+
+    def _acquire(self, user_key: Hashable, timeout: float) -> None:
+        with self._condition:
+            if self._per_user.get(user_key, 0) >= self.per_user_limit:
+                self._counters["rejected_user_limit"] += 1
+                raise Throttled(wait=self.retry_after(), detail="Too many resumes are being parsed for this account.")
+
+            if self._active < self.max_concurrent and not self._queue:
+                self._admitted(user_key, 0.0)
+                return
+
+            if len(self._queue) >= self.max_queue:
+                self._counters["rejected_queue_full"] += 1
+                raise ParsingUnavailable(wait=self.retry_after())
+
+            ticket = object()
+            self._queue.append(ticket)
+            self._increment(user_key)
+            self._counters["peak_queue_depth"] = max(self._counters["peak_queue_depth"], len(self._queue))
+            enqueued = time.monotonic()
+            admitted = self._condition.wait_for(
+                lambda: self._queue[0] is ticket and self._active < self.max_concurrent,
+                timeout=timeout,
+            )
+            self._queue.remove(ticket)
+            self._decrement(user_key)
+            if not admitted:
+                self._counters["rejected_timeout"] += 1
+                self._condition.notify_all()
+                raise ParsingUnavailable(wait=self.retry_after())
+            self._admitted(user_key, time.monotonic() - enqueued)
+            # The next waiter may also fit if several slots are free.
+            self._condition.notify_all()
+
+    def _admitted(self, user_key: Hashable, waited: float) -> None:
+        self._active += 1
+        self._increment(user_key)
+        self._counters["admitted"] += 1
+        self._counters["wait_seconds"] += waited
+
+    def _release(self, user_key: Hashable, service_seconds: float) -> None:
+        with self._condition:
+            self._active -= 1
+            self._decrement(user_key)
+            # Exponential moving average drives the Retry-After estimate.
+            self._avg_service_seconds = 0.8 * self._avg_service_seconds + 0.2 * service_seconds
+            self._condition.notify_all()
+
+    def _increment(self, user_key: Hashable) -> None:
+        self._per_user[user_key] = self._per_user.get(user_key, 0) + 1
+
+    def _decrement(self, user_key: Hashable) -> None:
+        remaining = self._per_user.pop(user_key) - 1
+        if remaining:
+            self._per_user[user_key] = remaining
+
+    def retry_after(self) -> int:
+        backlog = (len(self._queue) + self._active) / max(1, self.max_concurrent)
+        return max(1, math.ceil(backlog * self._avg_service_seconds))
+
+
+_parse_admission: AdmissionController | None = None
+_parse_admission_lock = threading.Lock()
+
+
+def parse_admission() -> AdmissionController:
+    """Process-wide controller for the parse endpoint, configured by PARSE_ADMISSION."""
+    global _parse_admission
+    with _parse_admission_lock:
+        if _parse_admission is None:
+            config = getattr(settings, "PARSE_ADMISSION", {})
+            _parse_admission = AdmissionController(
+                max_concurrent=config.get("MAX_CONCURRENT", 4),
+                max_queue=config.get("MAX_QUEUE", 16),
+                queue_timeout=config.get("QUEUE_TIMEOUT", 10.0),
+                per_user_limit=config.get("PER_USER_LIMIT", 2),
+            )
+        return _parse_admission
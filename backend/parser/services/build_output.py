@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Callable, Dict, Any, List, Sequence
+from typing import Callable, Dict, Any, Iterable, List, Sequence, Set, Tuple
 
 from .section_splitter import split_sections
 from .extract_contact import extract_contact
@@ -9,64 +9,257 @@ from .extract_skills import extract_skills
 from .extract_education import extract_education
 from .extract_experience import extract_experience
 from .extract_projects import extract_projects
-from .resume_health import score_resume
+from .records import Contact, ParsedResume, Project, Skills
+from .resume_health import HEALTH_RULES, score_resume
+from .deadline import Deadline
+from .section_cache import MISSING, SectionCache, section_cache as default_section_cache, stage_key
+from .taxonomy import pinned_taxonomy
 
 
 SectionSplitter = Callable[[Sequence[str]], Dict[str, List[str]]]
-ContactExtractor = Callable[[Sequence[str]], Dict[str, Any]]
+ContactExtractor = Callable[[Sequence[str]], Contact]
 SectionExtractor = Callable[[Sequence[str]], Any]
-ProjectExtractor = Callable[[Sequence[str]], List[Dict[str, Any]]]
+ProjectExtractor = Callable[[Sequence[str]], List[Project]]
+
+# Section-scoped stages whose output depends only on their own section lines.
+INCREMENTAL_SECTIONS = ("education", "experience", "projects")
+
+# Top-level profile fields, in output order, and the stage producing each.
+OUTPUT_FIELDS = ("contact", "sections_found", "skills", "education", "experience", "projects", "confidence",
+                 "resume_health")
+FIELD_STAGES = {
+    "contact": "contact",
+    "confidence": "contact",
+    "sections_found": "sections",
+    "skills": "skills",
+    "education": "education",
+    "experience": "experience",
+    "projects": "projects",
+    "resume_health": "resume_health",
+}
+# Stages each stage needs to have run first. Health reads whatever its rules read.
+STAGE_DEPENDENCIES: Dict[str, Tuple[str, ...]] = {
+    "sections": (),
+    "contact": (),
+    "skills": ("sections",),
+    "education": ("sections",),
+    "experience": ("sections",),
+    "projects": ("sections",),
+    "resume_health": tuple(dict.fromkeys(FIELD_STAGES[key] for rule in HEALTH_RULES for key in rule.depends_on)),
+}
+# Fields extract_contact can fill from the head of the document alone.
+FIRST_PAGE_FIELDS = frozenset({"contact", "confidence"})
+
+
+def required_stages(fields: Iterable[str] | None = None) -> Set[str]:
+    """Every stage needed to produce ``fields`` (all fields when None)."""
+    pending = [FIELD_STAGES[name] for name in (OUTPUT_FIELDS if fields is None else fields)]
+    stages: Set[str] = set()
+    while pending:
+        stage = pending.pop()
+        if stage not in stages:
+            stages.add(stage)
+            pending.extend(STAGE_DEPENDENCIES[stage])
+    return stages
+
+
+@dataclass(slots=True)
+class PreviousParse:
+    """Sections and output of an earlier parse, reused for unchanged sections.
+
+    ``parsed`` is the stored JSON shape or a ``ParsedResume``.
+    """
+
+    sections: Dict[str, List[str]]
+    parsed: ParsedResume | Dict[str, Any]
+
+
+@dataclass(slots=True)
+class ParseOutcome:
+    """A parse result plus which stages ran and which were served from earlier work.
+
+    ``record`` is what the pipeline built; ``profile`` is its JSON shape for
+    storage and API responses.
+    """
+
+    record: ParsedResume
+    profile: Dict[str, Any]
+    recomputed: List[str]
+    reused: List[str]
+    # Sections copied from a ``PreviousParse`` (a subset of ``reused``).
+    reused_sections: List[str]
+    # Requested fields left out because the deadline passed first.
+    incomplete: List[str] = field(default_factory=list)
 
 
 @dataclass(slots=True)
 class ResumeParser:
-    """Composes the individual extraction steps into a single pipeline."""
+    """Composes the individual extraction steps into a single pipeline.
+
+    Stage output is memoized in ``section_cache`` keyed by the stage's input
+    lines, so re-parsing an edited resume only re-runs the stages whose
+    section changed. Pass ``section_cache=None`` to always recompute.
+    """
 
     section_splitter: SectionSplitter = split_sections
     contact_extractor: ContactExtractor = extract_contact
-    skills_extractor: Callable[[Sequence[str], Sequence[str] | None], Dict[str, Any]] = extract_skills
+    skills_extractor: Callable[[Sequence[str], Sequence[str] | None], Skills] = extract_skills
     education_extractor: SectionExtractor = extract_education
     experience_extractor: SectionExtractor = extract_experience
     projects_extractor: ProjectExtractor = extract_projects
-    health_scorer: Callable[[Dict[str, Any]], Dict[str, Any]] = score_resume
+    health_scorer: Callable[[ParsedResume], Dict[str, Any]] = score_resume
+    section_cache: SectionCache | None = default_section_cache
     _sections: Dict[str, List[str]] = field(init=False, default_factory=dict)
 
-    def parse(self, lines: Sequence[str]) -> Dict[str, Any]:
+    def parse(self, lines: Sequence[str], fields: Iterable[str] | None = None) -> Dict[str, Any]:
+        return self.parse_with_report(lines, fields=fields).profile
+
+    def parse_incremental(
+        self, lines: Sequence[str], previous: PreviousParse | None = None
+    ) -> Tuple[Dict[str, Any], List[str]]:
+        """Parse ``lines``, copying section stages whose input matches ``previous``.
+
+        Returns the profile and the names of the sections that were reused.
+        """
+        outcome = self.parse_with_report(lines, previous)
+        return outcome.profile, outcome.reused_sections
+
+    def parse_with_report(
+        self,
+        lines: Sequence[str],
+        previous: PreviousParse | None = None,
+        fields: Iterable[str] | None = None,
+        deadline: Deadline | None = None,
+    ) -> ParseOutcome:
+        """Parse ``lines`` and report which stages were recomputed.
+
+        With ``fields``, the profile holds only those ``OUTPUT_FIELDS`` and
+        only the stages they need (see ``STAGE_DEPENDENCIES``) are run.
+
+        Stages not started by ``deadline`` are skipped, unless cached or taken
+        from ``previous``; the fields they would have filled are listed under
+        ``incomplete`` in the profile and in its ``resume_health``.
+
+        Contact reads the whole document, and so does skills when there is no
+        skills section; those stages are keyed by every line. Section stages
+        are keyed by their own lines and are also taken from ``previous``
+        when its section is identical.
+
+        Every stage sees the same taxonomy version, even if it is reloaded
+        mid-parse.
+        """
+        with pinned_taxonomy():
+            return self._parse_with_report(lines, previous, fields, deadline)
+
+    def _parse_with_report(
+        self,
+        lines: Sequence[str],
+        previous: PreviousParse | None,
+        fields: Iterable[str] | None,
+        deadline: Deadline | None,
+    ) -> ParseOutcome:
         normalized_lines = list(lines)
-        self._sections = self.section_splitter(normalized_lines)
-
-        contact = self.contact_extractor(normalized_lines)
-        skills_section_lines = self._sections.get("skills")
-        skills = self.skills_extractor(normalized_lines, skills_section_lines)
-
-        education = self.education_extractor(self._section_lines("education"))
-        experience = self.experience_extractor(self._section_lines("experience"))
-        projects = self.projects_extractor(self._section_lines("projects"))
-
-        profile: Dict[str, Any] = {
-            "contact": {
-                "name": contact.get("name"),
-                "email": contact.get("email"),
-                "phone": contact.get("phone"),
-                "links": contact.get("links"),
-            },
-            "sections_found": [*self._sections.keys()],
-            "skills": skills,
-            "education": education,
-            "experience": experience,
-            "projects": projects,
-            "confidence": contact.get("confidence", {}),
+        wanted = OUTPUT_FIELDS if fields is None else [name for name in OUTPUT_FIELDS if name in set(fields)]
+        stages = required_stages(wanted)
+        deadline = deadline or Deadline()
+        recomputed: List[str] = []
+        reused: List[str] = []
+        reused_sections: List[str] = []
+
+        def run(stage: str, func: Callable[..., Any], key_lines: Sequence[str], *args: Any) -> Any:
+            """Stage output from the cache or ``func``; ``MISSING`` once the deadline has passed."""
+            key = stage_key(stage, func, key_lines) if self.section_cache is not None else None
+            if key is not None:
+                value = self.section_cache.get(key)
+                if value is not MISSING:
+                    reused.append(stage)
+                    return value
+            if deadline.expired:
+                return MISSING
+            value = func(*args)
+            recomputed.append(stage)
+            if key is not None:
+                self.section_cache.put(key, value)
+            return value
+
+        self._sections = {}
+        split = "sections" in stages and not deadline.expired
+        if split:
+            self._sections = self.section_splitter(normalized_lines)
+
+        record = ParsedResume()
+        if "contact" in stages:
+            contact = run("contact", self.contact_extractor, normalized_lines, normalized_lines)
+            if contact is not MISSING:
+                record.contact = contact
+                record.confidence = contact.confidence
+        if split:
+            record.sections_found = [*self._sections.keys()]
+        if "skills" in stages and split:
+            skills_section_lines = self._sections.get("skills")
+            skills = run(
+                "skills",
+                self.skills_extractor,
+                # extract_skills only reads the whole document without a skills section.
+                skills_section_lines or normalized_lines,
+                normalized_lines,
+                skills_section_lines,
+            )
+            if skills is not MISSING:
+                record.skills = skills
+
+        extractors = {
+            "education": self.education_extractor,
+            "experience": self.experience_extractor,
+            "projects": self.projects_extractor,
         }
+        previous_record = ParsedResume.coerce(previous.parsed) if previous is not None else None
+        for name in INCREMENTAL_SECTIONS:
+            if name not in stages or not split:
+                continue
+            section_lines = _section_or_unknown(self._sections, name)
+            if (
+                previous_record is not None
+                and getattr(previous_record, name) is not None
+                and _section_or_unknown(previous.sections, name) == section_lines
+            ):
+                setattr(record, name, getattr(previous_record, name))
+                reused.append(name)
+                reused_sections.append(name)
+                continue
+            value = run(name, extractors[name], section_lines, section_lines)
+            if value is not MISSING:
+                setattr(record, name, value)
+
+        record.incomplete = [name for name in wanted if name != "resume_health" and getattr(record, name) is None]
+        if "resume_health" in stages:
+            # Scoring reads the assembled record and is cheap, so it always
+            # runs; a partial record gets a summary saying what it lacks.
+            health = self.health_scorer(record)
+            if record.incomplete:
+                health = {**health, "incomplete": record.incomplete}
+            record.resume_health = health
+            recomputed.append("resume_health")
+
+        profile = record.to_dict()
+        if fields is not None:
+            profile = {name: profile[name] for name in [*wanted, "incomplete"] if name in profile}
+        return ParseOutcome(
+            record=record,
+            profile=profile,
+            recomputed=recomputed,
+            reused=reused,
+            reused_sections=reused_sections,
+            incomplete=record.incomplete,
+        )
 
-        profile["resume_health"] = self.health_scorer(profile)
-        return profile
 
-    def _section_lines(self, name: str) -> List[str]:
-        section = self._sections.get(name)
-        if section:
-            return section
-        # Fallback to unknown content when explicit headers are missing.
-        return self._sections.get("unknown", [])
+def _section_or_unknown(sections: Dict[str, List[str]], name: str) -> List[str]:
+    section = sections.get(name)
+    if section:
+        return section
+    # Fallback to unknown content when explicit headers are missing.
+    return sections.get("unknown", [])
 
 
 def parse_resume(lines: List[str]) -> Dict[str, Any]:
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import math
+import time
+from dataclasses import dataclass
+
+
+class DeadlineExceeded(Exception):
+    """Raised by steps that cannot return partial output once the budget is spent."""
+
+    def __init__(self, step: str):
+        super().__init__(f"Time budget exhausted before {step} finished.")
+        self.step = step
+
+
+@dataclass(slots=True, frozen=True)
+class Deadline:
+    """A point on the monotonic clock by which a request should be done.
+
+    ``expires_at=None`` never expires, so callers can thread one through
+    unconditionally.
+    """
+
+    expires_at: float | None = None
+
+    @classmethod
+    def after(cls, seconds: float | None) -> "Deadline":
+        return cls(None if seconds is None else time.monotonic() + seconds)
+
+    def remaining(self) -> float:
+        if self.expires_at is None:
+            return math.inf
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+    def check(self, step: str) -> None:
+        if self.expired:
+            raise DeadlineExceeded(step)
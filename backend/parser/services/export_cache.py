@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict
+
+from django.conf import settings
+from django.core.cache import caches
+
+from parser.compression import encode, supported_codings
+from parser.services.profile_export import ResumeProfileExporter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+    import json
+
+
+@dataclass(slots=True)
+class CachedExport:
+    exports: Dict[str, Any]
+    body: bytes
+
+
+def _dumps(payload: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+@dataclass(slots=True)
+class ExportCache:
+    """Caches profile exports per resume revision.
+
+    Entries are keyed by resume id plus ``updated_at`` and ``parser_version``,
+    so any save or re-parse of the resume naturally misses the old entry.
+    Only the rendered body is stored on a miss; :meth:`encoded` compresses it
+    the first time a client asks for a coding and caches that variant beside it.
+    """
+
+    exporter: ResumeProfileExporter = field(default_factory=ResumeProfileExporter)
+
+    def get(self, resume) -> CachedExport:
+        cache = self._cache()
+        key = self.key(resume)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+        exports = self.exporter.export(resume.parsed_data)
+        body = _dumps({"resume_id": resume.pk, "profile_exports": exports})
+        cached = CachedExport(exports=exports, body=body)
+        cache.set(key, cached, getattr(settings, "EXPORT_CACHE_TIMEOUT", 3600))
+        return cached
+
+    def encoded(self, resume, coding: str, body: bytes) -> bytes:
+        """``body`` (this revision's cached export) compressed with ``coding``."""
+        cache = self._cache()
+        key = f"{self.key(resume)}:{coding}"
+        content = cache.get(key)
+        if content is None:
+            content = encode(body, coding, static=True)
+            cache.set(key, content, getattr(settings, "EXPORT_CACHE_TIMEOUT", 3600))
+        return content
+
+    def carry_over(self, previous_key: str, resume) -> None:
+        """Keep the entry cached under ``previous_key`` for ``resume``'s new revision.
+
+        For saves that leave every ``EXPORT_INPUTS`` key of parsed_data untouched.
+        """
+        cache = self._cache()
+        key = self.key(resume)
+        previous = [previous_key] + [f"{previous_key}:{coding}" for coding in supported_codings()]
+        found = cache.get_many(previous)
+        if previous_key in found:
+            carried = {key + name[len(previous_key):]: value for name, value in found.items()}
+            cache.set_many(carried, getattr(settings, "EXPORT_CACHE_TIMEOUT", 3600))
+
+    def exports(self, resume) -> Dict[str, Any]:
+        return self.get(resume).exports
+
+    def key(self, resume) -> str:
+        revision = resume.updated_at.timestamp() if resume.updated_at else 0
+        return f"resume-exports:{resume.pk}:{revision}:{resume.parser_version}"
+
+    @staticmethod
+    def _cache():
+        return caches[getattr(settings, "EXPORT_CACHE_ALIAS", "default")]
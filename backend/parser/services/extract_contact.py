@@ -1,16 +1,15 @@
 import re
-from typing import Any, Dict, Iterable
+from typing import Iterable
 
-from .section_splitter import HEADERS
+from .records import Contact, Links
+from .scanners import EMAIL_SCANNER, PHONE_SCANNER
+from .taxonomy import get_taxonomy
 
-EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
-PHONE_RE = re.compile(r"(\+?\d[\d\s().-]{7,}\d)")
 URL_RE = re.compile(r"(https?://[^\s]+|www\.[^\s]+)")
-HEADER_VARIANTS = {variant.lower() for values in HEADERS.values() for variant in values}
 
 
 def _is_header(line: str) -> bool:
-    return line.strip().lower().rstrip(":") in HEADER_VARIANTS
+    return get_taxonomy().is_header_variant(line.strip().lower().rstrip(":"))
 
 
 def _head_block(lines: Iterable[str]) -> list[str]:
@@ -25,26 +24,26 @@ def _head_block(lines: Iterable[str]) -> list[str]:
     return collected if collected else list(lines)[:30]
 
 
-def extract_contact(lines: list[str]) -> Dict[str, Any]:
+def extract_contact(lines: list[str]) -> Contact:
     scoped_lines = _head_block(lines)
     text = "\n".join(scoped_lines)
 
-    email = EMAIL_RE.search(text)
-    phone = PHONE_RE.search(text)
+    email = EMAIL_SCANNER.search(text)
+    phone = PHONE_SCANNER.search(text)
     urls = URL_RE.findall(text)
 
     email_val = email.group(0) if email else None
     phone_val = phone.group(0) if phone else None
 
-    links = {"linkedin": None, "github": None, "portfolio": None, "other": []}
+    links = Links()
     for u in urls:
         lu = u.lower()
         if "linkedin.com" in lu:
-            links["linkedin"] = u
+            links.linkedin = u
         elif "github.com" in lu:
-            links["github"] = u
+            links.github = u
         else:
-            links["other"].append(u)
+            links.other.append(u)
 
     confidence = {
         "email": 0.99 if email_val else 0.0,
@@ -71,10 +70,4 @@ def extract_contact(lines: list[str]) -> Dict[str, Any]:
                 confidence["name"] = 0.6
                 break
 
-    return {
-        "name": name,
-        "email": email_val,
-        "phone": phone_val,
-        "links": links,
-        "confidence": confidence,
-    }
+    return Contact(name=name, email=email_val, phone=phone_val, links=links, confidence=confidence)
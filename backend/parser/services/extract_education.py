@@ -1,5 +1,8 @@
 import re
-from typing import Any, Dict, List, Tuple
+from typing import List, Tuple
+
+from .records import EducationEntry
+from .scanners import EMAIL_SCANNER, PHONE_SCANNER
 
 DEGREE_RE = re.compile(
     r"(bachelor|b\.?s\.?|b\.?sc|b\.a|ba|master|m\.?s\.?|m\.?sc|m\.a|ma|mba|phd|diploma|associate|doctorate)",
@@ -7,12 +10,10 @@ DEGREE_RE = re.compile(
 )
 YEAR_RE = re.compile(r"(19\d{2}|20\d{2})")
 YEAR_RANGE_RE = re.compile(r"(19\d{2}|20\d{2})\s*[-–—]\s*(19\d{2}|20\d{2}|present|Present)")
-PHONE_RE = re.compile(r"\+?\d[\d\s().-]{7,}\d")
-EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
 
 
-def extract_education(lines: List[str]) -> List[Dict[str, Any]]:
-    entries: List[Dict[str, Any]] = []
+def extract_education(lines: List[str]) -> List[EducationEntry]:
+    entries: List[EducationEntry] = []
     if not lines:
         return entries
 
@@ -20,19 +21,20 @@ def extract_education(lines: List[str]) -> List[Dict[str, Any]]:
     for ln in lines + ["---END---"]:
         if ln == "---END---" or ln.strip() == "":
             if block:
-                entries.append(_parse_edu_block(block))
+                entry = _parse_edu_block(block)
+                if entry is not None:
+                    entries.append(entry)
                 block = []
             continue
         block.append(ln)
 
-    entries = [e for e in entries if any(v for v in e.values())]
     return entries
 
 
-def _parse_edu_block(block: List[str]) -> Dict[str, Any]:
+def _parse_edu_block(block: List[str]) -> EducationEntry | None:
     text = " ".join(block)
-    text = EMAIL_RE.sub("", text)
-    text = PHONE_RE.sub("", text)
+    text = EMAIL_SCANNER.sub("", text)
+    text = PHONE_SCANNER.sub("", text)
     lower_text = text.lower()
 
     start_year, end_year = _years_from_text(lower_text)
@@ -40,15 +42,9 @@ def _parse_edu_block(block: List[str]) -> Dict[str, Any]:
     school = _guess_school(block)
 
     if not (degree or school or start_year or end_year):
-        return {}
-
-    return {
-        "school": school,
-        "degree": degree,
-        "field": field,
-        "start_year": start_year,
-        "end_year": end_year,
-    }
+        return None
+
+    return EducationEntry(school=school, degree=degree, field=field, start_year=start_year, end_year=end_year)
 
 
 def _years_from_text(text: str) -> Tuple[str | None, str | None]:
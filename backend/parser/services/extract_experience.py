@@ -1,18 +1,21 @@
 import re
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
+
+from .line_cache import line_cache
+from .records import ExperienceEntry
+from .scanners import DATE_RANGE_SCANNER, ScanMatch
 
-MONTH_RE = r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)\w*"
-DATE_VALUE_RE = rf"(?:{MONTH_RE}\s+\d{{4}}|\d{{4}})"
-DATE_RANGE_RE = re.compile(rf"(?P<start>{DATE_VALUE_RE})\s*[-–—]\s*(?P<end>present|{DATE_VALUE_RE})", re.I)
 COMPANY_HINT_RE = re.compile(r"\b(inc|llc|ltd|corp|company|technologies|solutions|systems)\b", re.I)
+# Every date range starts with a year; lines without four digits are not scanned.
+YEAR_HINT_RE = re.compile(r"\d{4}")
 
 
-def extract_experience(lines: List[str]) -> List[Dict[str, Any]]:
+def extract_experience(lines: List[str]) -> List[ExperienceEntry]:
     if not lines:
         return []
 
-    entries: List[Dict[str, Any]] = []
-    current: Dict[str, Any] | None = None
+    entries: List[ExperienceEntry] = []
+    current: ExperienceEntry | None = None
 
     for raw_line in lines:
         ln = raw_line.strip()
@@ -21,19 +24,18 @@ def extract_experience(lines: List[str]) -> List[Dict[str, Any]]:
 
         if ln.startswith("-"):
             if current is None:
-                current = _blank_entry()
+                current = ExperienceEntry()
             bullet = ln.lstrip("-").strip()
             if bullet:
-                current["highlights"].append(bullet)
+                current.highlights.append(bullet)
             continue
 
-        date_match = DATE_RANGE_RE.search(ln)
+        date_spans = line_cache.lookup("dates", ln, _date_spans) if YEAR_HINT_RE.search(ln) else None
+        date_match = ScanMatch(ln, date_spans) if date_spans else None
         if date_match:
             if current and _has_data(current):
                 entries.append(current)
-            current = _blank_entry()
-            current["start_date"] = date_match.group("start")
-            current["end_date"] = date_match.group("end")
+            current = ExperienceEntry(start_date=date_match.group("start"), end_date=date_match.group("end"))
 
             # Preserve role/company/location text that appears on the same line.
             prefix = ln[:date_match.start()].strip(" -|,")
@@ -44,22 +46,22 @@ def extract_experience(lines: List[str]) -> List[Dict[str, Any]]:
             continue
 
         if current is None:
-            current = _blank_entry()
+            current = ExperienceEntry()
 
         if ("|" in ln or " - " in ln or " — " in ln or "," in ln) and (
-            current["title"] is None or current["company"] is None or current["location"] is None
+            current.title is None or current.company is None or current.location is None
         ):
             _apply_role_company_location(current, ln)
             continue
 
-        if current["title"] is None and len(ln.split()) <= 8:
-            current["title"] = ln
+        if current.title is None and len(ln.split()) <= 8:
+            current.title = ln
             continue
-        if current["company"] is None and len(ln.split()) <= 10:
-            current["company"] = ln
+        if current.company is None and len(ln.split()) <= 10:
+            current.company = ln
             continue
-        if current["location"] is None and len(ln.split()) <= 6:
-            current["location"] = ln
+        if current.location is None and len(ln.split()) <= 6:
+            current.location = ln
 
     if current and _has_data(current):
         entries.append(current)
@@ -67,22 +69,16 @@ def extract_experience(lines: List[str]) -> List[Dict[str, Any]]:
     return [entry for entry in entries if _has_data(entry)]
 
 
-def _blank_entry() -> Dict[str, Any]:
-    return {
-        "title": None,
-        "company": None,
-        "start_date": None,
-        "end_date": None,
-        "location": None,
-        "highlights": [],
-    }
+def _date_spans(line: str) -> Dict[Any, Tuple[int, int]] | None:
+    match = DATE_RANGE_SCANNER.search(line)
+    return match.spans if match else None
 
 
-def _has_data(entry: Dict[str, Any]) -> bool:
-    return any([entry.get("title"), entry.get("company"), entry.get("highlights"), entry.get("start_date")])
+def _has_data(entry: ExperienceEntry) -> bool:
+    return bool(entry.title or entry.company or entry.highlights or entry.start_date)
 
 
-def _apply_role_company_location(entry: Dict[str, Any], line: str) -> None:
+def _apply_role_company_location(entry: ExperienceEntry, line: str) -> None:
     separator = None
     for candidate in ("|", " — ", " - ", ","):
         if candidate in line:
@@ -99,15 +95,15 @@ def _apply_role_company_location(entry: Dict[str, Any], line: str) -> None:
     second = parts[1] if len(parts) > 1 else None
     third = parts[2] if len(parts) > 2 else None
 
-    if entry["title"] is None:
+    if entry.title is None:
         if second and COMPANY_HINT_RE.search(first) and not COMPANY_HINT_RE.search(second):
-            entry["company"] = first
-            entry["title"] = second
+            entry.company = first
+            entry.title = second
         else:
-            entry["title"] = first
+            entry.title = first
 
-    if second and entry["company"] is None:
-        entry["company"] = second if second != entry["title"] else None
+    if second and entry.company is None:
+        entry.company = second if second != entry.title else None
 
-    if third and entry["location"] is None:
-        entry["location"] = third
+    if third and entry.location is None:
+        entry.location = third
@@ -1,27 +1,21 @@
 from __future__ import annotations
 
 import re
-from typing import Any, Dict, List
+from typing import List, Tuple
 
-try:
-    from .extract_skills import SKILLS
-except ImportError:  # pragma: no cover - defensive
-    SKILLS = {}
+from .extract_skills import skill_hits
+from .line_cache import line_cache
+from .records import Project
 
 URL_RE = re.compile(r"(https?://[^\s]+|www\.[^\s]+)", re.I)
-_TECH_LOOKUP = {
-    value.lower(): value
-    for items in SKILLS.values()
-    for value in items
-}
 
 
-def extract_projects(lines: List[str] | None) -> List[Dict[str, Any]]:
+def extract_projects(lines: List[str] | None) -> List[Project]:
     if not lines:
         return []
 
-    projects: List[Dict[str, Any]] = []
-    current = _blank_project()
+    projects: List[Project] = []
+    current = Project()
 
     for raw in (*lines, "---END---"):
         line = raw.strip()
@@ -31,81 +25,68 @@ def extract_projects(lines: List[str] | None) -> List[Dict[str, Any]]:
             break
 
         if not line:
-            if _has_data(current):
+            if current.has_data():
                 _commit(projects, current)
-                current = _blank_project()
+                current = Project()
             continue
 
-        urls = URL_RE.findall(line)
-        if urls:
-            current["links"].extend(urls)
-            remainder = URL_RE.sub("", line).strip(" -–—|:")
+        lowered = line.lower()
+        # Only lines that can hold a URL are scanned (and cached).
+        spans = line_cache.lookup("urls", line, _url_spans) if "http" in lowered or "www." in lowered else ()
+        if spans:
+            current.links.extend(line[start:end] for start, end in spans)
+            remainder = _without_spans(line, spans).strip(" -–—|:")
             if remainder:
-                if current["name"] is None:
-                    current["name"] = remainder
+                if current.name is None:
+                    current.name = remainder
                 else:
-                    current["summary"] = f"{current['summary']} {remainder}".strip() if current["summary"] else remainder
-                current["tech_stack"].extend(_extract_stack(remainder))
+                    current.summary = f"{current.summary} {remainder}".strip() if current.summary else remainder
+                current.tech_stack.extend(_extract_stack(remainder))
             continue
 
         if line.startswith(tuple("-*•")):
             detail = line.lstrip("-*• ").strip()
             if detail:
-                current["highlights"].append(detail)
-                current["tech_stack"].extend(_extract_stack(detail))
+                current.highlights.append(detail)
+                current.tech_stack.extend(_extract_stack(detail))
             continue
 
-        lowered = line.lower()
         if any(lowered.startswith(prefix) for prefix in ("tech", "stack", "tools", "skills")) and ":" in line:
-            current["tech_stack"].extend(_extract_stack(line))
+            current.tech_stack.extend(_extract_stack(line))
             continue
 
-        if current["name"] is None:
-            current["name"] = line.rstrip(":")
-            current["tech_stack"].extend(_extract_stack(line))
+        if current.name is None:
+            current.name = line.rstrip(":")
+            current.tech_stack.extend(_extract_stack(line))
             continue
 
-        current["summary"] = f"{current['summary']} {line}".strip() if current["summary"] else line
-        current["tech_stack"].extend(_extract_stack(line))
+        current.summary = f"{current.summary} {line}".strip() if current.summary else line
+        current.tech_stack.extend(_extract_stack(line))
 
     return projects
 
 
-def _blank_project() -> Dict[str, Any]:
-    return {
-        "name": None,
-        "summary": None,
-        "highlights": [],
-        "tech_stack": [],
-        "links": [],
-    }
+def _commit(collection: List[Project], project: Project) -> None:
+    if not project.has_data():
+        return
 
+    project.tech_stack = sorted(set(project.tech_stack))
+    project.links = sorted(set(project.links))
+    collection.append(project)
 
-def _has_data(project: Dict[str, Any]) -> bool:
-    return any(
-        [
-            project["name"],
-            project["summary"],
-            project["highlights"],
-            project["tech_stack"],
-            project["links"],
-        ]
-    )
 
+def _url_spans(line: str) -> Tuple[Tuple[int, int], ...]:
+    return tuple(match.span() for match in URL_RE.finditer(line))
 
-def _commit(collection: List[Dict[str, Any]], project: Dict[str, Any]) -> None:
-    if not _has_data(project):
-        return
 
-    project["tech_stack"] = sorted(set(project["tech_stack"]))
-    project["links"] = sorted(set(project["links"]))
-    collection.append(project)
+def _without_spans(line: str, spans: Tuple[Tuple[int, int], ...]) -> str:
+    parts, last = [], 0
+    for start, end in spans:
+        parts.append(line[last:start])
+        last = end
+    parts.append(line[last:])
+    return "".join(parts)
 
 
 def _extract_stack(text: str) -> List[str]:
-    lower = text.lower()
-    found = set()
-    for key, display in _TECH_LOOKUP.items():
-        if re.search(rf"(^|[^a-z0-9]){re.escape(key)}([^a-z0-9]|$)", lower):
-            found.add(display)
-    return sorted(found)
+    return sorted({display for _, display in skill_hits(text)})
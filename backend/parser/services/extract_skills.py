@@ -1,33 +1,41 @@
-import json
-import os
-import re
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
-def _load_skills() -> Dict[str, List[str]]:
-    here = os.path.dirname(__file__)
-    data_path = os.path.join(os.path.dirname(here), "data", "skills.json")
-    with open(data_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+from .line_cache import line_cache
+from .records import Skills
+from .taxonomy import get_taxonomy, normalize_skill
 
-SKILLS = _load_skills()
+# Words taken from each side of a line break when matching across it; enough
+# for terms of up to JOIN_WORDS + 1 words ("Google Cloud\nPlatform").
+JOIN_WORDS = 3
 
-def _normalize(s: str) -> str:
-    return re.sub(r"\s+", " ", s.strip().lower())
 
-def extract_skills(all_lines: list[str], section_lines: list[str] | None = None) -> dict:
-    # Prefer skills section if exists; fallback to all lines
-    lines = section_lines if section_lines else all_lines
-    text = " ".join(lines)
-    text_norm = _normalize(text)
+def skill_hits(text: str) -> Tuple[Tuple[str, str], ...]:
+    """``(category, canonical skill)`` pairs matched in ``text``, memoized per normalized line."""
+    taxonomy = get_taxonomy()
+    return line_cache.lookup(
+        "skills", normalize_skill(text), lambda norm: tuple(taxonomy.match_skills(norm)), taxonomy.fingerprint
+    )
 
-    found: Dict[str, List[str]] = {k: [] for k in SKILLS.keys()}
 
-    for cat, items in SKILLS.items():
-        for it in items:
-            it_norm = _normalize(it)
-            # word boundary-ish match
-            if re.search(rf"(^|[^a-z0-9]){re.escape(it_norm)}([^a-z0-9]|$)", text_norm):
+def extract_skills(all_lines: list[str], section_lines: list[str] | None = None) -> Skills:
+    # Prefer skills section if exists; fallback to all lines
+    lines = section_lines if section_lines else all_lines
+    taxonomy = get_taxonomy()
+
+    found: Dict[str, List[str]] = {k: [] for k in taxonomy.categories()}
+
+    # word boundary-ish match of each skill and alias, reported as the canonical skill;
+    # lines are matched one by one so repeated lines are served from the line cache,
+    # plus the words around each line break for terms wrapped onto the next line
+    previous: list[str] = []
+    for line in lines:
+        for cat, it in skill_hits(line):
+            found[cat].append(it)
+        words = line.split()
+        if previous and words:
+            for cat, it in skill_hits(" ".join(previous[-JOIN_WORDS:] + words[:JOIN_WORDS])):
                 found[cat].append(it)
+        previous = words
 
     # dedupe
     for cat in found:
@@ -35,4 +43,4 @@ def extract_skills(all_lines: list[str], section_lines: list[str] | None = None)
 
     confidence = 0.75 if any(found[cat] for cat in found) else 0.0
 
-    return {"categories": found, "confidence": confidence}
+    return Skills(categories=found, confidence=confidence)
@@ -1,10 +1,15 @@
+"""Plain text of uploaded PDF and DOCX resumes.
+
+``pdfplumber`` and ``python-docx`` are imported on first use, so management
+commands and processes that never read a document do not pay for them.
+"""
+
 from __future__ import annotations
 
 import io
 from typing import Literal
 
-import pdfplumber
-from docx import Document
+from .deadline import Deadline
 
 AllowedFileTypes = Literal["pdf", "docx"]
 
@@ -13,27 +18,50 @@ def _get_ext(filename: str) -> str:
     return filename.split(".")[-1] if "." in filename else ""
 
 
-def extract_text(filename: str, file_bytes: bytes) -> str:
+def extract_text(
+    filename: str, file_bytes: bytes, max_pages: int | None = None, deadline: Deadline | None = None
+) -> str:
+    """Plain text of a PDF or DOCX, optionally only its first ``max_pages`` pages.
+
+    Raises ``DeadlineExceeded`` if ``deadline`` passes between pages: partial
+    text would be stored as if it were the whole document.
+    """
     ext = _get_ext(filename).lower()
+    deadline = deadline or Deadline()
     if ext == "pdf":
-        return _extract_pdf(file_bytes)
+        return _extract_pdf(file_bytes, max_pages, deadline)
     if ext == "docx":
-        return _extract_docx(file_bytes)
+        return _extract_docx(file_bytes, max_pages, deadline)
     raise ValueError(f"Unsupported file type: {ext}")
 
 
-def _extract_pdf(file_bytes: bytes) -> str:
+def _extract_pdf(file_bytes: bytes, max_pages: int | None = None, deadline: Deadline = Deadline()) -> str:
+    import pdfplumber
+
     text_parts: list[str] = []
     with pdfplumber.open(io.BytesIO(file_bytes)) as pdf:
-        for page in pdf.pages:
+        for page in pdf.pages[:max_pages]:
+            deadline.check("extract_text")
             page_text = page.extract_text() or ""
             text_parts.append(page_text)
     return "\n".join(text_parts).strip()
 
 
-def _extract_docx(file_bytes: bytes) -> str:
+def _extract_docx(file_bytes: bytes, max_pages: int | None = None, deadline: Deadline = Deadline()) -> str:
+    from docx import Document
+
     document = Document(io.BytesIO(file_bytes))
-    text_parts = [paragraph.text for paragraph in document.paragraphs]
+    deadline.check("extract_text")
+    text_parts = []
+    pages = 1
+    for paragraph in document.paragraphs:
+        # Only page breaks Word rendered when saving are known; other files read in full.
+        breaks = paragraph.rendered_page_breaks if max_pages is not None else []
+        if breaks and pages + len(breaks) > max_pages:
+            text_parts.append(breaks[max_pages - pages].preceding_paragraph_fragment.text)
+            break
+        pages += len(breaks)
+        text_parts.append(paragraph.text)
 
     # include cell text so tables do not get dropped entirely
     for table in document.tables:
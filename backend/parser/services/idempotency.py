@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, Iterator
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from parser.models import IdempotencyKey
+
+MAX_KEY_LENGTH = 255
+
+
+class IdempotencyKeyInProgress(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = "A request with this Idempotency-Key is still being processed."
+    default_code = "idempotency_in_progress"
+
+
+class IdempotencyKeyReused(APIException):
+    status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+    default_detail = "This Idempotency-Key was already used with a different request."
+    default_code = "idempotency_key_reused"
+
+
+class IdempotencyStoreFull(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "Too many Idempotency-Keys are in use. Please retry shortly."
+    default_code = "idempotency_store_full"
+
+
+@dataclass(slots=True)
+class Claim:
+    """Outcome of :meth:`IdempotencyStore.claim`.
+
+    ``replayed`` is True when an earlier request with the same key finished;
+    ``status`` and ``body`` then hold the response it recorded. Otherwise the
+    caller owns the key and should record its response with :meth:`complete`.
+    """
+
+    replayed: bool
+    status: int | None = None
+    body: Any = None
+    _pk: int | None = None
+    _completed: bool = False
+
+    def complete(self, status_code: int, body: Any) -> None:
+        IdempotencyKey.objects.filter(pk=self._pk).update(response_status=status_code, response_body=body)
+        self._completed = True
+
+
+class IdempotencyStore:
+    """Idempotency keys and the responses they produced, shared by every worker.
+
+    A key is claimed by inserting an ``IdempotencyKey`` row; the unique
+    ``(user, key)`` constraint lets exactly one request, on any worker, own
+    it. Duplicates poll the row until the owner records its response, which
+    they then replay verbatim. Only successful outcomes are kept: if the owner
+    raises, the row is deleted so a retry can run the work again.
+
+    Keys expire ``IDEMPOTENCY_KEY_TTL`` seconds after they are claimed. A key
+    still in flight is never dropped to make room: once ``max_entries``
+    unexpired keys exist, new claims are refused with a 503. (An in-flight
+    claim older than the TTL can only belong to a worker that died, and is
+    expired like any other.) Expired rows are ignored on lookup and deleted
+    by each process at most every ``IDEMPOTENCY_CLEANUP_INTERVAL`` seconds,
+    not on every claim.
+    """
+
+    def __init__(self, max_entries: int | None = None, poll_interval: float = 0.05):
+        self._max_entries = max_entries
+        self.poll_interval = poll_interval
+        self._next_cleanup = 0.0
+
+    @property
+    def max_entries(self) -> int:
+        if self._max_entries is not None:
+            return self._max_entries
+        return getattr(settings, "IDEMPOTENCY_MAX_KEYS", 100_000)
+
+    @contextmanager
+    def claim(self, user_id: int, key: str, fingerprint: str) -> Iterator[Claim]:
+        wait_until = time.monotonic() + getattr(settings, "IDEMPOTENCY_WAIT_TIMEOUT", 30.0)
+        self._cleanup()
+        while True:
+            pk = self._insert(user_id, key, fingerprint)
+            if pk is not None:
+                break
+            existing = IdempotencyKey.objects.filter(user_id=user_id, key=key).first()
+            if existing is None:
+                # The owner failed and released the key; try to claim it again.
+                continue
+            if existing.created_at < self._cutoff():
+                # Expired but not cleaned up yet: release it and claim afresh.
+                IdempotencyKey.objects.filter(pk=existing.pk, created_at=existing.created_at).delete()
+                continue
+            if existing.fingerprint != fingerprint:
+                raise IdempotencyKeyReused()
+            if existing.response_status is not None:
+                yield Claim(replayed=True, status=existing.response_status, body=existing.response_body)
+                return
+            # A concurrent duplicate waits for the in-flight request.
+            if time.monotonic() >= wait_until:
+                raise IdempotencyKeyInProgress()
+            time.sleep(self.poll_interval)
+
+        claim = Claim(replayed=False, _pk=pk)
+        try:
+            yield claim
+        finally:
+            if not claim._completed:
+                IdempotencyKey.objects.filter(pk=pk, response_status__isnull=True).delete()
+
+    def clear(self) -> None:
+        IdempotencyKey.objects.all().delete()
+
+    def _insert(self, user_id: int, key: str, fingerprint: str) -> int | None:
+        """Primary key of a newly claimed row, or None when the key is already claimed."""
+        if self._is_full():
+            if not IdempotencyKey.objects.filter(user_id=user_id, key=key).exists():
+                raise IdempotencyStoreFull()
+            return None
+        try:
+            with transaction.atomic():
+                row = IdempotencyKey.objects.create(
+                    user_id=user_id, key=key, fingerprint=fingerprint, created_at=timezone.now()
+                )
+        except IntegrityError:
+            return None
+        return row.pk
+
+    def _is_full(self) -> bool:
+        """True once ``max_entries`` unexpired keys exist, without counting them all.
+
+        Keys are numbered in claim order, so the id span from the oldest
+        unexpired key to the newest bounds their number from above; only when
+        that span reaches the cap is the exact (LIMIT-bounded) query run.
+        """
+        unexpired = IdempotencyKey.objects.filter(created_at__gte=self._cutoff())
+        oldest = unexpired.order_by("created_at").values_list("pk", flat=True).first()
+        if oldest is None:
+            return False
+        newest = IdempotencyKey.objects.order_by("-pk").values_list("pk", flat=True).first()
+        if newest - oldest + 1 < self.max_entries:
+            return False
+        return unexpired.order_by().values("pk")[self.max_entries - 1 : self.max_entries].exists()
+
+    def _cleanup(self) -> None:
+        now = time.monotonic()
+        if now < self._next_cleanup:
+            return
+        self._next_cleanup = now + getattr(settings, "IDEMPOTENCY_CLEANUP_INTERVAL", 300.0)
+        self._delete_expired()
+
+    def _delete_expired(self) -> None:
+        IdempotencyKey.objects.filter(created_at__lt=self._cutoff()).delete()
+
+    @staticmethod
+    def _cutoff():
+        return timezone.now() - timedelta(seconds=getattr(settings, "IDEMPOTENCY_KEY_TTL", 24 * 3600))
+
+
+idempotency_store = IdempotencyStore()
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Tuple
+
+from django.conf import settings
+
+# Bytes charged per entry on top of its line and value: the OrderedDict slot,
+# its link node and the key tuple.
+ENTRY_OVERHEAD = 200
+# Bytes charged per item of a cached tuple or dict: a pair of short strings or
+# ints (a skill hit, a span) and the tuple holding them.
+ITEM_BYTES = 160
+
+
+def footprint(value: Any) -> int:
+    """Approximate bytes held by a cached value: ``None``, or a tuple or dict of small pairs.
+
+    An estimate rather than a walk over the value, which would cost as much as
+    the cheaper extractors it saves.
+    """
+    size = sys.getsizeof(value)
+    if type(value) is tuple or type(value) is dict:
+        size += ITEM_BYTES * len(value)
+    return size
+
+
+def _hit_rate(hits: int, misses: int) -> float:
+    return round(hits / (hits + misses), 4) if hits + misses else 0.0
+
+
+class LineCache:
+    """Process-local LRU of per-line extractor output, bounded by memory.
+
+    Resumes built from the same template repeat many lines (stock skill
+    lists, date lines, project links). Extractors look those lines up here by
+    ``kind`` (what was extracted) and the normalized line, whose hash ``str``
+    caches, so every request in the worker shares the work. Unlike
+    ``SectionCache`` values are not pickled: callers store only immutable
+    values (tuples, or dicts they never mutate). Sized by
+    ``PARSER_LINE_CACHE_BYTES``; 0 disables it.
+    """
+
+    def __init__(self, max_bytes: int | None = None):
+        self._max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[str, str, str], Tuple[Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits: Dict[str, int] = {}
+        self.misses: Dict[str, int] = {}
+
+    @property
+    def max_bytes(self) -> int:
+        if self._max_bytes is not None:
+            return self._max_bytes
+        return getattr(settings, "PARSER_LINE_CACHE_BYTES", 4 * 1024 * 1024)
+
+    def lookup(self, kind: str, line: str, compute: Callable[[str], Any], version: str = "") -> Any:
+        """``compute(line)``, cached under ``kind``, ``version`` and ``line``.
+
+        ``line`` must already be normalized the way ``compute`` would; pass the
+        taxonomy version for output that depends on it.
+        """
+        max_bytes = self.max_bytes
+        if max_bytes <= 0:
+            return compute(line)
+        key = (kind, version, line)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits[kind] = self.hits.get(kind, 0) + 1
+                return entry[0]
+            self.misses[kind] = self.misses.get(kind, 0) + 1
+
+        value = compute(line)
+        size = ENTRY_OVERHEAD + sys.getsizeof(line) + footprint(value)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.bytes -= previous[1]
+            self._entries[key] = (value, size)
+            self.bytes += size
+            while self.bytes > max_bytes and self._entries:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.bytes -= evicted
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+            self.hits = {}
+            self.misses = {}
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            hits, misses = sum(self.hits.values()), sum(self.misses.values())
+            kinds = {}
+            for kind in sorted({*self.hits, *self.misses}):
+                kind_hits, kind_misses = self.hits.get(kind, 0), self.misses.get(kind, 0)
+                kinds[kind] = {"hits": kind_hits, "misses": kind_misses, "hit_rate": _hit_rate(kind_hits, kind_misses)}
+            return {
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": _hit_rate(hits, misses),
+                "kinds": kinds,
+            }
+
+
+line_cache = LineCache()
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from .taxonomy import is_superseded, taxonomy_version
+
+# Bump whenever extractor behaviour changes in a way that should refresh
+# previously parsed resumes.
+PARSER_REVISION = 2
+
+
+def current_parser_version() -> str:
+    """Version stamp for output produced by the current extractors and taxonomy.
+
+    Follows the taxonomy version, so it changes when the taxonomy is reloaded.
+    """
+    return f"{PARSER_REVISION}-{taxonomy_version()}"
+
+
+def is_older_version(stored: str, other_taxonomies: bool = False) -> bool:
+    """Whether output stamped ``stored`` predates the parser this process runs.
+
+    Revisions compare as numbers, and stamps without one (partial parses) are
+    always older. Taxonomy fingerprints have no order, so at the same
+    revision ``stored`` is older only when this process has reloaded away
+    from its taxonomy, or, with ``other_taxonomies``, whenever it differs.
+    Without that flag a worker that has not picked up a new taxonomy yet
+    never re-parses rows another worker has already moved to it.
+    """
+    revision, _, fingerprint = stored.partition("-")
+    try:
+        stored_revision = int(revision)
+    except ValueError:
+        return True
+    if stored_revision != PARSER_REVISION:
+        return stored_revision < PARSER_REVISION
+    if fingerprint == taxonomy_version():
+        return False
+    return other_taxonomies or is_superseded(fingerprint)
@@ -1,58 +1,70 @@
 import re
-from typing import List
+from typing import Iterator, List
 
-from .section_splitter import HEADERS
+from .deadline import Deadline
+from .taxonomy import get_taxonomy
 
 BULLETS= ['•', '-', '*', '‣', '◦', '▪', '_', '·']
-HEADER_VARIANTS = {variant.lower() for values in HEADERS.values() for variant in values}
 BROKEN_HEADER_RE = re.compile(r"^(?:[A-Za-z]\s+){2,}[A-Za-z]$")
 NAME_TOKEN_RE = re.compile(r"^[A-Za-z][A-Za-z'.-]{0,18}$")
 
+# Character folds applied before line splitting: carriage returns become line
+# breaks, bullets "-" and tabs spaces, so the line scanner only has to look for
+# "\n" and " ". Each fold is a C-level str.replace that is skipped when the
+# character is absent; str.translate with a table falls off CPython's ASCII
+# fast path on any non-ASCII text and is an order of magnitude slower here.
+FOLDS = (("\r", "\n"), ("\t", " "), *((bullet, "-") for bullet in BULLETS if bullet != "-"))
+SPACES_RE = re.compile(r" {2,}")
 
-def _looks_like_header(line: str) -> bool:
-    normalized = line.strip().lower().rstrip(":")
-    return normalized in HEADER_VARIANTS
 
+def _is_name_line(line: str) -> bool:
+    # A name token has no whitespace, so it is the whole (stripped) line and
+    # the header check needs no further normalizing.
+    return NAME_TOKEN_RE.match(line) is not None and not get_taxonomy().is_header_variant(line.lower())
 
-def _can_merge_name_lines(cur: str, nxt: str) -> bool:
-    if _looks_like_header(cur) or _looks_like_header(nxt):
-        return False
-    cur_tokens = cur.split()
-    nxt_tokens = nxt.split()
-    if len(cur_tokens) != 1 or len(nxt_tokens) != 1:
-        return False
-    return bool(NAME_TOKEN_RE.match(cur_tokens[0]) and NAME_TOKEN_RE.match(nxt_tokens[0]))
 
-def preprocess(raw_text: str) -> List[str]:
+def _fold(text: str) -> str:
+    for char, replacement in FOLDS:
+        if char in text:
+            text = text.replace(char, replacement)
+    return text
+
+
+def _clean_lines(text: str) -> Iterator[str]:
+    """Stripped, non-empty lines with space runs collapsed and spaced-out headers rejoined."""
+    for line in text.split("\n"):
+        line = line.strip()
+        if not line:
+            continue
+        if "  " in line:
+            line = SPACES_RE.sub(" ", line)
+        # "S K I L L S": a letter followed by whitespace is the cheap prefix test.
+        if line[1:2].isspace() and BROKEN_HEADER_RE.match(line):
+            line = line.replace(" ", "")
+        yield line
+
+
+def normalize_lines(raw_text: str) -> Iterator[str]:
+    """Yield finished preprocess lines, merging two single-token name lines into one."""
+    pending = None
+    pending_is_name = False
+    for line in _clean_lines(_fold(raw_text)):
+        is_name = _is_name_line(line)
+        if pending is None:
+            pending, pending_is_name = line, is_name
+        elif pending_is_name and is_name:
+            yield f"{pending} {line}"
+            pending = None
+        else:
+            yield pending
+            pending, pending_is_name = line, is_name
+    if pending is not None:
+        yield pending
+
+
+def preprocess(raw_text: str, deadline: Deadline | None = None) -> List[str]:
     if not raw_text:
         return []
-    
-    text = raw_text.replace('\r','\n')
-    for b in BULLETS:
-        text = text.replace(b, '-')
-
-    text=re.sub(r"[ \t]+", " ", text)
-    text=re.sub(r"\n{3,}", "\n\n", text)
-
-    lines = [ln.strip() for ln in text.split("\n")]
-    lines = [ln for ln in lines if ln]
-
-    def _unsplit(line: str) -> str:
-        if BROKEN_HEADER_RE.match(line):
-            return line.replace(" ", "")
-        return line
-
-    lines = [_unsplit(ln) for ln in lines]
-
-    joined: list[str] = []
-    i=0
-    while i < len(lines):
-        cur = lines[i]
-        nxt = lines[i+1] if i+1 < len(lines) else ""
-        if cur and nxt and _can_merge_name_lines(cur, nxt):
-            joined.append(cur + " " +nxt)
-            i += 2
-        else:
-            joined.append(cur)
-            i += 1
-    return joined
+    if deadline is not None:
+        deadline.check("preprocess")
+    return list(normalize_lines(raw_text))
@@ -3,27 +3,36 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Dict, List
 
+from .records import EducationEntry, ExperienceEntry, ParsedResume, Project, Skills
+
+# Top-level parsed_data keys the exports are built from.
+EXPORT_INPUTS = ("contact", "skills", "experience", "projects", "education")
 
 @dataclass(slots=True)
 class ResumeProfileExporter:
-    """Builds platform-specific profile text from parsed resume data."""
+    """Builds platform-specific profile text from parsed resume data.
+
+    Every builder takes a ``ParsedResume`` or the stored ``parsed_data`` dict.
+    """
 
-    def export(self, parsed_data: Dict[str, Any]) -> Dict[str, Any]:
+    def export(self, parsed_data: ParsedResume | Dict[str, Any]) -> Dict[str, Any]:
+        resume = ParsedResume.coerce(parsed_data)
         return {
-            "cv_markdown": self.build_cv_markdown(parsed_data),
-            "github_readme": self.build_github_readme(parsed_data),
+            "cv_markdown": self.build_cv_markdown(resume),
+            "github_readme": self.build_github_readme(resume),
         }
 
-    def build_cv_markdown(self, parsed_data: Dict[str, Any]) -> str:
-        contact = parsed_data.get("contact", {})
-        name = contact.get("name") or "Your Name"
-        email = contact.get("email")
-        phone = contact.get("phone")
-        links = contact.get("links") or {}
-        skills = parsed_data.get("skills", {}).get("categories", {})
-        experience = parsed_data.get("experience", [])
-        projects = parsed_data.get("projects", [])
-        education = parsed_data.get("education", [])
+    def build_cv_markdown(self, parsed_data: ParsedResume | Dict[str, Any]) -> str:
+        resume = ParsedResume.coerce(parsed_data)
+        contact = resume.contact
+        name = (contact and contact.name) or "Your Name"
+        email = contact and contact.email
+        phone = contact and contact.phone
+        links = contact.links if contact else None
+        skills = _categories(resume.skills)
+        experience = resume.experience or []
+        projects = resume.projects or []
+        education = resume.education or []
 
         lines: List[str] = [f"# {name}", ""]
 
@@ -32,16 +41,14 @@ class ResumeProfileExporter:
             contact_parts.append(str(email))
         if phone:
             contact_parts.append(str(phone))
-        if links.get("linkedin"):
-            contact_parts.append(f"LinkedIn: {links['linkedin']}")
-        if links.get("github"):
-            contact_parts.append(f"GitHub: {links['github']}")
+        if links and links.linkedin:
+            contact_parts.append(f"LinkedIn: {links.linkedin}")
+        if links and links.github:
+            contact_parts.append(f"GitHub: {links.github}")
 
-        other_links = links.get("other", [])
-        if isinstance(other_links, list):
-            for link in other_links:
-                if link:
-                    contact_parts.append(str(link))
+        for link in links.other if links else ():
+            if link:
+                contact_parts.append(str(link))
 
         if contact_parts:
             lines.extend([" | ".join(contact_parts), ""])
@@ -49,11 +56,11 @@ class ResumeProfileExporter:
         if experience:
             lines.append("## Experience")
             for item in experience:
-                title = item.get("title") or "Role"
-                company = item.get("company") or "Company"
-                start = item.get("start_date") or ""
-                end = item.get("end_date") or "Present"
-                location = item.get("location") or ""
+                title = item.title or "Role"
+                company = item.company or "Company"
+                start = item.start_date or ""
+                end = item.end_date or "Present"
+                location = item.location or ""
 
                 details = " • ".join([part for part in [f"{start} - {end}".strip(" -"), location] if part])
                 if details:
@@ -61,33 +68,32 @@ class ResumeProfileExporter:
                 else:
                     lines.append(f"### {title}, {company}")
 
-                for highlight in item.get("highlights", []):
+                for highlight in item.highlights:
                     lines.append(f"- {highlight}")
                 lines.append("")
 
         if projects:
             lines.append("## Projects")
             for item in projects:
-                project_name = item.get("name") or "Project"
-                summary = item.get("summary") or ""
+                project_name = item.name or "Project"
+                summary = item.summary or ""
                 lines.append(f"### {project_name}")
                 if summary:
                     lines.append(summary)
-                for highlight in item.get("highlights", []):
+                for highlight in item.highlights:
                     lines.append(f"- {highlight}")
-                project_links = item.get("links") or []
-                if project_links:
-                    lines.append(f"- Link: {project_links[0]}")
+                if item.links:
+                    lines.append(f"- Link: {item.links[0]}")
                 lines.append("")
 
         if education:
             lines.append("## Education")
             for item in education:
-                school = item.get("school") or "Institution"
-                degree = item.get("degree") or "Degree"
-                field = item.get("field")
-                start_year = item.get("start_year") or ""
-                end_year = item.get("end_year") or ""
+                school = item.school or "Institution"
+                degree = item.degree or "Degree"
+                field = item.field
+                start_year = item.start_year or ""
+                end_year = item.end_year or ""
 
                 degree_line = degree
                 if field:
@@ -106,14 +112,15 @@ class ResumeProfileExporter:
 
         return "\n".join(lines).strip()
 
-    def build_github_readme(self, parsed_data: Dict[str, Any]) -> str:
-        contact = parsed_data.get("contact", {})
-        name = contact.get("name") or "Your Name"
-        email = contact.get("email")
-        links = contact.get("links") or {}
-        skills = parsed_data.get("skills", {}).get("categories", {})
-        experience = parsed_data.get("experience", [])
-        projects = parsed_data.get("projects", [])
+    def build_github_readme(self, parsed_data: ParsedResume | Dict[str, Any]) -> str:
+        resume = ParsedResume.coerce(parsed_data)
+        contact = resume.contact
+        name = (contact and contact.name) or "Your Name"
+        email = contact and contact.email
+        links = contact.links if contact else None
+        skills = _categories(resume.skills)
+        experience = resume.experience or []
+        projects = resume.projects or []
 
         lines: List[str] = [
             f"# {name}",
@@ -126,11 +133,11 @@ class ResumeProfileExporter:
 
         if email:
             lines.append(f"- Email: {email}")
-        if links.get("linkedin"):
-            lines.append(f"- LinkedIn: {links['linkedin']}")
-        if links.get("github"):
-            lines.append(f"- GitHub: {links['github']}")
-        for url in links.get("other", []):
+        if links and links.linkedin:
+            lines.append(f"- LinkedIn: {links.linkedin}")
+        if links and links.github:
+            lines.append(f"- GitHub: {links.github}")
+        for url in links.other if links else ():
             lines.append(f"- Portfolio/Other: {url}")
 
         lines.extend(["", "## Skills"])
@@ -142,35 +149,35 @@ class ResumeProfileExporter:
         if experience:
             lines.extend(["", "## Experience"])
             for item in experience:
-                title = item.get("title") or "Role"
-                company = item.get("company") or "Company"
+                title = item.title or "Role"
+                company = item.company or "Company"
                 lines.append(f"### {title} - {company}")
-                for highlight in item.get("highlights", [])[:3]:
+                for highlight in item.highlights[:3]:
                     lines.append(f"- {highlight}")
                 lines.append("")
 
         if projects:
             lines.extend(["## Projects"])
             for project in projects:
-                name = project.get("name") or "Project"
-                summary = project.get("summary") or ""
+                name = project.name or "Project"
+                summary = project.summary or ""
                 lines.append(f"### {name}")
                 if summary:
                     lines.append(summary)
-                for highlight in project.get("highlights", [])[:3]:
+                for highlight in project.highlights[:3]:
                     lines.append(f"- {highlight}")
-                if project.get("links"):
-                    lines.append(f"- Link: {project['links'][0]}")
+                if project.links:
+                    lines.append(f"- Link: {project.links[0]}")
                 lines.append("")
 
         return "\n".join(lines).strip()
 
-    def build_linkedin_profile(self, parsed_data: Dict[str, Any]) -> Dict[str, Any]:
-        contact = parsed_data.get("contact", {})
-        skills = parsed_data.get("skills", {}).get("categories", {})
-        experience = parsed_data.get("experience", [])
-        projects = parsed_data.get("projects", [])
-        education = parsed_data.get("education", [])
+    def build_linkedin_profile(self, parsed_data: ParsedResume | Dict[str, Any]) -> Dict[str, Any]:
+        resume = ParsedResume.coerce(parsed_data)
+        skills = _categories(resume.skills)
+        experience = resume.experience or []
+        projects = resume.projects or []
+        education = resume.education or []
 
         top_skills = self._flatten_top_skills(skills)
         latest_role = self._latest_role(experience)
@@ -179,7 +186,7 @@ class ResumeProfileExporter:
         about = self._build_about(latest_role, top_skills, projects)
 
         return {
-            "name": contact.get("name"),
+            "name": resume.contact.name if resume.contact else None,
             "headline": headline,
             "about": about,
             "experience": self._linkedin_experience(experience),
@@ -198,12 +205,12 @@ class ResumeProfileExporter:
                     return flattened
         return flattened
 
-    def _latest_role(self, experience: List[Dict[str, Any]]) -> Dict[str, Any]:
-        return experience[0] if experience else {}
+    def _latest_role(self, experience: List[ExperienceEntry]) -> ExperienceEntry:
+        return experience[0] if experience else ExperienceEntry()
 
-    def _build_headline(self, latest_role: Dict[str, Any], skills: List[str]) -> str:
-        title = latest_role.get("title")
-        company = latest_role.get("company")
+    def _build_headline(self, latest_role: ExperienceEntry, skills: List[str]) -> str:
+        title = latest_role.title
+        company = latest_role.company
         core_skills = " | ".join(skills[:3]) if skills else "Software Engineering"
 
         if title and company:
@@ -214,13 +221,13 @@ class ResumeProfileExporter:
 
     def _build_about(
         self,
-        latest_role: Dict[str, Any],
+        latest_role: ExperienceEntry,
         skills: List[str],
-        projects: List[Dict[str, Any]],
+        projects: List[Project],
     ) -> str:
-        role = latest_role.get("title") or "software professional"
-        highlights = latest_role.get("highlights", [])
-        project_names = [p.get("name") for p in projects if p.get("name")]
+        role = latest_role.title or "software professional"
+        highlights = latest_role.highlights
+        project_names = [p.name for p in projects if p.name]
         skill_text = ", ".join(skills[:8]) if skills else "modern software tools"
 
         lines = [
@@ -236,44 +243,37 @@ class ResumeProfileExporter:
         lines.append("I enjoy collaborating across teams and continuously improving delivery quality.")
         return " ".join(lines)
 
-    def _linkedin_experience(self, experience: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _linkedin_experience(self, experience: List[ExperienceEntry]) -> List[Dict[str, Any]]:
         ready: List[Dict[str, Any]] = []
         for item in experience:
             ready.append(
                 {
-                    "title": item.get("title"),
-                    "company": item.get("company"),
-                    "start_date": item.get("start_date"),
-                    "end_date": item.get("end_date") or "Present",
-                    "location": item.get("location"),
-                    "description_bullets": item.get("highlights", [])[:5],
+                    "title": item.title,
+                    "company": item.company,
+                    "start_date": item.start_date,
+                    "end_date": item.end_date or "Present",
+                    "location": item.location,
+                    "description_bullets": item.highlights[:5],
                 }
             )
         return ready
 
-    def _linkedin_projects(self, projects: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _linkedin_projects(self, projects: List[Project]) -> List[Dict[str, Any]]:
         ready: List[Dict[str, Any]] = []
         for item in projects:
             ready.append(
                 {
-                    "name": item.get("name"),
-                    "description": item.get("summary"),
-                    "highlights": item.get("highlights", [])[:3],
-                    "url": (item.get("links") or [None])[0],
+                    "name": item.name,
+                    "description": item.summary,
+                    "highlights": item.highlights[:3],
+                    "url": (item.links or [None])[0],
                 }
             )
         return ready
 
-    def _linkedin_education(self, education: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        ready: List[Dict[str, Any]] = []
-        for item in education:
-            ready.append(
-                {
-                    "school": item.get("school"),
-                    "degree": item.get("degree"),
-                    "field": item.get("field"),
-                    "start_year": item.get("start_year"),
-                    "end_year": item.get("end_year"),
-                }
-            )
-        return ready
+    def _linkedin_education(self, education: List[EducationEntry]) -> List[Dict[str, Any]]:
+        return [item.to_dict() for item in education]
+
+
+def _categories(skills: Skills | None) -> Dict[str, List[str]]:
+    return skills.categories if skills else {}
@@ -0,0 +1,326 @@
+"""Vectorized ranking of a user's resumes against a job description.
+
+Each user's resumes are held in an in-process :class:`ResumeRankIndex`:
+
+* a sparse binary ``rows x skills`` matrix over the ``skills.json``
+  vocabulary of the active taxonomy version, built from
+  ``parsed_data["skills"]`` (so manual edits count), and
+* a sparse matrix of L2-normalised, hashed ``raw_text`` term frequencies.
+
+Both are kept as parallel row/column (and value) arrays, so memory follows
+the skills and terms a user's resumes actually have, not the vocabulary size.
+A query is scored against every row with a handful of NumPy operations.
+Rows are recomputed one at a time on resume writes (see ``parser.signals``);
+the matrices are re-concatenated lazily on the next query. Before scoring,
+the index is reconciled with the database by ``(pk, updated_at,
+parser_version)`` so writes made by other worker processes are picked up,
+and rebuilt from scratch when a taxonomy reload changed the vocabulary.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import zlib
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+from django.conf import settings
+
+from parser.models import Resume
+from parser.services.extract_skills import extract_skills
+from parser.services.preprocess import preprocess
+from parser.services.taxonomy import get_taxonomy, pinned_taxonomy
+
+TERM_BUCKETS = 1 << 18
+TERM_RE = re.compile(r"[a-z][a-z0-9+#.]*[a-z0-9+#]|[a-z]")
+SKILL_WEIGHT = 0.6
+CATEGORY_WEIGHT = 0.1
+TERM_WEIGHT = 0.3
+
+@dataclass(frozen=True, slots=True)
+class SkillVocabulary:
+    """Skill matrix columns for one taxonomy version."""
+
+    version: str
+    entries: List[Tuple[str, str]]
+    columns: Dict[Tuple[str, str], int]
+    categories: List[str]
+    # Category position of each column, used to give partial credit for related skills.
+    category_of: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+_vocabulary: SkillVocabulary | None = None
+_vocabulary_lock = threading.Lock()
+
+
+def skill_vocabulary() -> SkillVocabulary:
+    """The vocabulary of the current taxonomy, rebuilt once per taxonomy version."""
+    global _vocabulary
+    taxonomy = get_taxonomy()
+    vocabulary = _vocabulary
+    if vocabulary is not None and vocabulary.version == taxonomy.fingerprint:
+        return vocabulary
+    with _vocabulary_lock:
+        if _vocabulary is None or _vocabulary.version != taxonomy.fingerprint:
+            entries = [(category, skill) for category, skill, _ in taxonomy.skills()]
+            categories = taxonomy.categories()
+            positions = {category: position for position, category in enumerate(categories)}
+            _vocabulary = SkillVocabulary(
+                version=taxonomy.fingerprint,
+                entries=entries,
+                columns={entry: column for column, entry in enumerate(entries)},
+                categories=categories,
+                category_of=np.fromiter(
+                    (positions[category] for category, _ in entries), dtype=np.int32, count=len(entries)
+                ),
+            )
+        return _vocabulary
+
+
+def skill_indices(skills: Dict[str, Any] | None, vocabulary: SkillVocabulary | None = None) -> np.ndarray:
+    """Sorted vocabulary columns of the skills in ``skills`` (all weighted 1)."""
+    vocabulary = vocabulary or skill_vocabulary()
+    columns = set()
+    categories = (skills or {}).get("categories") or {}
+    for category, items in categories.items():
+        for item in items or []:
+            column = vocabulary.columns.get((category, item))
+            if column is not None:
+                columns.add(column)
+    return np.fromiter(sorted(columns), dtype=np.int32, count=len(columns))
+
+
+def term_counts(text: str) -> Counter:
+    buckets: Counter = Counter()
+    for term in TERM_RE.findall(text.lower()):
+        buckets[zlib.crc32(term.encode("utf-8")) % TERM_BUCKETS] += 1
+    return buckets
+
+
+def term_vector(text: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Sorted bucket indices and L2-normalised log-scaled term frequencies."""
+    counts = term_counts(text)
+    if not counts:
+        return np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.float32)
+    indices = np.fromiter(sorted(counts), dtype=np.int32, count=len(counts))
+    data = np.log1p(np.fromiter((counts[index] for index in indices), dtype=np.float32, count=len(counts)))
+    return indices, data / np.linalg.norm(data)
+
+
+def _sorted_lookup(keys: np.ndarray, values: np.ndarray, wanted: np.ndarray) -> np.ndarray:
+    """``values`` for each of ``wanted`` in sorted ``keys``, 0 where absent."""
+    if not len(keys):
+        return np.zeros(len(wanted), dtype=values.dtype)
+    positions = np.minimum(np.searchsorted(keys, wanted), len(keys) - 1)
+    return np.where(keys[positions] == wanted, values[positions], 0)
+
+
+@dataclass(slots=True)
+class _Row:
+    stamp: Tuple[Any, str]
+    file_name: str
+    skill_indices: np.ndarray
+    term_indices: np.ndarray
+    term_data: np.ndarray
+
+
+@dataclass(slots=True)
+class ResumeRankIndex:
+    user_id: int
+    _rows: Dict[int, _Row] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+    _dirty: bool = True
+    _pks: np.ndarray | None = None
+    _file_names: List[str] = field(default_factory=list)
+    _skill_rows: np.ndarray | None = None
+    _skill_indices: np.ndarray | None = None
+    _term_rows: np.ndarray | None = None
+    _term_indices: np.ndarray | None = None
+    _term_data: np.ndarray | None = None
+    _df_buckets: np.ndarray | None = None
+    _df_counts: np.ndarray | None = None
+    _vocabulary: SkillVocabulary | None = None
+
+    def upsert(self, resume: Resume) -> None:
+        with self._lock:
+            vocabulary = self._vocabulary = self._vocabulary or skill_vocabulary()
+        indices, data = term_vector(resume.raw_text or "")
+        row = _Row(
+            stamp=(resume.updated_at, resume.parser_version),
+            file_name=resume.file_name,
+            skill_indices=skill_indices((resume.parsed_data or {}).get("skills"), vocabulary),
+            term_indices=indices,
+            term_data=data,
+        )
+        with self._lock:
+            # Rows built against a vocabulary ``sync`` has since replaced are
+            # dropped; the next sync indexes them again.
+            if self._vocabulary is vocabulary:
+                self._rows[resume.pk] = row
+                self._dirty = True
+
+    def remove(self, pk: int) -> None:
+        with self._lock:
+            if self._rows.pop(pk, None) is not None:
+                self._dirty = True
+
+    def sync(self) -> None:
+        """Re-index rows written elsewhere and drop rows deleted elsewhere.
+
+        After a taxonomy reload changed the skill vocabulary, every row is
+        re-indexed.
+        """
+        vocabulary = skill_vocabulary()
+        with self._lock:
+            if self._vocabulary is not vocabulary:
+                self._vocabulary = vocabulary
+                self._rows.clear()
+                self._dirty = True
+        stamps = {
+            pk: (updated_at, parser_version)
+            for pk, updated_at, parser_version in Resume.objects.filter(user_id=self.user_id).values_list(
+                "pk", "updated_at", "parser_version"
+            )
+        }
+        with self._lock:
+            removed = [pk for pk in self._rows if pk not in stamps]
+            changed = [pk for pk, stamp in stamps.items() if pk not in self._rows or self._rows[pk].stamp != stamp]
+        for pk in removed:
+            self.remove(pk)
+        for start in range(0, len(changed), 500):
+            fields = ("pk", "file_name", "raw_text", "parsed_data", "updated_at", "parser_version")
+            for resume in Resume.objects.filter(pk__in=changed[start:start + 500]).only(*fields):
+                self.upsert(resume)
+
+    def rank(self, job_description: str, top_k: int = 10) -> Dict[str, Any]:
+        lines = preprocess(job_description)
+        query_terms = term_counts(job_description)
+
+        with self._lock:
+            if self._dirty:
+                self._rebuild()
+            pks, vocabulary = self._pks, self._vocabulary
+            skill_rows, skill_columns = self._skill_rows, self._skill_indices
+            term_rows, term_indices, term_data = self._term_rows, self._term_indices, self._term_data
+            df_buckets, df_counts = self._df_buckets, self._df_counts
+            file_names = self._file_names
+
+        wanted = skill_indices(extract_skills(lines).to_dict(), vocabulary)
+        total = len(pks)
+        result: Dict[str, Any] = {
+            "total": total,
+            "query_skills": [vocabulary.entries[column][1] for column in wanted],
+            "results": [],
+        }
+        if not total:
+            return result
+
+        skill_score = np.zeros(total, dtype=np.float32)
+        category_score = np.zeros(total, dtype=np.float32)
+        if len(wanted):
+            is_wanted = np.zeros(len(vocabulary), dtype=bool)
+            is_wanted[wanted] = True
+            matched = is_wanted[skill_columns]
+            skill_score = np.bincount(skill_rows[matched], minlength=total) / len(wanted)
+            # Share of the query's categories each row has any skill in.
+            wanted_categories = np.unique(vocabulary.category_of[wanted])
+            slot = np.full(len(vocabulary.categories), -1, dtype=np.int64)
+            slot[wanted_categories] = np.arange(len(wanted_categories))
+            slots = slot[vocabulary.category_of[skill_columns]]
+            related = slots >= 0
+            covered = np.zeros((total, len(wanted_categories)), dtype=bool)
+            covered[skill_rows[related], slots[related]] = True
+            category_score = covered.sum(axis=1) / len(wanted_categories)
+
+        term_score = np.zeros(total, dtype=np.float32)
+        if query_terms:
+            # Query terms are IDF-weighted against this user's resumes.
+            query = np.zeros(TERM_BUCKETS, dtype=np.float32)
+            buckets = np.fromiter(query_terms, dtype=np.int64, count=len(query_terms))
+            frequencies = np.fromiter(query_terms.values(), dtype=np.float32, count=len(query_terms))
+            idf = np.log((total + 1) / (_sorted_lookup(df_buckets, df_counts, buckets) + 1)) + 1
+            weights = np.log1p(frequencies) * idf
+            query[buckets] = weights / np.linalg.norm(weights)
+            term_score = np.bincount(term_rows, weights=term_data * query[term_indices], minlength=total)
+
+        score = SKILL_WEIGHT * skill_score + CATEGORY_WEIGHT * category_score + TERM_WEIGHT * term_score
+        top_k = max(1, min(top_k, total))
+        top = np.argpartition(-score, top_k - 1)[:top_k]
+        top = top[np.lexsort((-pks[top], -score[top]))]
+
+        bounds = np.searchsorted(skill_rows, np.stack([top, top + 1]))
+        for position, start, end in zip(top.tolist(), *bounds.tolist()):
+            has_skill = np.isin(wanted, skill_columns[start:end], assume_unique=True)
+            result["results"].append({
+                "resume_id": int(pks[position]),
+                "file_name": file_names[position],
+                "score": round(float(score[position]), 4),
+                "skill_score": round(float(skill_score[position]), 4),
+                "term_score": round(float(term_score[position]), 4),
+                "matched_skills": [vocabulary.entries[column][1] for column in wanted[has_skill]],
+                "missing_skills": [vocabulary.entries[column][1] for column in wanted[~has_skill]],
+            })
+        return result
+
+    def _rebuild(self) -> None:
+        self._vocabulary = self._vocabulary or skill_vocabulary()
+        pks = sorted(self._rows)
+        rows = [self._rows[pk] for pk in pks]
+        lengths = np.fromiter((len(row.term_indices) for row in rows), dtype=np.int64, count=len(rows))
+        skill_lengths = np.fromiter((len(row.skill_indices) for row in rows), dtype=np.int64, count=len(rows))
+        self._pks = np.asarray(pks, dtype=np.int64)
+        self._file_names = [row.file_name for row in rows]
+        self._skill_rows = np.repeat(np.arange(len(rows), dtype=np.int32), skill_lengths)
+        self._skill_indices = (
+            np.concatenate([row.skill_indices for row in rows]) if rows else np.zeros(0, dtype=np.int32)
+        )
+        self._term_rows = np.repeat(np.arange(len(rows)), lengths)
+        self._term_indices = (
+            np.concatenate([row.term_indices for row in rows]) if rows else np.zeros(0, dtype=np.int32)
+        )
+        self._term_data = np.concatenate([row.term_data for row in rows]) if rows else np.zeros(0, dtype=np.float32)
+        # Each row's indices are unique, so occurrence counts are document frequencies.
+        self._df_buckets, self._df_counts = np.unique(self._term_indices, return_counts=True)
+        self._dirty = False
+
+
+class RankIndexRegistry:
+    """Per-process LRU of user rank indexes (``RANK_INDEX_MAX_USERS``)."""
+
+    def __init__(self):
+        self._indexes: "OrderedDict[int, ResumeRankIndex]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def for_user(self, user_id: int) -> ResumeRankIndex:
+        with self._lock:
+            index = self._indexes.get(user_id)
+            if index is None:
+                index = self._indexes[user_id] = ResumeRankIndex(user_id=user_id)
+                while len(self._indexes) > getattr(settings, "RANK_INDEX_MAX_USERS", 64):
+                    self._indexes.popitem(last=False)
+            self._indexes.move_to_end(user_id)
+        return index
+
+    def loaded(self, user_id: int) -> ResumeRankIndex | None:
+        with self._lock:
+            return self._indexes.get(user_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._indexes.clear()
+
+
+rank_indexes = RankIndexRegistry()
+
+
+def rank_resumes(user, job_description: str, top_k: int = 10) -> Dict[str, Any]:
+    index = rank_indexes.for_user(user.pk)
+    with pinned_taxonomy():
+        index.sync()
+        return index.rank(job_description, top_k=top_k)
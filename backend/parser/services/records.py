@@ -0,0 +1,224 @@
+"""Typed records for parse results.
+
+Extractors build these slotted records instead of dicts with repeated string
+keys; the parser, health rules and exporters read their attributes directly.
+``to_dict`` produces the stored/API JSON shape and ``from_dict`` reads that
+shape back, tolerating the loose forms hand-edited ``parsed_data`` may take
+(missing keys, ``null`` lists, links given as a list or a string).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+
+def _mapping(value: Any) -> Dict[str, Any]:
+    return value if isinstance(value, dict) else {}
+
+
+def _items(value: Any) -> List[Any]:
+    """A JSON list field; a single scalar counts as a one-item list."""
+    if isinstance(value, list):
+        return list(value)
+    if value is None or value == "":
+        return []
+    return [value]
+
+
+def _urls(value: Any) -> List[Any]:
+    if isinstance(value, list):
+        return list(value)
+    return [value] if isinstance(value, str) else []
+
+
+def _entries(value: Any) -> List[Dict[str, Any]]:
+    return [item for item in value if isinstance(item, dict)] if isinstance(value, list) else []
+
+
+@dataclass(slots=True)
+class Links:
+    linkedin: str | None = None
+    github: str | None = None
+    portfolio: str | None = None
+    other: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: Any) -> "Links":
+        if isinstance(data, dict):
+            return cls(data.get("linkedin"), data.get("github"), data.get("portfolio"), _urls(data.get("other")))
+        # Contact links are sometimes a bare list (or string) of URLs.
+        return cls(other=_urls(data))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"linkedin": self.linkedin, "github": self.github, "portfolio": self.portfolio, "other": self.other}
+
+
+@dataclass(slots=True)
+class Contact:
+    name: str | None = None
+    email: str | None = None
+    phone: str | None = None
+    links: Links = field(default_factory=Links)
+    # Per-field extraction confidence; stored as the profile's top-level "confidence".
+    confidence: Dict[str, float] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: Any, confidence: Any = None) -> "Contact":
+        data = _mapping(data)
+        return cls(data.get("name"), data.get("email"), data.get("phone"), Links.from_dict(data.get("links")),
+                   _mapping(confidence))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"name": self.name, "email": self.email, "phone": self.phone, "links": self.links.to_dict()}
+
+
+@dataclass(slots=True)
+class Skills:
+    categories: Dict[str, List[str]] = field(default_factory=dict)
+    confidence: float = 0.0
+
+    @classmethod
+    def from_dict(cls, data: Any) -> "Skills":
+        data = _mapping(data)
+        categories = {
+            category: [value for value in _items(values) if value]
+            for category, values in _mapping(data.get("categories")).items()
+        }
+        return cls(categories, data.get("confidence") or 0.0)
+
+    def total(self) -> int:
+        return sum(len(values) for values in self.categories.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"categories": self.categories, "confidence": self.confidence}
+
+
+@dataclass(slots=True)
+class EducationEntry:
+    school: str | None = None
+    degree: str | None = None
+    field: str | None = None
+    start_year: str | None = None
+    end_year: str | None = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EducationEntry":
+        return cls(data.get("school"), data.get("degree"), data.get("field"), data.get("start_year"),
+                   data.get("end_year"))
+
+    def has_data(self) -> bool:
+        return bool(self.school or self.degree or self.field or self.start_year or self.end_year)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"school": self.school, "degree": self.degree, "field": self.field, "start_year": self.start_year,
+                "end_year": self.end_year}
+
+
+@dataclass(slots=True)
+class ExperienceEntry:
+    title: str | None = None
+    company: str | None = None
+    start_date: str | None = None
+    end_date: str | None = None
+    location: str | None = None
+    highlights: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ExperienceEntry":
+        return cls(data.get("title"), data.get("company"), data.get("start_date"), data.get("end_date"),
+                   data.get("location"), _items(data.get("highlights")))
+
+    def has_data(self) -> bool:
+        return bool(self.title or self.company or self.start_date or self.end_date or self.location
+                    or self.highlights)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"title": self.title, "company": self.company, "start_date": self.start_date,
+                "end_date": self.end_date, "location": self.location, "highlights": self.highlights}
+
+
+@dataclass(slots=True)
+class Project:
+    name: str | None = None
+    summary: str | None = None
+    highlights: List[str] = field(default_factory=list)
+    tech_stack: List[str] = field(default_factory=list)
+    links: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Project":
+        return cls(data.get("name"), data.get("summary"), _items(data.get("highlights")),
+                   _items(data.get("tech_stack")), _items(data.get("links")))
+
+    def has_data(self) -> bool:
+        return bool(self.name or self.summary or self.highlights or self.tech_stack or self.links)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"name": self.name, "summary": self.summary, "highlights": self.highlights,
+                "tech_stack": self.tech_stack, "links": self.links}
+
+
+@dataclass(slots=True)
+class ParsedResume:
+    """A whole parse result. Fields that were not produced are ``None``.
+
+    ``to_dict`` emits only the produced fields, in ``build_output.OUTPUT_FIELDS``
+    order with ``incomplete`` (when non-empty) before ``resume_health``.
+    """
+
+    contact: Contact | None = None
+    sections_found: List[str] | None = None
+    skills: Skills | None = None
+    education: List[EducationEntry] | None = None
+    experience: List[ExperienceEntry] | None = None
+    projects: List[Project] | None = None
+    confidence: Dict[str, float] | None = None
+    incomplete: List[str] = field(default_factory=list)
+    resume_health: Dict[str, Any] | None = None
+
+    @classmethod
+    def from_dict(cls, data: Any) -> "ParsedResume":
+        data = _mapping(data)
+        return cls(
+            contact=Contact.from_dict(data["contact"], data.get("confidence")) if "contact" in data else None,
+            sections_found=_items(data["sections_found"]) if "sections_found" in data else None,
+            skills=Skills.from_dict(data["skills"]) if "skills" in data else None,
+            education=_records(EducationEntry, data, "education"),
+            experience=_records(ExperienceEntry, data, "experience"),
+            projects=_records(Project, data, "projects"),
+            confidence=_mapping(data["confidence"]) if "confidence" in data else None,
+            incomplete=_items(data.get("incomplete")),
+            resume_health=data.get("resume_health"),
+        )
+
+    @classmethod
+    def coerce(cls, profile: "ParsedResume | Dict[str, Any]") -> "ParsedResume":
+        return profile if isinstance(profile, ParsedResume) else cls.from_dict(profile)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {}
+        if self.contact is not None:
+            data["contact"] = self.contact.to_dict()
+        if self.sections_found is not None:
+            data["sections_found"] = self.sections_found
+        if self.skills is not None:
+            data["skills"] = self.skills.to_dict()
+        for name in ("education", "experience", "projects"):
+            entries = getattr(self, name)
+            if entries is not None:
+                data[name] = [entry.to_dict() for entry in entries]
+        if self.confidence is not None:
+            data["confidence"] = self.confidence
+        if self.incomplete:
+            data["incomplete"] = self.incomplete
+        if self.resume_health is not None:
+            data["resume_health"] = self.resume_health
+        return data
+
+
+def _records(record_type: Any, data: Dict[str, Any], key: str) -> List[Any] | None:
+    if key not in data:
+        return None
+    return [record_type.from_dict(item) for item in _entries(data[key])]
+
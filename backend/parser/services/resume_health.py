@@ -1,93 +1,162 @@
 import re
-from typing import Any, Dict, List
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Set, Tuple
+
+from .records import Links, ParsedResume
 
 NUMBERS_RE = re.compile(r"\b\d+(?:\.\d+)?%?\b")
 
+# Bump whenever scoring rules or weights change so stored scores can be
+# recomputed with `manage.py rescore_resumes`.
+HEALTH_RULES_VERSION = 1
+
+
+@dataclass(slots=True, frozen=True)
+class HealthRule:
+    """One scoring check; ``depends_on`` lists the top-level profile keys it reads."""
+
+    name: str
+    depends_on: Tuple[str, ...]
+    check: Callable[[ParsedResume], Dict[str, Any]]
+
+
+def _result(points: int = 0, strengths=(), warnings=(), suggestions=()) -> Dict[str, Any]:
+    return {
+        "points": points,
+        "strengths": list(strengths),
+        "warnings": list(warnings),
+        "suggestions": list(suggestions),
+    }
+
+
+def _check_name(resume: ParsedResume) -> Dict[str, Any]:
+    if resume.contact and resume.contact.name:
+        return _result(5, strengths=["Name detected"])
+    return _result(warnings=["Missing name"], suggestions=["Include your full name at the top of the resume."])
+
+
+def _check_email(resume: ParsedResume) -> Dict[str, Any]:
+    if resume.contact and resume.contact.email:
+        return _result(12, strengths=["Email detected"])
+    return _result(warnings=["Missing email"], suggestions=["Add a professional email address."])
+
+
+def _check_phone(resume: ParsedResume) -> Dict[str, Any]:
+    if resume.contact and resume.contact.phone:
+        return _result(6, strengths=["Phone number detected"])
+    return _result(warnings=["Missing phone number"], suggestions=["Add a reachable phone number."])
 
-def score_resume(profile: Dict[str, Any]) -> Dict[str, Any]:
-    data = _unwrap_profile(profile)
-    score = 0
-    warnings: List[str] = []
-    strengths: List[str] = []
-    suggestions: List[str] = []
-
-    contact = data.get("contact", {}) if isinstance(data.get("contact"), dict) else {}
-    skills_categories = _skills_categories(data.get("skills"))
-    education = data.get("education") if isinstance(data.get("education"), list) else []
-    experience = data.get("experience") if isinstance(data.get("experience"), list) else []
-
-    if contact.get("name"):
-        score += 5
-        strengths.append("Name detected")
-    else:
-        warnings.append("Missing name")
-        suggestions.append("Include your full name at the top of the resume.")
-
-    if contact.get("email"):
-        score += 12
-        strengths.append("Email detected")
-    else:
-        warnings.append("Missing email")
-        suggestions.append("Add a professional email address.")
-
-    if contact.get("phone"):
-        score += 6
-        strengths.append("Phone number detected")
-    else:
-        warnings.append("Missing phone number")
-        suggestions.append("Add a reachable phone number.")
-
-    total_skills = sum(len(values) for values in skills_categories.values())
+
+def _check_skills(resume: ParsedResume) -> Dict[str, Any]:
+    total_skills = resume.skills.total() if resume.skills else 0
     if total_skills >= 8:
-        score += 20
-        strengths.append("Skills section looks strong")
-    elif total_skills > 0:
-        score += 10
-        warnings.append("Skills list is short")
-        suggestions.append("Add more relevant skills (tools, frameworks, databases).")
-    else:
-        warnings.append("Skills not detected")
-        suggestions.append("Add a Skills section with clear keywords (e.g., React, Django, MySQL).")
-
-    if _has_meaningful_entries(education):
-        score += 15
-        strengths.append("Education detected")
-    else:
-        warnings.append("Education not detected")
-        suggestions.append("Add Education details (school, degree, years).")
-
-    if _has_meaningful_entries(experience):
-        score += 20
-        strengths.append("Experience detected")
-        highlights_text = " ".join(
-            " ".join(item.get("highlights", [])) for item in experience if isinstance(item, dict)
+        return _result(20, strengths=["Skills section looks strong"])
+    if total_skills > 0:
+        return _result(
+            10,
+            warnings=["Skills list is short"],
+            suggestions=["Add more relevant skills (tools, frameworks, databases)."],
         )
-        if NUMBERS_RE.search(highlights_text):
-            score += 10
-            strengths.append("Includes quantified achievements")
-        else:
-            warnings.append("Experience lacks quantified impact")
-            suggestions.append("Add numbers to achievements (%, time saved, users, revenue, bugs fixed).")
-    else:
-        warnings.append("Experience not detected")
-        suggestions.append("Add any internship, volunteering, freelance, or project experience with bullet points.")
-
-    links = _normalize_links(contact.get("links"))
-    if links.get("github") or links.get("linkedin"):
-        score += 12
-        strengths.append("Professional links detected")
-    else:
-        warnings.append("No GitHub/LinkedIn detected")
-        suggestions.append("Add GitHub and/or LinkedIn links to improve credibility.")
+    return _result(
+        warnings=["Skills not detected"],
+        suggestions=["Add a Skills section with clear keywords (e.g., React, Django, MySQL)."],
+    )
+
+
+def _check_education(resume: ParsedResume) -> Dict[str, Any]:
+    if any(entry.has_data() for entry in resume.education or ()):
+        return _result(15, strengths=["Education detected"])
+    return _result(warnings=["Education not detected"], suggestions=["Add Education details (school, degree, years)."])
+
 
+def _check_experience(resume: ParsedResume) -> Dict[str, Any]:
+    experience = resume.experience or []
+    if not any(entry.has_data() for entry in experience):
+        return _result(
+            warnings=["Experience not detected"],
+            suggestions=["Add any internship, volunteering, freelance, or project experience with bullet points."],
+        )
+    highlights_text = " ".join(" ".join(map(str, entry.highlights)) for entry in experience)
+    if NUMBERS_RE.search(highlights_text):
+        return _result(30, strengths=["Experience detected", "Includes quantified achievements"])
+    return _result(
+        20,
+        strengths=["Experience detected"],
+        warnings=["Experience lacks quantified impact"],
+        suggestions=["Add numbers to achievements (%, time saved, users, revenue, bugs fixed)."],
+    )
+
+
+def _check_links(resume: ParsedResume) -> Dict[str, Any]:
+    if resume.contact and _has_profile_link(resume.contact.links):
+        return _result(12, strengths=["Professional links detected"])
+    return _result(
+        warnings=["No GitHub/LinkedIn detected"],
+        suggestions=["Add GitHub and/or LinkedIn links to improve credibility."],
+    )
+
+
+# Order matters: strengths, warnings and suggestions are listed in rule order.
+HEALTH_RULES: Tuple[HealthRule, ...] = (
+    HealthRule("name", ("contact",), _check_name),
+    HealthRule("email", ("contact",), _check_email),
+    HealthRule("phone", ("contact",), _check_phone),
+    HealthRule("skills", ("skills",), _check_skills),
+    HealthRule("education", ("education",), _check_education),
+    HealthRule("experience", ("experience",), _check_experience),
+    HealthRule("links", ("contact",), _check_links),
+)
+
+
+def score_resume(profile: ParsedResume | Dict[str, Any]) -> Dict[str, Any]:
+    return combine_results(evaluate_rules(profile))
+
+
+def evaluate_rules(
+    profile: ParsedResume | Dict[str, Any], names: Iterable[str] | None = None
+) -> Dict[str, Dict[str, Any]]:
+    """Per-rule results for ``profile``, for every rule or only those in ``names``.
+
+    ``profile`` is a record or the stored JSON shape (optionally wrapped in
+    ``{"parsed_data": ...}``).
+    """
+    resume = profile if isinstance(profile, ParsedResume) else ParsedResume.from_dict(_unwrap_profile(profile))
+    wanted = None if names is None else set(names)
+    return {rule.name: rule.check(resume) for rule in HEALTH_RULES if wanted is None or rule.name in wanted}
+
+
+def combine_results(results: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    ordered = [results[rule.name] for rule in HEALTH_RULES]
     return {
-        "score": min(score, 100),
-        "strengths": strengths[:5],
-        "warnings": warnings[:5],
-        "suggestions": suggestions[:5],
+        "score": min(sum(result["points"] for result in ordered), 100),
+        "strengths": [item for result in ordered for item in result["strengths"]][:5],
+        "warnings": [item for result in ordered for item in result["warnings"]][:5],
+        "suggestions": [item for result in ordered for item in result["suggestions"]][:5],
     }
 
 
+def changed_keys(before: Any, after: Any) -> Set[str]:
+    """Top-level profile keys whose values differ; ``resume_health`` is ignored."""
+    before, after = _unwrap_profile(before), _unwrap_profile(after)
+    return {key for key in before.keys() | after.keys() if key != "resume_health" and before.get(key) != after.get(key)}
+
+
+def rescore(
+    profile: Dict[str, Any], changed: Set[str], previous: Dict[str, Dict[str, Any]] | None
+) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]], List[str]]:
+    """Re-run only the rules reading a key in ``changed``, reusing ``previous`` results.
+
+    Returns the health summary, the full per-rule results and the rules that
+    ran. Every rule runs when ``previous`` does not cover them all.
+    """
+    if previous is None or any(rule.name not in previous for rule in HEALTH_RULES):
+        results = evaluate_rules(profile)
+        return combine_results(results), results, list(results)
+    rerun = [rule.name for rule in HEALTH_RULES if changed.intersection(rule.depends_on)]
+    results = {**previous, **evaluate_rules(profile, rerun)}
+    return combine_results(results), results, rerun
+
+
 def _unwrap_profile(profile: Dict[str, Any]) -> Dict[str, Any]:
     if not isinstance(profile, dict):
         return {}
@@ -97,61 +166,12 @@ def _unwrap_profile(profile: Dict[str, Any]) -> Dict[str, Any]:
     return profile
 
 
-def _skills_categories(skills: Any) -> Dict[str, List[Any]]:
-    if not isinstance(skills, dict):
-        return {}
-    categories = skills.get("categories")
-    if isinstance(categories, dict):
-        normalized: Dict[str, List[Any]] = {}
-        for key, values in categories.items():
-            if isinstance(values, list):
-                normalized[key] = [v for v in values if v]
-            elif values:
-                normalized[key] = [values]
-            else:
-                normalized[key] = []
-        return normalized
-    return {}
-
-
-def _has_meaningful_entries(entries: List[Any]) -> bool:
-    for item in entries:
-        if isinstance(item, dict):
-            if any(value for value in item.values()):
-                return True
-        elif item:
+def _has_profile_link(links: Links) -> bool:
+    for value in (links.github, links.linkedin):
+        if isinstance(value, str) and value.strip():
+            return True
+    for link in links.other:
+        lowered = str(link).strip().lower()
+        if "github.com" in lowered or "linkedin.com" in lowered:
             return True
     return False
-
-
-def _normalize_links(raw_links: Any) -> Dict[str, Any]:
-    normalized = {"github": None, "linkedin": None, "other": []}
-    candidates: List[str] = []
-
-    if isinstance(raw_links, dict):
-        for key in ("github", "linkedin"):
-            value = raw_links.get(key)
-            if isinstance(value, str) and value.strip():
-                normalized[key] = value.strip()
-                candidates.append(value.strip())
-        other = raw_links.get("other")
-        if isinstance(other, list):
-            candidates.extend([str(link).strip() for link in other if str(link).strip()])
-        elif isinstance(other, str) and other.strip():
-            candidates.append(other.strip())
-    elif isinstance(raw_links, list):
-        candidates.extend([str(link).strip() for link in raw_links if str(link).strip()])
-    elif isinstance(raw_links, str) and raw_links.strip():
-        candidates.append(raw_links.strip())
-
-    for candidate in candidates:
-        lowered = candidate.lower()
-        if normalized["github"] is None and "github.com" in lowered:
-            normalized["github"] = candidate
-        elif normalized["linkedin"] is None and "linkedin.com" in lowered:
-            normalized["linkedin"] = candidate
-        else:
-            normalized["other"].append(candidate)
-
-    normalized["other"] = list(dict.fromkeys(normalized["other"]))
-    return normalized
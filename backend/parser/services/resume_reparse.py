@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.utils import timezone
+
+from parser.models import Resume
+from parser.services.build_output import ResumeParser
+from parser.services.parser_version import current_parser_version, is_older_version
+from parser.services.preprocess import preprocess
+from parser.services.resume_health import HEALTH_RULES_VERSION
+from parser.services.resume_stats import ResumeStatsService, StatsContribution
+from parser.services.taxonomy import pinned_taxonomy
+
+
+@dataclass(slots=True)
+class ResumeReparseService:
+    """Refreshes parsed_data for rows produced by an older parser version.
+
+    ``other_taxonomies`` also refreshes rows parsed with a taxonomy this
+    process never loaded (see :func:`is_older_version`); ``reparse_stale``
+    sets it, request handlers do not.
+    """
+
+    parser: ResumeParser = field(default_factory=ResumeParser)
+    stats: ResumeStatsService = field(default_factory=ResumeStatsService)
+    other_taxonomies: bool = False
+
+    def is_stale(self, resume: Resume) -> bool:
+        if resume.is_confirmed or resume.is_edited:
+            return False
+        return is_older_version(resume.parser_version, self.other_taxonomies)
+
+    def reparse(self, resume: Resume) -> bool:
+        """Re-parse ``resume`` from raw_text. Returns False if the row was skipped.
+
+        The write is conditional on the row still being unconfirmed, unedited and
+        on the version we read, so a concurrent user edit always wins.
+        """
+        with pinned_taxonomy():
+            if not self.is_stale(resume) or not resume.raw_text:
+                return False
+
+            version = current_parser_version()
+            parsed = self.parser.parse(preprocess(resume.raw_text))
+        health = parsed.get("resume_health", {})
+        before = StatsContribution.of_resume(resume)
+        # Moves the export cache key and the ranking index stamp along.
+        now = timezone.now()
+        with transaction.atomic():
+            updated = Resume.objects.filter(
+                pk=resume.pk,
+                is_confirmed=False,
+                is_edited=False,
+                parser_version=resume.parser_version,
+            ).update(
+                parsed_data=parsed,
+                resume_health=health,
+                health_rules={},
+                health_version=HEALTH_RULES_VERSION,
+                parser_version=version,
+                updated_at=now,
+            )
+            if not updated:
+                return False
+            self.stats.record(resume.user_id, before, StatsContribution.of(parsed, health))
+
+        resume.parsed_data = parsed
+        resume.resume_health = health
+        resume.health_rules = {}
+        resume.health_version = HEALTH_RULES_VERSION
+        resume.parser_version = version
+        resume.updated_at = now
+        return True
+
+    def stale_queryset(self):
+        # Candidates only: reparse() skips rows that are not older.
+        return Resume.objects.filter(is_confirmed=False, is_edited=False).exclude(
+            parser_version=current_parser_version()
+        )
+
+
+class ReparseQueue:
+    """Stale resumes found on read, re-parsed by a background thread of this process.
+
+    Detail and export reads serve the stored parse and :meth:`submit` the
+    row; a later read sees the refreshed one. The thread starts on the first
+    submit and exits once the queue is empty, so nothing runs before workers
+    fork. At most ``RESUME_REPARSE_QUEUE_SIZE`` rows wait; more are dropped
+    and left to ``reparse_stale``.
+    """
+
+    def __init__(self, max_pending: int | None = None, background: bool = True):
+        self._max_pending = max_pending
+        self.background = background
+        self._service: ResumeReparseService | None = None
+        self._pending: Dict[int, None] = {}
+        self._running = False
+        self._lock = threading.Lock()
+        self.reparsed = 0
+        self.dropped = 0
+        self.failures = 0
+        self.last_error: str | None = None
+
+    @property
+    def max_pending(self) -> int:
+        if self._max_pending is not None:
+            return self._max_pending
+        return getattr(settings, "RESUME_REPARSE_QUEUE_SIZE", 1000)
+
+    @property
+    def service(self) -> ResumeReparseService:
+        if self._service is None:
+            self._service = ResumeReparseService()
+        return self._service
+
+    def submit(self, resume: Resume) -> bool:
+        """Queue ``resume`` if it is stale; True when it is waiting to be re-parsed."""
+        if not resume.raw_text or not self.service.is_stale(resume):
+            return False
+        with self._lock:
+            if resume.pk in self._pending:
+                return True
+            if len(self._pending) >= self.max_pending:
+                self.dropped += 1
+                return False
+            self._pending[resume.pk] = None
+            start = self.background and not self._running
+            self._running = self._running or start
+        if start:
+            threading.Thread(target=self._run, name="resume-reparse", daemon=True).start()
+        return True
+
+    def drain(self) -> int:
+        """Re-parse every waiting row in the calling thread; returns how many were refreshed."""
+        refreshed = 0
+        while (resume_id := self._pop()) is not None:
+            refreshed += self._reparse(resume_id)
+        return refreshed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pending.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "pending": len(self._pending),
+                "max_pending": self.max_pending,
+                "running": self._running,
+                "reparsed": self.reparsed,
+                "dropped": self.dropped,
+                "failures": self.failures,
+                "last_error": self.last_error,
+            }
+
+    def _pop(self, stop: bool = False) -> int | None:
+        with self._lock:
+            if not self._pending:
+                if stop:
+                    self._running = False
+                return None
+            resume_id = next(iter(self._pending))
+            del self._pending[resume_id]
+            return resume_id
+
+    def _run(self) -> None:
+        try:
+            while (resume_id := self._pop(stop=True)) is not None:
+                self._reparse(resume_id)
+        finally:
+            connections.close_all()
+
+    def _reparse(self, resume_id: int) -> bool:
+        try:
+            resume = Resume.objects.filter(pk=resume_id).first()
+            refreshed = resume is not None and self.service.reparse(resume)
+        except Exception as exc:  # keep serving the rest of the queue
+            with self._lock:
+                self.failures += 1
+                self.last_error = f"{type(exc).__name__}: {exc}"
+            return False
+        if refreshed:
+            with self._lock:
+                self.reparsed += 1
+        return refreshed
+
+
+reparse_queue = ReparseQueue()
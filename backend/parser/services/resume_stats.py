@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Tuple
+
+from django.db import IntegrityError, transaction
+
+from parser.models import Resume, UserResumeStats
+
+HISTOGRAM_BUCKET = 10
+
+
+@dataclass(slots=True, frozen=True)
+class StatsContribution:
+    """What one resume adds to its owner's aggregates."""
+
+    skills: Tuple[Tuple[str, str], ...] = ()
+    score: int | None = None
+    warnings: Tuple[str, ...] = ()
+    sections: Tuple[str, ...] = ()
+
+    @classmethod
+    def of(cls, parsed_data: Dict[str, Any] | None, resume_health: Dict[str, Any] | None) -> "StatsContribution":
+        parsed_data = parsed_data if isinstance(parsed_data, dict) else {}
+        resume_health = resume_health if isinstance(resume_health, dict) else {}
+        skills = parsed_data.get("skills")
+        categories = skills.get("categories") if isinstance(skills, dict) else None
+        skill_pairs = {
+            (str(category), str(skill))
+            for category, items in (categories or {}).items()
+            if isinstance(items, list)
+            for skill in items
+            if skill
+        }
+        score = resume_health.get("score")
+        return cls(
+            skills=tuple(sorted(skill_pairs)),
+            score=int(score) if isinstance(score, (int, float)) else None,
+            warnings=tuple(sorted({str(warning) for warning in resume_health.get("warnings") or []})),
+            sections=tuple(sorted({str(section) for section in parsed_data.get("sections_found") or []})),
+        )
+
+    @classmethod
+    def of_resume(cls, resume: Resume) -> "StatsContribution":
+        return cls.of(resume.parsed_data, resume.resume_health)
+
+
+def score_bucket(score: int) -> str:
+    return str(min(max(score, 0) // HISTOGRAM_BUCKET * HISTOGRAM_BUCKET, 100 - HISTOGRAM_BUCKET))
+
+
+@dataclass(slots=True)
+class StatsDelta:
+    """Signed change to one user's aggregates, accumulated before a single write."""
+
+    resumes: int = 0
+    scored: int = 0
+    score_sum: int = 0
+    histogram: Counter = field(default_factory=Counter)
+    skills: Counter = field(default_factory=Counter)
+    warnings: Counter = field(default_factory=Counter)
+    sections: Counter = field(default_factory=Counter)
+
+    def add(self, contribution: StatsContribution | None, sign: int = 1) -> None:
+        if contribution is None:
+            return
+        self.resumes += sign
+        if contribution.score is not None:
+            self.scored += sign
+            self.score_sum += sign * contribution.score
+            self.histogram[score_bucket(contribution.score)] += sign
+        for pair in contribution.skills:
+            self.skills[pair] += sign
+        for warning in contribution.warnings:
+            self.warnings[warning] += sign
+        for section in contribution.sections:
+            self.sections[section] += sign
+
+    def apply_to(self, stats: UserResumeStats) -> None:
+        stats.resume_count += self.resumes
+        stats.scored_count += self.scored
+        stats.score_sum += self.score_sum
+        _merge(stats.score_histogram, self.histogram.items())
+        _merge(stats.warning_counts, self.warnings.items())
+        _merge(stats.section_counts, self.sections.items())
+        for (category, skill), change in self.skills.items():
+            bucket = stats.skill_counts.setdefault(category, {})
+            _merge(bucket, [(skill, change)])
+            if not bucket:
+                del stats.skill_counts[category]
+
+
+def _merge(counts: Dict[str, int], changes: Iterable[Tuple[str, int]]) -> None:
+    for key, change in changes:
+        value = counts.get(key, 0) + change
+        if value > 0:
+            counts[key] = value
+        else:
+            counts.pop(key, None)
+
+
+@dataclass(slots=True)
+class ResumeStatsService:
+    """Keeps ``UserResumeStats`` in step with resume creates, edits and deletes.
+
+    Callers record a change after writing the resume, in the same
+    transaction: a user without a stats row yet is then built from their
+    current resumes, which already include the change.
+    """
+
+    def record(
+        self, user_id: int, before: StatsContribution | None, after: StatsContribution | None
+    ) -> None:
+        if before == after:
+            return
+        delta = StatsDelta()
+        delta.add(before, -1)
+        delta.add(after, 1)
+        self.apply({user_id: delta})
+
+    def apply(self, deltas: Dict[int, StatsDelta]) -> None:
+        with transaction.atomic():
+            for user_id, delta in deltas.items():
+                stats = UserResumeStats.objects.select_for_update().filter(user_id=user_id).first()
+                if stats is None and self._create(user_id):
+                    continue
+                if stats is None:
+                    stats = UserResumeStats.objects.select_for_update().get(user_id=user_id)
+                delta.apply_to(stats)
+                stats.save()
+
+    def rebuild(self, user_ids: Iterable[int] | None = None, chunk_size: int = 500) -> Dict[int, UserResumeStats]:
+        """Recompute aggregates from every resume; returns the fresh (unsaved) rows."""
+        resumes = Resume.objects.order_by("pk").only("pk", "user_id", "parsed_data", "resume_health")
+        users = None
+        if user_ids is not None:
+            users = list(user_ids)
+            resumes = resumes.filter(user_id__in=users)
+
+        deltas: Dict[int, StatsDelta] = {user_id: StatsDelta() for user_id in users or []}
+        for resume in resumes.iterator(chunk_size=chunk_size):
+            deltas.setdefault(resume.user_id, StatsDelta()).add(StatsContribution.of_resume(resume))
+
+        fresh = {}
+        for user_id, delta in deltas.items():
+            stats = UserResumeStats(user_id=user_id)
+            delta.apply_to(stats)
+            fresh[user_id] = stats
+        return fresh
+
+    def for_user(self, user) -> UserResumeStats:
+        stats = UserResumeStats.objects.filter(user=user).first()
+        if stats is None:
+            # Users whose resumes predate the aggregates are built on first read.
+            self._create(user.pk)
+            stats = UserResumeStats.objects.get(user=user)
+        return stats
+
+    def _create(self, user_id: int) -> bool:
+        """Insert a freshly rebuilt row; False if another request inserted it first."""
+        try:
+            with transaction.atomic():
+                self.rebuild([user_id])[user_id].save(force_insert=True)
+        except IntegrityError:
+            return False
+        return True
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict
+from typing import Any, Dict, Sequence
 
 from rest_framework.exceptions import ValidationError
 
-from parser.services.build_output import ResumeParser
+from parser.models import Resume
+from parser.services.build_output import FIRST_PAGE_FIELDS, PreviousParse, ResumeParser
+from parser.services.deadline import Deadline, DeadlineExceeded
 from parser.services.extract_text import extract_text
+from parser.services.parser_version import current_parser_version
 from parser.services.preprocess import preprocess
 from parser.services.profile_export import ResumeProfileExporter
+from parser.services.section_splitter import split_sections
+from parser.services.similarity import find_near_duplicate, signature_fields
 
 
 @dataclass(slots=True)
@@ -16,28 +21,70 @@ class ResumeWorkflowService:
     parser: ResumeParser = field(default_factory=ResumeParser)
     exporter: ResumeProfileExporter = field(default_factory=ResumeProfileExporter)
 
-    def process_upload(self, upload) -> Dict[str, Any]:
-        raw_text = self._extract_raw_text(upload)
-        lines = preprocess(raw_text)
-        parsed_data = self.parser.parse(lines)
-        profile_exports = self.exporter.export(parsed_data)
+    def process_upload(self, upload, user=None, deadline: Deadline | None = None) -> Dict[str, Any]:
+        """Extract, parse and export an upload.
+
+        With a ``user``, the upload is matched against their earlier resumes by
+        SimHash; on a near match, sections identical to the closest one are
+        reused instead of re-extracted. Parser stages not started by
+        ``deadline`` are skipped and listed under ``incomplete``; text
+        extraction past it raises ``DeadlineExceeded``.
+        """
+        raw_text = self._extract_raw_text(upload, deadline=deadline)
+        lines = preprocess(raw_text, deadline)
+        signature = signature_fields(lines)
+        near_duplicate = find_near_duplicate(user, signature["simhash"]) if user is not None else None
+        previous = self._previous_parse(near_duplicate.resume if near_duplicate else None)
+        outcome = self.parser.parse_with_report(lines, previous, deadline=deadline)
+        profile_exports = self.exporter.export(outcome.record)
 
         return {
             "raw_text": raw_text,
-            "parsed_data": parsed_data,
+            "parsed_data": outcome.profile,
             "profile_exports": profile_exports,
+            "signature": signature,
+            "near_duplicate": near_duplicate,
+            "reused_sections": outcome.reused_sections,
+            "incomplete": outcome.incomplete,
+        }
+
+    def extract_fields(self, upload, fields: Sequence[str], deadline: Deadline | None = None) -> Dict[str, Any]:
+        """Parse only ``fields`` of an upload, without SimHash matching or exports.
+
+        Requests needing only ``FIRST_PAGE_FIELDS`` read just the first page.
+        """
+        max_pages = 1 if FIRST_PAGE_FIELDS.issuperset(fields) else None
+        lines = preprocess(self._extract_raw_text(upload, max_pages=max_pages, deadline=deadline), deadline)
+        return self.parser.parse_with_report(lines, fields=fields, deadline=deadline).profile
+
+    def process_text(self, resume: Resume, raw_text: str) -> Dict[str, Any]:
+        """Parse edited ``raw_text`` for ``resume``, reusing its unchanged sections."""
+        lines = preprocess(raw_text)
+        outcome = self.parser.parse_with_report(lines, self._previous_parse(resume))
+        return {
+            "parsed_data": outcome.profile,
+            "signature": signature_fields(lines),
+            "stages": {"recomputed": outcome.recomputed, "reused": outcome.reused},
         }
 
     def build_exports(self, parsed_data: Dict[str, Any]) -> Dict[str, Any]:
         return self.exporter.export(parsed_data)
 
-    def _extract_raw_text(self, upload) -> str:
+    def _previous_parse(self, resume: Resume | None) -> PreviousParse | None:
+        if resume is None or not resume.raw_text:
+            return None
+        # Edited or stale output no longer reflects what its sections would parse to.
+        if resume.is_edited or resume.parser_version != current_parser_version():
+            return None
+        return PreviousParse(sections=split_sections(preprocess(resume.raw_text)), parsed=resume.parsed_data)
+
+    def _extract_raw_text(self, upload, max_pages: int | None = None, deadline: Deadline | None = None) -> str:
         try:
             file_bytes = upload.read()
             if not file_bytes:
                 raise ValidationError({"file": "Uploaded document is empty."})
-            return extract_text(upload.name, file_bytes)
-        except ValidationError:
+            return extract_text(upload.name, file_bytes, max_pages=max_pages, deadline=deadline)
+        except (ValidationError, DeadlineExceeded):
             raise
         except ValueError as exc:
             raise ValidationError({"file": str(exc)}) from exc
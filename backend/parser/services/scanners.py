@@ -0,0 +1,213 @@
+"""Linear-time scanners for the contact, education and experience patterns.
+
+Each scanner matches exactly what its reference regex below would match with
+``re.search`` / ``re.sub``, but in time linear in the input: the text is only
+walked with single character-class runs (which the regex engine or a Python
+loop consumes without backtracking), and every character is visited a
+bounded number of times. The reference regexes backtrack on inputs such as
+``"jan" * 5000`` or a long run of address-like characters with no ``@``.
+
+The equivalence is checked by fuzzing in ``parser.tests``; the
+``regex`` benchmark suite measures time per kilobyte on adversarial input.
+"""
+
+from __future__ import annotations
+
+import re
+import string
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Tuple
+
+# Reference semantics (not used on hot paths).
+PHONE_PATTERN = re.compile(r"\+?\d[\d\s().-]{7,}\d")
+EMAIL_PATTERN = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+MONTH_PATTERN = r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)\w*"
+DATE_VALUE_PATTERN = rf"(?:{MONTH_PATTERN}\s+\d{{4}}|\d{{4}})"
+DATE_RANGE_PATTERN = re.compile(
+    rf"(?P<start>{DATE_VALUE_PATTERN})\s*[-–—]\s*(?P<end>present|{DATE_VALUE_PATTERN})", re.I
+)
+
+_PHONE_RUN = re.compile(r"[\d\s().-]+")
+_DIGIT = re.compile(r"\d")
+_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + "._%+-")
+_DOMAIN_RUN = re.compile(r"[A-Za-z0-9.-]+")
+_LETTERS = re.compile(r"[A-Za-z]*")
+_DASH = re.compile(r"[-–—]")
+_SPACES = re.compile(r"\s*")
+_WORD = re.compile(r"\w*")
+_MONTHS = frozenset(("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"))
+# re.IGNORECASE folds for the letters of the month names and "present"
+# (U+017F LATIN SMALL LETTER LONG S matches "s").
+_FOLD = str.maketrans({**{c: c.lower() for c in string.ascii_uppercase}, "ſ": "s"})
+
+
+@dataclass(slots=True, frozen=True)
+class ScanMatch:
+    """The parts of ``re.Match`` the extractors use."""
+
+    string: str
+    spans: Dict[Any, Tuple[int, int]]
+
+    def group(self, name: Any = 0) -> str:
+        start, end = self.spans[name]
+        return self.string[start:end]
+
+    def start(self, name: Any = 0) -> int:
+        return self.spans[name][0]
+
+    def end(self, name: Any = 0) -> int:
+        return self.spans[name][1]
+
+    def span(self, name: Any = 0) -> Tuple[int, int]:
+        return self.spans[name]
+
+
+class Scanner(ABC):
+    """``search`` / ``finditer`` / ``sub`` over a subclass's ``search``."""
+
+    @abstractmethod
+    def search(self, text: str, pos: int = 0) -> ScanMatch | None:
+        ...
+
+    def finditer(self, text: str) -> Iterator[ScanMatch]:
+        pos = 0
+        while True:
+            match = self.search(text, pos)
+            if match is None:
+                return
+            yield match
+            # Matches are never empty, so this always advances.
+            pos = match.end()
+
+    def sub(self, repl: str, text: str) -> str:
+        parts, last = [], 0
+        for match in self.finditer(text):
+            parts += [text[last:match.start()], repl]
+            last = match.end()
+        if not parts:
+            return text
+        parts.append(text[last:])
+        return "".join(parts)
+
+
+class PhoneScanner(Scanner):
+    """``PHONE_PATTERN``.
+
+    Within a maximal run of ``[\\d\\s().-]`` a match exists iff the first and
+    last digits are at least 8 apart; it spans exactly those digits, plus a
+    ``+`` directly before the run when the run starts with its first digit.
+    """
+
+    def search(self, text: str, pos: int = 0) -> ScanMatch | None:
+        for run in _PHONE_RUN.finditer(text, pos):
+            run_start, run_end = run.span()
+            first = _DIGIT.search(text, run_start, run_end)
+            if first is None:
+                continue
+            last = run_end - 1
+            while not text[last].isdecimal():
+                last -= 1
+            first_digit = first.start()
+            if last - first_digit < 8:
+                continue
+            start = first_digit
+            if first_digit == run_start and first_digit > pos and text[first_digit - 1] == "+":
+                start -= 1
+            return ScanMatch(text, {0: (start, last + 1)})
+        return None
+
+
+class EmailScanner(Scanner):
+    """``EMAIL_PATTERN``.
+
+    Anchored on each ``@``: the local part is the run of local characters
+    before it, and the domain is the longest prefix of the following domain
+    run that ends in ``.`` plus two or more letters.
+    """
+
+    def search(self, text: str, pos: int = 0) -> ScanMatch | None:
+        at = text.find("@", pos)
+        while at != -1:
+            start = at
+            while start > pos and text[start - 1] in _LOCAL_CHARS:
+                start -= 1
+            end = self._domain_end(text, at + 1) if start < at else None
+            if end is not None:
+                return ScanMatch(text, {0: (start, end)})
+            at = text.find("@", at + 1)
+        return None
+
+    @staticmethod
+    def _domain_end(text: str, begin: int) -> int | None:
+        run = _DOMAIN_RUN.match(text, begin)
+        if run is None:
+            return None
+        dot = text.rfind(".", begin + 1, run.end())
+        while dot != -1:
+            letters_end = _LETTERS.match(text, dot + 1, run.end()).end()
+            if letters_end - dot > 2:
+                return letters_end
+            dot = text.rfind(".", begin + 1, dot)
+        return None
+
+
+class DateRangeScanner(Scanner):
+    """``DATE_RANGE_PATTERN`` with groups ``start`` and ``end``.
+
+    Anchored on each dash. A date value cannot contain a dash, so the first
+    dash with a valid date on both sides gives the leftmost match. On the
+    left, a month-form start is preferred over the bare year because it
+    begins earlier.
+    """
+
+    def search(self, text: str, pos: int = 0) -> ScanMatch | None:
+        for dash in _DASH.finditer(text, pos):
+            start = self._start_span(text, pos, dash.start())
+            if start is None:
+                continue
+            end = self._end_span(text, _SPACES.match(text, dash.end()).end())
+            if end is None:
+                continue
+            return ScanMatch(text, {0: (start[0], end[1]), "start": start, "end": end})
+        return None
+
+    @staticmethod
+    def _start_span(text: str, pos: int, dash: int) -> Tuple[int, int] | None:
+        year_end = dash
+        while year_end > pos and text[year_end - 1].isspace():
+            year_end -= 1
+        year_start = year_end - 4
+        if year_start < pos or not text[year_start:year_end].isdecimal():
+            return None
+        word_end = year_start
+        while word_end > pos and text[word_end - 1].isspace():
+            word_end -= 1
+        if word_end < year_start:
+            word_start = word_end
+            while word_start > pos and (text[word_start - 1].isalnum() or text[word_start - 1] == "_"):
+                word_start -= 1
+            for month_start in range(word_start, word_end - 2):
+                if text[month_start:month_start + 3].translate(_FOLD) in _MONTHS:
+                    return month_start, year_end
+        return year_start, year_end
+
+    @staticmethod
+    def _end_span(text: str, begin: int) -> Tuple[int, int] | None:
+        if text[begin:begin + 7].translate(_FOLD) == "present":
+            return begin, begin + 7
+        if text[begin:begin + 3].translate(_FOLD) in _MONTHS:
+            spaces_start = _WORD.match(text, begin + 3).end()
+            year_start = _SPACES.match(text, spaces_start).end()
+            if year_start > spaces_start and text[year_start:year_start + 4].isdecimal() and len(
+                text[year_start:year_start + 4]
+            ) == 4:
+                return begin, year_start + 4
+        if len(text[begin:begin + 4]) == 4 and text[begin:begin + 4].isdecimal():
+            return begin, begin + 4
+        return None
+
+
+PHONE_SCANNER = PhoneScanner()
+EMAIL_SCANNER = EmailScanner()
+DATE_RANGE_SCANNER = DateRangeScanner()
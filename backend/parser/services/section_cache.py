@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import hashlib
+import pickle
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Sequence, Tuple
+
+from django.conf import settings
+
+from .line_cache import ENTRY_OVERHEAD
+from .taxonomy import taxonomy_version
+
+MISSING = object()
+
+
+def stage_key(stage: str, func: Callable[..., Any], lines: Sequence[str]) -> Tuple[str, str, int, str, str]:
+    """Cache key for running ``func`` on ``lines``: the stage, the function, a digest of the lines
+    and the taxonomy version, so entries from before a taxonomy reload are not reused.
+    """
+    digest = hashlib.sha1("\n".join(lines).encode("utf-8")).hexdigest()
+    # Injected extractors (e.g. in tests) must not share entries with the defaults.
+    return (stage, getattr(func, "__qualname__", repr(func)), id(func), digest, taxonomy_version())
+
+
+class SectionCache:
+    """Process-local LRU of extractor output keyed by section content, bounded by memory.
+
+    Values are stored pickled: the bytes are immutable, so entries are never
+    copied while cached, and every :meth:`get` unpickles a fresh value callers
+    may mutate. The pickle's length is the entry's size. Sized by
+    ``PARSER_SECTION_CACHE_BYTES``; 0 disables it.
+    """
+
+    def __init__(self, max_bytes: int | None = None):
+        self._max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple, Tuple[bytes, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def max_bytes(self) -> int:
+        if self._max_bytes is not None:
+            return self._max_bytes
+        return getattr(settings, "PARSER_SECTION_CACHE_BYTES", 8 * 1024 * 1024)
+
+    def get(self, key: Tuple) -> Any:
+        """The cached value, or ``MISSING``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return MISSING
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return pickle.loads(entry[0])
+
+    def put(self, key: Tuple, value: Any) -> None:
+        max_bytes = self.max_bytes
+        if max_bytes <= 0:
+            return
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        size = ENTRY_OVERHEAD + sys.getsizeof(blob)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.bytes -= previous[1]
+            self._entries[key] = (blob, size)
+            self.bytes += size
+            while self.bytes > max_bytes and self._entries:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.bytes -= evicted
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+            self.hits = self.misses = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+section_cache = SectionCache()
@@ -0,0 +1,124 @@
+"""SimHash signatures and a per-user LSH lookup for near-duplicate resumes.
+
+The 64-bit signature is built from word bigrams of the preprocessed lines, so
+reordering bullets leaves it unchanged and a typo flips only a bit or two. It
+is stored as four 16-bit bands; by pigeonhole any two signatures within
+``NEAR_DUPLICATE_DISTANCE`` (< 4) bits share at least one band exactly, so a
+lookup is four indexed equality probes on ``(user, band)`` plus a Hamming
+check on the few candidates.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Sequence
+
+from django.db import connections, router
+
+from parser.models import Resume
+
+BANDS = 4
+BAND_BITS = 16
+NEAR_DUPLICATE_DISTANCE = 3
+TOKEN_RE = re.compile(r"\w+")
+_SIGN_BIT = 1 << 63
+# Per-bit +1/-1 votes of each byte value, least significant bit first.
+_BYTE_VOTES = [[1 if value >> bit & 1 else -1 for bit in range(8)] for value in range(256)]
+
+
+@dataclass(slots=True)
+class NearDuplicate:
+    resume: Resume
+    distance: int
+
+
+def simhash(lines: Sequence[str]) -> int:
+    """Signed 64-bit SimHash of ``lines`` (fits a BigIntegerField)."""
+    features: Counter[str] = Counter()
+    for line in lines:
+        tokens = TOKEN_RE.findall(line.lower())
+        if len(tokens) < 2:
+            features[" ".join(tokens)] += 1
+        else:
+            features.update(map(" ".join, zip(tokens, tokens[1:])))
+
+    # Tally feature digests per (byte position, byte value) and expand to bit
+    # votes once per distinct byte, instead of 64 updates per feature.
+    byte_counts = [[0] * 256 for _ in range(8)]
+    for feature, count in features.items():
+        digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+        for position, value in enumerate(digest):
+            byte_counts[position][value] += count
+
+    signature = 0
+    for position, counts in enumerate(byte_counts):
+        weights = [0] * 8
+        for value, count in enumerate(counts):
+            if count:
+                votes = _BYTE_VOTES[value]
+                for bit in range(8):
+                    weights[bit] += votes[bit] * count
+        shift = (7 - position) * 8
+        for bit in range(8):
+            if weights[bit] > 0:
+                signature |= 1 << (shift + bit)
+    return signature - (1 << 64) if signature & _SIGN_BIT else signature
+
+
+def signature_bands(signature: int) -> Dict[str, int]:
+    unsigned = signature & ((1 << 64) - 1)
+    mask = (1 << BAND_BITS) - 1
+    return {f"simhash_band{band}": unsigned >> (band * BAND_BITS) & mask for band in range(BANDS)}
+
+
+def signature_fields(lines: Sequence[str]) -> Dict[str, int]:
+    """Model field values (``simhash`` plus its bands) for ``lines``."""
+    signature = simhash(lines)
+    return {"simhash": signature, **signature_bands(signature)}
+
+
+def hamming(a: int, b: int) -> int:
+    return bin((a ^ b) & ((1 << 64) - 1)).count("1")
+
+
+def find_near_duplicate(user, signature: int, max_distance: int = NEAR_DUPLICATE_DISTANCE) -> NearDuplicate | None:
+    """Closest resume of ``user`` within ``max_distance`` bits, newest first on ties."""
+    user_id = getattr(user, "pk", user)
+    params = []
+    for value in signature_bands(signature).values():
+        params += [user_id, value]
+    alias = router.db_for_read(Resume)
+    with connections[alias].cursor() as cursor:
+        cursor.execute(_probe_sql(alias), params)
+        candidates = cursor.fetchall()
+
+    best_pk, best_distance = None, max_distance + 1
+    for pk, candidate in sorted(candidates, reverse=True):
+        distance = hamming(signature, candidate)
+        if distance < best_distance:
+            best_pk, best_distance = pk, distance
+    if best_pk is None:
+        return None
+    return NearDuplicate(resume=Resume.objects.get(pk=best_pk), distance=best_distance)
+
+
+@lru_cache(maxsize=None)
+def _probe_sql(alias: str) -> str:
+    """One indexed probe per band, combined with UNION.
+
+    An OR of the bands is planned as a scan of all of the user's rows, and
+    building the equivalent ORM union costs more than running it, so the
+    statement is built once per database alias.
+    """
+    quote = connections[alias].ops.quote_name
+    meta = Resume._meta
+    probes = [
+        f"SELECT {quote(meta.pk.column)}, {quote(meta.get_field('simhash').column)} FROM {quote(meta.db_table)} "
+        f"WHERE {quote(meta.get_field('user').column)} = %s AND {quote(meta.get_field(name).column)} = %s"
+        for name in (f"simhash_band{band}" for band in range(BANDS))
+    ]
+    return " UNION ".join(probes)
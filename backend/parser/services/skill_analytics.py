@@ -0,0 +1,254 @@
+"""Corpus-wide skill co-occurrence and trend analytics.
+
+Resumes are streamed in pk-ordered chunks of ``(created_at, parsed_data)``
+and reduced to the codes of their skills in the ``skills.json`` vocabulary
+(fixed for the whole run, even if the taxonomy is reloaded). Both
+accumulators are sparse, so their size follows the pairs that actually
+occur rather than the size of the vocabulary:
+
+* co-occurrence: every skill pair ``i <= j`` in a resume is encoded as
+  ``i * V + j`` and a chunk's codes are counted with ``np.unique``. Chunk
+  counts are merged into the running counts once they add up to as many
+  entries, so merging costs ``O(n log n)`` overall. Diagonal entries are
+  per-skill resume counts.
+* frequencies: ``period * V + skill`` codes, counted the same way.
+
+Snapshots store only the nonzero entries, as parallel ``rows``/``columns``/
+``counts`` lists (``periods``/``columns``/``counts`` for frequencies).
+Memory is bounded by the chunk size plus the nonzero counts, no matter how
+large the corpus or the taxonomy is.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+from parser.fields import decompress_value
+from parser.models import Resume, SkillAnalyticsSnapshot
+from parser.services.ranking import SkillVocabulary, skill_vocabulary
+
+BUCKETS = ("month", "week")
+EMPTY = np.zeros(0, dtype=np.int64)
+
+
+def period_key(created_at, bucket: str) -> str:
+    if bucket == "week":
+        year, week, _ = created_at.isocalendar()
+        return f"{year:04d}-W{week:02d}"
+    return f"{created_at.year:04d}-{created_at.month:02d}"
+
+
+def skill_codes(parsed_data: Any, vocabulary: SkillVocabulary | None = None) -> List[int]:
+    """Integer codes (vocabulary columns) of the skills in one resume."""
+    vocabulary = vocabulary or skill_vocabulary()
+    skills = parsed_data.get("skills") if isinstance(parsed_data, dict) else None
+    categories = skills.get("categories") if isinstance(skills, dict) else None
+    codes = set()
+    for category, items in (categories or {}).items():
+        if isinstance(items, list):
+            for item in items:
+                column = vocabulary.columns.get((category, item))
+                if column is not None:
+                    codes.add(column)
+    return sorted(codes)
+
+
+@lru_cache(maxsize=64)
+def _upper_pairs(count: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Positions ``(a, b)``, ``a <= b``, of every pair among ``count`` codes."""
+    return np.triu_indices(count)
+
+
+def _merge(keys: np.ndarray, counts: np.ndarray, new_keys: np.ndarray, new_counts: np.ndarray):
+    """Sorted unique keys of both inputs with their summed counts."""
+    merged, inverse = np.unique(np.concatenate([keys, new_keys]), return_inverse=True)
+    totals = np.bincount(inverse, weights=np.concatenate([counts, new_counts]), minlength=len(merged))
+    return merged, totals.astype(np.int64)
+
+
+@dataclass(slots=True)
+class SkillAnalyticsAccumulator:
+    bucket: str = "month"
+    vocabulary: SkillVocabulary = field(default_factory=skill_vocabulary)
+    resume_count: int = 0
+    periods: Dict[str, int] = field(default_factory=dict)
+    period_totals: np.ndarray = field(default_factory=lambda: EMPTY)
+    # Sorted ``i * V + j`` pair codes and ``period * V + skill`` codes, with their counts.
+    pair_keys: np.ndarray = field(default_factory=lambda: EMPTY)
+    pair_counts: np.ndarray = field(default_factory=lambda: EMPTY)
+    frequency_keys: np.ndarray = field(default_factory=lambda: EMPTY)
+    frequency_counts: np.ndarray = field(default_factory=lambda: EMPTY)
+    # Per-chunk (pair keys, counts, frequency keys, counts) not merged yet.
+    _pending: List[Tuple[np.ndarray, ...]] = field(default_factory=list)
+    _pending_size: int = 0
+
+    def add_chunk(self, rows: Sequence[Tuple[Any, Sequence[int]]]) -> None:
+        """Fold ``(created_at, skill codes)`` rows into the accumulators."""
+        if not rows:
+            return
+        width = len(self.vocabulary)
+        period_ids = np.fromiter(
+            (self._period(created_at) for created_at, _ in rows), dtype=np.int64, count=len(rows)
+        )
+        pairs, frequencies = [], []
+        for period, (_, codes) in zip(period_ids.tolist(), rows):
+            if not codes:
+                continue
+            codes = np.asarray(codes, dtype=np.int64)
+            first, second = _upper_pairs(len(codes))
+            pairs.append(codes[first] * width + codes[second])
+            frequencies.append(period * width + codes)
+        if pairs:
+            chunk = (
+                *np.unique(np.concatenate(pairs), return_counts=True),
+                *np.unique(np.concatenate(frequencies), return_counts=True),
+            )
+            self._pending.append(chunk)
+            self._pending_size += len(chunk[0])
+            if self._pending_size >= len(self.pair_keys):
+                self._flush()
+        self.period_totals = self.period_totals + np.bincount(period_ids, minlength=len(self.periods))
+        self.resume_count += len(rows)
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        pair_keys, pair_counts, frequency_keys, frequency_counts = (
+            np.concatenate(parts) for parts in zip(*self._pending)
+        )
+        self._pending, self._pending_size = [], 0
+        self.pair_keys, self.pair_counts = _merge(self.pair_keys, self.pair_counts, pair_keys, pair_counts)
+        self.frequency_keys, self.frequency_counts = _merge(
+            self.frequency_keys, self.frequency_counts, frequency_keys, frequency_counts
+        )
+
+    def _period(self, created_at) -> int:
+        key = period_key(created_at, self.bucket)
+        index = self.periods.get(key)
+        if index is None:
+            index = self.periods[key] = len(self.periods)
+            self.period_totals = np.append(self.period_totals, 0)
+        return index
+
+    def snapshot(self) -> SkillAnalyticsSnapshot:
+        self._flush()
+        width = len(self.vocabulary)
+        # Period keys ("2026-01", "2026-W05") sort chronologically.
+        periods = sorted(self.periods)
+        chronological = np.array([self.periods[key] for key in periods], dtype=np.int64)
+        position = np.empty(len(periods), dtype=np.int64)
+        position[chronological] = np.arange(len(periods))
+        return SkillAnalyticsSnapshot(
+            bucket=self.bucket,
+            resume_count=self.resume_count,
+            skills=[list(entry) for entry in self.vocabulary.entries],
+            cooccurrence={
+                "rows": (self.pair_keys // width).tolist(),
+                "columns": (self.pair_keys % width).tolist(),
+                "counts": self.pair_counts.tolist(),
+            },
+            periods=periods,
+            period_totals=self.period_totals[chronological].tolist(),
+            frequencies={
+                "periods": position[self.frequency_keys // width].tolist(),
+                "columns": (self.frequency_keys % width).tolist(),
+                "counts": self.frequency_counts.tolist(),
+            },
+        )
+
+
+def iter_skill_rows(
+    chunk_size: int = 1000, vocabulary: SkillVocabulary | None = None
+) -> Iterator[List[Tuple[Any, List[int]]]]:
+    """Yield chunks of ``(created_at, skill codes)`` without building model instances."""
+    vocabulary = vocabulary or skill_vocabulary()
+    parsed_field = Resume._meta.get_field("parsed_data")
+    queryset = Resume.objects.order_by("pk").values_list("pk", "created_at", "parsed_data")
+    last_pk = 0
+    while True:
+        rows = list(queryset.filter(pk__gt=last_pk)[:chunk_size])
+        if not rows:
+            return
+        last_pk = rows[-1][0]
+        yield [(created_at, skill_codes(decompress_value(parsed_field, blob), vocabulary)) for _, created_at, blob in rows]
+
+
+def build_snapshot(bucket: str = "month", chunk_size: int = 1000) -> SkillAnalyticsSnapshot:
+    accumulator = SkillAnalyticsAccumulator(bucket=bucket)
+    for rows in iter_skill_rows(chunk_size, accumulator.vocabulary):
+        accumulator.add_chunk(rows)
+    return accumulator.snapshot()
+
+
+def _entries(stored: Any, first: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """``(first, columns, counts)`` arrays of a stored sparse matrix.
+
+    Snapshots written before the sparse format hold dense nested lists.
+    """
+    if isinstance(stored, list):
+        if not stored:
+            return EMPTY, EMPTY, EMPTY
+        dense = np.asarray(stored, dtype=np.int64).reshape(len(stored), -1)
+        rows, columns = np.nonzero(np.triu(dense) if first == "rows" else dense)
+        return rows, columns, dense[rows, columns]
+    return (
+        np.asarray(stored[first], dtype=np.int64),
+        np.asarray(stored["columns"], dtype=np.int64),
+        np.asarray(stored["counts"], dtype=np.int64),
+    )
+
+
+def summarize(snapshot: SkillAnalyticsSnapshot, skill: str | None = None, limit: int = 20) -> Dict[str, Any]:
+    """API view of a snapshot: strongest pairs (or one skill's partners) and trends."""
+    names = [name for _, name in snapshot.skills]
+    rows, columns, pair_counts = _entries(snapshot.cooccurrence, "rows")
+    diagonal = rows == columns
+    counts = np.zeros(len(names), dtype=np.int64)
+    counts[rows[diagonal]] = pair_counts[diagonal]
+    rows, columns, pair_counts = rows[~diagonal], columns[~diagonal], pair_counts[~diagonal]
+    # Jaccard index |A and B| / |A or B|; every stored pair occurs, so the union is positive.
+    jaccard = pair_counts / (counts[rows] + counts[columns] - pair_counts)
+
+    if skill is not None:
+        column = names.index(skill)
+        selected = np.flatnonzero((rows == column) | (columns == column))
+        ranked = selected[np.lexsort((-jaccard[selected], -pair_counts[selected]))][:limit]
+        pairs = [
+            {"skills": [skill, names[columns[index] if rows[index] == column else rows[index]]],
+             "count": int(pair_counts[index]), "jaccard": round(float(jaccard[index]), 4)}
+            for index in ranked
+        ]
+        trend_columns = [column]
+    else:
+        # Stored pairs are ordered by (row, column), which breaks ties as before.
+        ranked = np.argsort(-pair_counts, kind="stable")[:limit]
+        pairs = [
+            {"skills": [names[rows[index]], names[columns[index]]], "count": int(pair_counts[index]),
+             "jaccard": round(float(jaccard[index]), 4)}
+            for index in ranked
+        ]
+        top = np.flatnonzero(counts)
+        trend_columns = top[np.argsort(-counts[top], kind="stable")][:limit].tolist()
+
+    periods, skill_columns, frequencies = _entries(snapshot.frequencies, "periods")
+    trends = np.zeros((len(trend_columns), len(snapshot.periods)), dtype=np.int64)
+    slots = {column: slot for slot, column in enumerate(trend_columns)}
+    for period, column, count in zip(periods.tolist(), skill_columns.tolist(), frequencies.tolist()):
+        slot = slots.get(column)
+        if slot is not None:
+            trends[slot, period] = count
+    return {
+        "generated_at": snapshot.created_at,
+        "bucket": snapshot.bucket,
+        "resume_count": snapshot.resume_count,
+        "pairs": pairs,
+        "trends": {
+            "periods": snapshot.periods,
+            "resume_counts": snapshot.period_totals,
+            "skills": {names[column]: trends[slots[column]].tolist() for column in trend_columns},
+        },
+    }
@@ -0,0 +1,632 @@
+"""Compiled skill and section-header taxonomy shared by every worker process.
+
+``manage.py compile_taxonomy`` turns ``skills.json`` and ``section_headers.json``
+into one read-only binary file. Workers memory-map it, so the lookup tables
+live once in the page cache instead of as per-process dicts and sets, and the
+lookups below read the mapped bytes directly. When the file is missing or was
+compiled from different JSON, the same format is compiled in memory instead.
+:class:`TaxonomyRegistry` notices when the JSON or the compiled file is
+replaced and swaps a freshly loaded version in without a restart.
+
+Layout (little-endian)::
+
+    header     magic, format version, table count, string blob offset/size,
+               SHA-1 of the JSON sources
+    directory  per table: name, entry offset/count, slot offset/count
+    entries    per table: fixed-size rows of (key, value, aux); key and value
+               are (offset, length) references into the string blob
+    slots      per table: open-addressing hash index over the keys; a slot
+               holds row index + 1 (0 is empty), probed linearly from
+               ``crc32(key) & (slots - 1)``
+    blob       the UTF-8 strings, each stored once
+
+Tables: ``headers`` (lowercased and letters-only header variant -> section,
+aux = section rank), ``header_variants`` (lowercased variants), ``categories``
+(aux = position), ``skills`` (normalized canonical skill -> display form, aux =
+category, in JSON order), ``terms`` (normalized skill or alias -> canonical
+display form, aux = category; a term listed under several skills has adjacent
+rows) and ``term_heads`` (first run of letters and digits in a term -> the
+delimiters terms put before it, newline separated; aux = the longest such
+term).
+
+A ``skills.json`` entry is a skill name or ``{"name": ..., "aliases": [...]}``;
+aliases ("JS", "Postgres", "k8s") are reported as their canonical skill.
+Matching text probes ``term_heads`` once per distinct word and only tries
+whole terms around words that head one, so its cost follows the length of the
+text, not the size of the taxonomy.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import re
+import struct
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+from django.conf import settings
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+SOURCE_FILES = ("skills.json", "section_headers.json")
+DEFAULT_PATH = DATA_DIR / "taxonomy.bin"
+
+MAGIC = b"CPBTAX\0\0"
+FORMAT_VERSION = 2
+HEADER = struct.Struct("<8sIIII20s")
+TABLE = struct.Struct("<16sIIII")
+ENTRY = struct.Struct("<IIIII")
+ENTRY_KEY = struct.Struct("<II")
+SLOT = struct.Struct("<I")
+# Hash slots per row: at most a quarter full, so a miss (most probes while
+# matching) seldom looks past its first slot.
+SLOTS_PER_ROW = 4
+TABLES = ("headers", "header_variants", "categories", "skills", "terms", "term_heads")
+
+_SPACES_RE = re.compile(r"\s+")
+_NON_LETTERS_RE = re.compile(r"[^a-z]")
+# Terms match only between characters outside [a-z0-9] (or the ends of the text).
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_WORD_CHARS = b"abcdefghijklmnopqrstuvwxyz0123456789"
+# Maps every UTF-8 byte outside [a-z0-9] to a space, so ``split`` yields the words.
+_WORD_BYTES = bytes(byte if byte in _WORD_CHARS else 32 for byte in range(256))
+
+Row = Tuple[str, str, int]
+
+
+class TaxonomyFormatError(ValueError):
+    """The buffer is not a compiled taxonomy this code can read."""
+
+
+def normalize_skill(value: str) -> str:
+    return _SPACES_RE.sub(" ", value.strip().lower())
+
+
+def compact_header(value: str) -> str:
+    return _NON_LETTERS_RE.sub("", value)
+
+
+def skill_entry(entry: str | Dict[str, Any]) -> Tuple[str, List[str]]:
+    """``(name, aliases)`` of a ``skills.json`` entry."""
+    if isinstance(entry, str):
+        return entry, []
+    return entry["name"], list(entry.get("aliases") or [])
+
+
+def data_dir() -> Path:
+    """Directory holding ``skills.json`` and ``section_headers.json`` (``PARSER_TAXONOMY_DATA_DIR``)."""
+    return Path(getattr(settings, "PARSER_TAXONOMY_DATA_DIR", None) or DATA_DIR)
+
+
+def source_digest(source_dir: Path | None = None) -> bytes:
+    """SHA-1 over the JSON sources, stored in (and checked against) compiled files."""
+    source_dir = Path(source_dir) if source_dir is not None else data_dir()
+    digest = hashlib.sha1()
+    for name in SOURCE_FILES:
+        digest.update((source_dir / name).read_bytes())
+    return digest.digest()
+
+
+def read_sources(source_dir: Path | None = None) -> Tuple[Dict[str, List[Any]], Dict[str, List[str]]]:
+    source_dir = Path(source_dir) if source_dir is not None else data_dir()
+    with open(source_dir / "skills.json", "r", encoding="utf-8") as f:
+        skills = json.load(f)
+    with open(source_dir / "section_headers.json", "r", encoding="utf-8") as f:
+        headers = json.load(f)
+    return skills, headers
+
+
+class _Table:
+    __slots__ = ("_buffer", "_blob", "_entries", "_count", "_slots", "_mask")
+
+    def __init__(self, buffer, blob: int, entries: int, count: int, slots: int, slot_count: int):
+        self._buffer = buffer
+        self._blob = blob
+        self._entries = entries
+        self._count = count
+        self._slots = slots
+        self._mask = slot_count - 1
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _string(self, offset: int, length: int) -> str:
+        start = self._blob + offset
+        return bytes(self._buffer[start:start + length]).decode("utf-8")
+
+    def row(self, index: int) -> Row:
+        offset = self._entries + index * ENTRY.size
+        key_off, key_len, value_off, value_len, aux = ENTRY.unpack_from(self._buffer, offset)
+        return self._string(key_off, key_len), self._string(value_off, value_len), aux
+
+    def __iter__(self) -> Iterator[Row]:
+        for index in range(self._count):
+            yield self.row(index)
+
+    def _has_key(self, index: int, encoded: bytes) -> bool:
+        key_off, key_len = ENTRY_KEY.unpack_from(self._buffer, self._entries + index * ENTRY.size)
+        start = self._blob + key_off
+        return key_len == len(encoded) and self._buffer[start:start + key_len] == encoded
+
+    def _locate(self, encoded: bytes) -> int:
+        """Index of the first row whose key is ``encoded``, or -1."""
+        if not self._count:
+            return -1
+        buffer, blob, entries, slots, mask = self._buffer, self._blob, self._entries, self._slots, self._mask
+        size = len(encoded)
+        slot = zlib.crc32(encoded) & mask
+        while True:
+            (stored,) = SLOT.unpack_from(buffer, slots + slot * SLOT.size)
+            if not stored:
+                return -1
+            key_off, key_len = ENTRY_KEY.unpack_from(buffer, entries + (stored - 1) * ENTRY.size)
+            if key_len == size and buffer[blob + key_off:blob + key_off + size] == encoded:
+                return stored - 1
+            slot = (slot + 1) & mask
+
+    def find(self, key: str) -> Tuple[str, int] | None:
+        """``(value, aux)`` of the first row whose key is ``key``."""
+        index = self._locate(key.encode("utf-8"))
+        if index < 0:
+            return None
+        _, _, value_off, value_len, aux = ENTRY.unpack_from(self._buffer, self._entries + index * ENTRY.size)
+        return self._string(value_off, value_len), aux
+
+    def find_many(self, keys: Iterable[bytes]) -> Dict[bytes, Tuple[str, int]]:
+        """``(value, aux)`` of the first row for each UTF-8 encoded key that has one.
+
+        The probe loop of :meth:`find`, inlined for the many mostly-missing
+        lookups of :meth:`Taxonomy.match_skills`.
+        """
+        found: Dict[bytes, Tuple[str, int]] = {}
+        if not self._count:
+            return found
+        buffer, blob, entries, slots, mask = self._buffer, self._blob, self._entries, self._slots, self._mask
+        unpack_slot, unpack_entry, crc32 = SLOT.unpack_from, ENTRY.unpack_from, zlib.crc32
+        for key in keys:
+            size = len(key)
+            slot = crc32(key) & mask
+            while True:
+                (stored,) = unpack_slot(buffer, slots + slot * SLOT.size)
+                if not stored:
+                    break
+                key_off, key_len, value_off, value_len, aux = unpack_entry(buffer, entries + (stored - 1) * ENTRY.size)
+                if key_len == size and buffer[blob + key_off:blob + key_off + size] == key:
+                    found[key] = (self._string(value_off, value_len), aux)
+                    break
+                slot = (slot + 1) & mask
+        return found
+
+    def find_all(self, encoded: bytes) -> List[Tuple[str, int]]:
+        """``(value, aux)`` of every row whose key is the UTF-8 ``encoded``; such rows are adjacent."""
+        index = self._locate(encoded)
+        found: List[Tuple[str, int]] = []
+        while 0 <= index < self._count and self._has_key(index, encoded):
+            _, _, value_off, value_len, aux = ENTRY.unpack_from(self._buffer, self._entries + index * ENTRY.size)
+            found.append((self._string(value_off, value_len), aux))
+            index += 1
+        return found
+
+
+class Taxonomy:
+    """Read-only lookups over a compiled taxonomy in ``buffer`` (an mmap or bytes)."""
+
+    __slots__ = ("_buffer", "_tables", "_categories", "digest", "fingerprint", "source")
+
+    def __init__(self, buffer, source: str = "memory"):
+        if len(buffer) < HEADER.size:
+            raise TaxonomyFormatError("truncated taxonomy header")
+        magic, version, table_count, blob, _blob_size, digest = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise TaxonomyFormatError(f"not a version {FORMAT_VERSION} compiled taxonomy")
+        self._buffer = buffer
+        self._tables: Dict[str, _Table] = {}
+        for index in range(table_count):
+            name, entries, count, slots, slot_count = TABLE.unpack_from(buffer, HEADER.size + index * TABLE.size)
+            self._tables[name.rstrip(b"\0").decode("ascii")] = _Table(buffer, blob, entries, count, slots, slot_count)
+        missing = set(TABLES) - set(self._tables)
+        if missing:
+            raise TaxonomyFormatError(f"missing tables: {', '.join(sorted(missing))}")
+        self._categories = [key for key, _, _ in self._tables["categories"]]
+        self.digest = digest
+        # Short form of the digest, used as the taxonomy version.
+        self.fingerprint = digest.hex()[:12]
+        # Where the tables came from: the compiled file's path, or "json".
+        self.source = source
+
+    def section_for_header(self, line: str) -> str | None:
+        """The section ``line`` is a header for, if any.
+
+        The line is lowercased, stripped of a trailing colon and compared as
+        is and with non-letters removed; when the two forms name different
+        sections, the one listed first in ``section_headers.json`` wins.
+        """
+        norm = line.strip().lower().rstrip(":")
+        headers = self._tables["headers"]
+        exact = headers.find(norm)
+        compact = headers.find(compact_header(norm))
+        if exact is None or (compact is not None and compact[1] < exact[1]):
+            exact = compact
+        return exact[0] if exact is not None else None
+
+    def is_header_variant(self, value: str) -> bool:
+        """Whether ``value`` (already lowercased) is a listed section-header variant."""
+        return self._tables["header_variants"].find(value) is not None
+
+    def categories(self) -> List[str]:
+        return list(self._categories)
+
+    def skills(self) -> Iterator[Tuple[str, str, str]]:
+        """``(category, canonical skill, normalized skill)`` in ``skills.json`` order."""
+        categories = self.categories()
+        for normalized, display, category in self._tables["skills"]:
+            yield categories[category], display, normalized
+
+    def skills_by_category(self) -> Dict[str, List[str]]:
+        grouped: Dict[str, List[str]] = {category: [] for category in self.categories()}
+        for category, display, _ in self.skills():
+            grouped[category].append(display)
+        return grouped
+
+    def match_skills(self, text: str) -> List[Tuple[str, str]]:
+        """``(category, canonical skill)`` for each skill or alias occurring in ``text``.
+
+        ``text`` must already be normalized (see :func:`normalize_skill`). A
+        term occurs where it is preceded and followed by a character outside
+        ``[a-z0-9]`` or by an end of the text; an alias preceded by ``.`` does
+        not count, so "js" is not found in "vue.js". Pairs are ordered by
+        where a term for them first occurs, without repeats.
+        """
+        heads, terms = self._tables["term_heads"], self._tables["terms"]
+        encoded = text.encode("utf-8")
+        # Delimiters (including every byte of a non-ASCII character) become
+        # spaces, with one more at each end, so `` word `` finds whole words.
+        spaced = b" " + encoded.translate(_WORD_BYTES) + b" "
+        words = heads.find_many(set(spaced.split()))
+        if not words:
+            return []
+
+        categories = self._categories
+        # Terms already looked up, apart from and after a ".".
+        probed: Tuple[set, set] = (set(), set())
+        found: Dict[Tuple[str, str], int] = {}
+        for word, (prefixes, longest) in words.items():
+            starts = [b""] + [prefix.encode("utf-8") for prefix in prefixes.split("\n")] if prefixes else [b""]
+            needle = b" " + word + b" "
+            # ``spaced[i + 1]`` is ``encoded[i]``, so a needle found at ``i`` is the word at ``i``.
+            position = spaced.find(needle)
+            while position >= 0:
+                for prefix in starts:
+                    start = position - len(prefix)
+                    if start < 0 or encoded[start:position] != prefix or spaced[start] != 32:
+                        continue
+                    after_dot = start > 0 and encoded[start - 1] == 46  # "."
+                    # Every delimiter from the end of the word up to the longest term.
+                    end = position + len(word)
+                    while 0 <= end <= start + longest:
+                        term = encoded[start:end]
+                        if term not in probed[after_dot]:
+                            probed[after_dot].add(term)
+                            for display, category in terms.find_all(term):
+                                if after_dot and normalize_skill(display).encode("utf-8") != term:
+                                    continue
+                                found.setdefault((categories[category], display), start)
+                        end = spaced.find(b" ", end + 2) - 1
+                position = spaced.find(needle, position + 1)
+        return sorted(found, key=found.__getitem__)
+
+    def close(self) -> None:
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+
+def _section_rows(headers: Dict[str, List[str]]) -> Tuple[List[Row], List[Row]]:
+    lookup: Dict[str, Tuple[str, int]] = {}
+    variants: Dict[str, None] = {}
+    for rank, (section, values) in enumerate(headers.items()):
+        for value in values:
+            lowered = value.lower()
+            variants.setdefault(lowered)
+            # Lower ranks win, as when sections were scanned in order.
+            lookup.setdefault(lowered, (section, rank))
+            lookup.setdefault(compact_header(lowered), (section, rank))
+    return [(key, section, rank) for key, (section, rank) in lookup.items()], [(key, "", 0) for key in variants]
+
+
+def _skill_rows(skills: Dict[str, List[Any]]) -> Tuple[List[Row], List[Row], List[Row], List[Row]]:
+    categories = [(category, "", index) for index, category in enumerate(skills)]
+    rows: List[Row] = []
+    # Term -> (canonical, category) targets, in first-listed order.
+    targets: Dict[str, Dict[Tuple[str, int], None]] = {}
+    for index, entries in enumerate(skills.values()):
+        for entry in entries:
+            name, aliases = skill_entry(entry)
+            rows.append((normalize_skill(name), name, index))
+            for term in (name, *aliases):
+                normalized = normalize_skill(term)
+                if normalized:
+                    targets.setdefault(normalized, {}).setdefault((name, index))
+    terms = [(term, name, index) for term, pairs in targets.items() for name, index in pairs]
+    heads: Dict[str, Tuple[Dict[str, None], int]] = {}
+    for term in targets:
+        # Terms without a letter or digit can never be delimited, so never match.
+        word = _WORD_RE.search(term)
+        if word is None:
+            continue
+        prefixes, longest = heads.get(word.group(), ({}, 0))
+        if word.start():
+            prefixes.setdefault(term[:word.start()])
+        heads[word.group()] = (prefixes, max(longest, len(term.encode("utf-8"))))
+    return categories, rows, terms, [
+        (word, "\n".join(prefixes), longest) for word, (prefixes, longest) in heads.items()
+    ]
+
+
+def compile_taxonomy(skills: Dict[str, List[Any]], headers: Dict[str, List[str]], digest: bytes = b"") -> bytes:
+    """The compiled binary form of the two JSON documents; ``digest`` identifies their source."""
+    header_rows, variant_rows = _section_rows(headers)
+    category_rows, skill_rows, term_rows, head_rows = _skill_rows(skills)
+    tables: Dict[str, Sequence[Row]] = {
+        "headers": header_rows,
+        "header_variants": variant_rows,
+        "categories": category_rows,
+        "skills": skill_rows,
+        "terms": term_rows,
+        "term_heads": head_rows,
+    }
+
+    blob = bytearray()
+    interned: Dict[str, Tuple[int, int]] = {}
+
+    def intern(value: str) -> Tuple[int, int]:
+        if value not in interned:
+            encoded = value.encode("utf-8")
+            interned[value] = (len(blob), len(encoded))
+            blob.extend(encoded)
+        return interned[value]
+
+    body = bytearray()
+    directory: List[Tuple[bytes, int, int, int, int]] = []
+    body_start = HEADER.size + TABLE.size * len(tables)
+    for name, rows in tables.items():
+        entries = body_start + len(body)
+        for key, value, aux in rows:
+            body.extend(ENTRY.pack(*intern(key), *intern(value), aux))
+        slot_count = 8
+        while slot_count < SLOTS_PER_ROW * len(rows):
+            slot_count *= 2
+        slots = [0] * slot_count
+        mask = slot_count - 1
+        for index, (key, _, _) in enumerate(rows):
+            slot = zlib.crc32(key.encode("utf-8")) & mask
+            while slots[slot]:
+                if rows[slots[slot] - 1][0] == key:
+                    break
+                slot = (slot + 1) & mask
+            if not slots[slot]:
+                slots[slot] = index + 1
+        directory.append((name.encode("ascii"), entries, len(rows), body_start + len(body), slot_count))
+        body.extend(struct.pack(f"<{slot_count}I", *slots))
+
+    blob_offset = body_start + len(body)
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, len(tables), blob_offset, len(blob), digest.ljust(20, b"\0"))
+    return b"".join([header, *(TABLE.pack(*entry) for entry in directory), bytes(body), bytes(blob)])
+
+
+def compile_sources(source_dir: Path | None = None) -> bytes:
+    skills, headers = read_sources(source_dir)
+    return compile_taxonomy(skills, headers, source_digest(source_dir))
+
+
+def write_taxonomy(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` atomically, so mapped readers never see a partial file."""
+    path = Path(path)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def open_taxonomy(path: Path) -> Taxonomy:
+    """Memory-map a compiled taxonomy file read-only."""
+    with open(path, "rb") as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        return Taxonomy(buffer, source=str(path))
+    except TaxonomyFormatError:
+        buffer.close()
+        raise
+
+
+def taxonomy_path() -> Path:
+    return Path(getattr(settings, "PARSER_TAXONOMY_PATH", None) or DEFAULT_PATH)
+
+
+def load_taxonomy(path: Path | None = None, source_dir: Path | None = None) -> Taxonomy:
+    """The compiled file at ``path`` when it matches the JSON sources, else a fresh in-memory compile."""
+    path = Path(path) if path is not None else taxonomy_path()
+    digest = source_digest(source_dir)
+    if path.is_file():
+        try:
+            taxonomy = open_taxonomy(path)
+        except (OSError, ValueError):
+            taxonomy = None
+        if taxonomy is not None:
+            if taxonomy.digest == digest:
+                return taxonomy
+            taxonomy.close()
+    skills, headers = read_sources(source_dir)
+    return Taxonomy(compile_taxonomy(skills, headers, digest), source="json")
+
+
+def source_stamp(path: Path | None = None, source_dir: Path | None = None) -> Tuple[Any, ...]:
+    """``(name, mtime, size)`` of the JSON sources and the compiled file; changes when any of them is replaced."""
+    path = Path(path) if path is not None else taxonomy_path()
+    source_dir = Path(source_dir) if source_dir is not None else data_dir()
+    stamp = []
+    for file in (*(source_dir / name for name in SOURCE_FILES), path):
+        try:
+            stat = file.stat()
+        except OSError:
+            stamp.append((str(file), None, None))
+        else:
+            stamp.append((str(file), stat.st_mtime_ns, stat.st_size))
+    return tuple(stamp)
+
+
+class TaxonomyRegistry:
+    """The active taxonomy of this process, replaced when its files change.
+
+    The first :meth:`current` call loads the taxonomy. After that, a call
+    made more than ``PARSER_TAXONOMY_RELOAD_INTERVAL`` seconds after the last
+    check stats the source files. If they changed, a background thread loads
+    the new version and then swaps it in with a single assignment. Callers
+    keep the old version until the swap, and a failed load leaves it
+    active. Replaced taxonomies are never closed: parses still holding one
+    (see :func:`pinned_taxonomy`) keep working, and the mapping is released
+    once nothing references it. Their fingerprints are kept in
+    ``superseded``, the versions this process knows to be older.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], Taxonomy] = load_taxonomy,
+        stamp: Callable[[], Tuple[Any, ...]] = source_stamp,
+        reload_interval: float | None = None,
+    ):
+        self._loader = loader
+        self._stamp_files = stamp
+        self._reload_interval = reload_interval
+        self._active: Taxonomy | None = None
+        self._stamp: Tuple[Any, ...] | None = None
+        self._next_check = 0.0
+        self._reloading = False
+        self._lock = threading.Lock()
+        self.reloads = 0
+        self.failures = 0
+        self.last_error: str | None = None
+        self.superseded: set[str] = set()
+
+    @property
+    def reload_interval(self) -> float:
+        if self._reload_interval is not None:
+            return self._reload_interval
+        return float(getattr(settings, "PARSER_TAXONOMY_RELOAD_INTERVAL", 5.0) or 0)
+
+    def current(self) -> Taxonomy:
+        active = self._active
+        if active is None:
+            with self._lock:
+                if self._active is None:
+                    self._stamp = self._stamp_files()
+                    self._active = self._loader()
+                    self._next_check = time.monotonic() + self.reload_interval
+                return self._active
+        if self.reload_interval > 0 and time.monotonic() >= self._next_check:
+            self._check()
+        return active
+
+    def _check(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if self._reloading or now < self._next_check:
+                return
+            self._next_check = now + self.reload_interval
+            stamp = self._stamp_files()
+            if stamp == self._stamp:
+                return
+            self._reloading = True
+        threading.Thread(target=self._reload, args=(stamp,), name="taxonomy-reload", daemon=True).start()
+
+    def _reload(self, stamp: Tuple[Any, ...]) -> None:
+        try:
+            taxonomy = self._loader()
+        except Exception as exc:  # keep serving the active version
+            with self._lock:
+                # Retried when the files change again, not on every check.
+                self._stamp = stamp
+                self.failures += 1
+                self.last_error = f"{type(exc).__name__}: {exc}"
+                self._reloading = False
+            return
+        with self._lock:
+            self._replace(taxonomy)
+            self._stamp = stamp
+            self.reloads += 1
+            self.last_error = None
+            self._reloading = False
+
+    def reload(self) -> Taxonomy:
+        """Load the files now and make the result active."""
+        stamp = self._stamp_files()
+        taxonomy = self._loader()
+        with self._lock:
+            self._replace(taxonomy)
+            self._stamp = stamp
+            self._next_check = time.monotonic() + self.reload_interval
+            self.reloads += 1
+            self.last_error = None
+        return taxonomy
+
+    def _replace(self, taxonomy: Taxonomy) -> None:
+        # Called with the lock held.
+        if self._active is not None and self._active.fingerprint != taxonomy.fingerprint:
+            self.superseded.add(self._active.fingerprint)
+        # Rolling back to an earlier version makes it current again.
+        self.superseded.discard(taxonomy.fingerprint)
+        self._active = taxonomy
+
+    def snapshot(self) -> Dict[str, Any]:
+        active = self._active
+        return {
+            "version": active.fingerprint if active is not None else None,
+            "source": active.source if active is not None else None,
+            "reloads": self.reloads,
+            "reloading": self._reloading,
+            "failures": self.failures,
+            "last_error": self.last_error,
+        }
+
+
+taxonomy_registry = TaxonomyRegistry()
+_pinned: ContextVar[Taxonomy | None] = ContextVar("pinned_taxonomy", default=None)
+
+
+def get_taxonomy() -> Taxonomy:
+    """The taxonomy pinned for this request or parse, else the active one."""
+    pinned = _pinned.get()
+    return pinned if pinned is not None else taxonomy_registry.current()
+
+
+def taxonomy_version() -> str:
+    """Fingerprint of the taxonomy :func:`get_taxonomy` returns, for cache keys and version stamps."""
+    return get_taxonomy().fingerprint
+
+
+def is_superseded(fingerprint: str) -> bool:
+    """Whether this process has reloaded away from the taxonomy with ``fingerprint``."""
+    return fingerprint in taxonomy_registry.superseded
+
+
+@contextmanager
+def pinned_taxonomy() -> Iterator[Taxonomy]:
+    """Serve every :func:`get_taxonomy` call in the block from one version, even across a reload."""
+    pinned = _pinned.get()
+    if pinned is not None:
+        yield pinned
+        return
+    taxonomy = taxonomy_registry.current()
+    token = _pinned.set(taxonomy)
+    try:
+        yield taxonomy
+    finally:
+        _pinned.reset(token)
@@ -0,0 +1,38 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from parser.api.authentication import user_cache
+from parser.models import Resume
+
+
+@receiver(post_save, sender=User)
+def publish_user_version(sender, instance, **kwargs):
+    # Deactivation and password changes must not be served from any worker's cache.
+    user_cache.publish(instance)
+
+
+@receiver(post_delete, sender=User)
+def forget_cached_user(sender, instance, **kwargs):
+    user_cache.forget(instance.pk)
+
+
+@receiver(post_save, sender=Resume)
+def index_saved_resume(sender, instance, **kwargs):
+    # Imported here so app loading does not import NumPy.
+    from parser.services.ranking import rank_indexes
+
+    # Only indexes already loaded in this process are kept warm; others are
+    # built from the database on their first ranking query.
+    index = rank_indexes.loaded(instance.user_id)
+    if index is not None:
+        index.upsert(instance)
+
+
+@receiver(post_delete, sender=Resume)
+def unindex_deleted_resume(sender, instance, **kwargs):
+    from parser.services.ranking import rank_indexes
+
+    index = rank_indexes.loaded(instance.user_id)
+    if index is not None:
+        index.remove(instance.pk)
@@ -1,10 +1,97 @@
-from django.test import SimpleTestCase
+import gzip
+import json
+import random
+import re
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from io import BytesIO, StringIO
+from pathlib import Path
+from unittest import mock
 
-from parser.services.build_output import ResumeParser
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.core.exceptions import FieldError
+from django.core.management.base import CommandError
+from django.db import connection, models
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.exceptions import Throttled
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+from docx import Document
+from docx.oxml import OxmlElement
+
+from parser.api.authentication import user_cache
+from parser.api.renderers import FastJSONRenderer
+from parser.benchmarks.corpus import PAGE_CHARS, generate_corpus, generate_resume
+from parser.benchmarks import BenchResult
+from parser.benchmarks import imports as imports_benchmark
+from parser.benchmarks import line_cache as line_cache_benchmark
+from parser.benchmarks import regex as regex_benchmark
+from parser.benchmarks import taxonomy as taxonomy_benchmark
+from parser.benchmarks.loadtest import EndpointStats, parse_mix, resume_docx, text_docx
+from parser.benchmarks.preprocess import legacy_preprocess
+from parser.compression import encode
+from parser.fields import CompressedFieldMixin
+from parser.models import IdempotencyKey, Resume, SkillAnalyticsSnapshot, UserResumeStats
+from parser.services import resume_workflow
+from parser.services.admission import AdmissionController, ParsingUnavailable
+from parser.services.deadline import Deadline
+from parser.services.export_cache import ExportCache
+from parser.services.idempotency import (
+    IdempotencyKeyInProgress,
+    IdempotencyStore,
+    IdempotencyStoreFull,
+    idempotency_store,
+)
+from parser.services.build_output import PreviousParse, ResumeParser, required_stages
 from parser.services.extract_experience import extract_experience
+from parser.services.extract_skills import extract_skills
+from parser.services.extract_text import extract_text
+from parser.services.parser_version import PARSER_REVISION, current_parser_version, is_older_version
 from parser.services.preprocess import preprocess
 from parser.services.profile_export import ResumeProfileExporter
-from parser.services.resume_health import score_resume
+from parser.services.resume_health import HEALTH_RULES_VERSION, changed_keys, evaluate_rules, rescore, score_resume
+from parser.services.resume_reparse import ResumeReparseService, reparse_queue
+from parser.services.resume_stats import ResumeStatsService
+from parser.services.resume_workflow import ResumeWorkflowService
+from parser.services.ranking import rank_indexes
+from parser.services.records import ExperienceEntry, ParsedResume
+from parser.services.scanners import (
+    DATE_RANGE_PATTERN,
+    DATE_RANGE_SCANNER,
+    EMAIL_PATTERN,
+    EMAIL_SCANNER,
+    PHONE_PATTERN,
+    PHONE_SCANNER,
+    Scanner,
+)
+from parser.services.line_cache import LineCache, line_cache
+from parser.services.section_cache import MISSING, SectionCache
+from parser.services.section_splitter import split_sections
+from parser.services.skill_analytics import SkillAnalyticsAccumulator, summarize
+from parser.services.taxonomy import (
+    DATA_DIR,
+    SOURCE_FILES,
+    Taxonomy,
+    TaxonomyRegistry,
+    compile_taxonomy,
+    get_taxonomy,
+    load_taxonomy,
+    normalize_skill,
+    pinned_taxonomy,
+    read_sources,
+    skill_entry,
+    source_stamp,
+)
+from parser.services.similarity import NEAR_DUPLICATE_DISTANCE, hamming, simhash
+from parser.warmup import WARMUP_STEPS, warm_up
 
 
 class ResumeProfileExporterTests(SimpleTestCase):
@@ -88,10 +175,10 @@ class ResumeExtractionRegressionTests(SimpleTestCase):
         ]
         items = extract_experience(lines)
         self.assertEqual(len(items), 1)
-        self.assertEqual(items[0]["title"], "Lead Backend Engineer")
-        self.assertEqual(items[0]["company"], "RocketOps")
-        self.assertEqual(items[0]["start_date"], "Jan 2022")
-        self.assertEqual(items[0]["end_date"].lower(), "present")
+        self.assertEqual(items[0].title, "Lead Backend Engineer")
+        self.assertEqual(items[0].company, "RocketOps")
+        self.assertEqual(items[0].start_date, "Jan 2022")
+        self.assertEqual(items[0].end_date.lower(), "present")
 
     def test_parser_falls_back_to_unknown_section_when_headers_missing(self):
         parser = ResumeParser()
@@ -106,6 +193,30 @@ class ResumeExtractionRegressionTests(SimpleTestCase):
         self.assertGreater(len(parsed["experience"]), 0)
 
 
+class ParsedResumeRecordTests(SimpleTestCase):
+    def test_profile_round_trips_through_records(self):
+        for seed in range(10):
+            outcome = ResumeParser(section_cache=None).parse_with_report(preprocess(generate_resume(seed, 2)))
+            with self.subTest(seed=seed):
+                self.assertEqual(ParsedResume.from_dict(outcome.profile), outcome.record)
+                self.assertEqual(outcome.record.to_dict(), outcome.profile)
+                self.assertEqual(score_resume(outcome.profile), score_resume(outcome.record))
+                self.assertEqual(ResumeProfileExporter().export(outcome.profile),
+                                 ResumeProfileExporter().export(outcome.record))
+
+    def test_loose_stored_shapes_are_read(self):
+        record = ParsedResume.from_dict({
+            "contact": {"name": "Jane Doe", "links": "https://github.com/jane"},
+            "skills": {"categories": {"frameworks": "Django", "databases": None}},
+            "experience": [{"title": "Engineer", "highlights": None}, "not an entry"],
+        })
+        self.assertEqual(record.contact.links.other, ["https://github.com/jane"])
+        self.assertEqual(record.skills.categories, {"frameworks": ["Django"], "databases": []})
+        self.assertEqual(record.experience, [ExperienceEntry(title="Engineer")])
+        self.assertIsNone(record.education)
+        self.assertIn("# Jane Doe", ResumeProfileExporter().build_cv_markdown(record))
+
+
 class ResumeHealthRegressionTests(SimpleTestCase):
     def test_health_detects_links_when_links_provided_as_list(self):
         payload = {
@@ -125,3 +236,1196 @@ class ResumeHealthRegressionTests(SimpleTestCase):
         health = score_resume(payload)
         self.assertIn("Professional links detected", health["strengths"])
         self.assertNotIn("No GitHub/LinkedIn detected", health["warnings"])
+
+
+class CompressedResumeFieldTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="jane", password="password123")
+
+    def test_lookups_and_none_are_rejected(self):
+        for lookup in ("parsed_data__contact", "parsed_data__contains", "raw_text__icontains", "raw_text"):
+            with self.subTest(lookup=lookup), self.assertRaises(FieldError):
+                Resume.objects.filter(**{lookup: "Jane"}).exists()
+        self.assertFalse(Resume.objects.filter(parsed_data__isnull=True).exists())
+
+        with self.assertRaisesMessage(ValueError, "Resume.parsed_data can't be None"):
+            Resume.objects.create(user=self.user, file_name="cv.pdf", parsed_data=None, resume_health={})
+
+    def test_payloads_round_trip_and_are_stored_compressed(self):
+        raw_text = "Jane Doe\nSkills\nPython, Django\n" * 50
+        parsed = {"contact": {"name": "Jane Doe", "email": None}, "skills": {"categories": {}}}
+        resume = Resume.objects.create(
+            user=self.user, file_name="cv.pdf", raw_text=raw_text, parsed_data=parsed, resume_health={}
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT raw_text FROM parser_resume WHERE id = %s", [resume.pk])
+            stored = bytes(cursor.fetchone()[0])
+        self.assertLess(len(stored), len(raw_text))
+
+        loaded = Resume.objects.get(pk=resume.pk)
+        self.assertIsInstance(loaded.__dict__["raw_text"], bytes)
+        self.assertEqual(loaded.raw_text, raw_text)
+        self.assertEqual(loaded.parsed_data, parsed)
+
+    def test_untouched_blob_is_saved_without_recompressing(self):
+        resume = Resume.objects.create(
+            user=self.user, file_name="cv.pdf", raw_text="text", parsed_data={"a": 1}, resume_health={}
+        )
+        loaded = Resume.objects.get(pk=resume.pk)
+        loaded.is_confirmed = True
+        loaded.save()
+
+        self.assertIsInstance(loaded.__dict__["parsed_data"], bytes)
+        self.assertEqual(Resume.objects.get(pk=resume.pk).parsed_data, {"a": 1})
+
+    def test_fields_without_an_encoding_cannot_be_created(self):
+        class HalfCompressedField(CompressedFieldMixin, models.BinaryField):
+            def decode_blob(self, blob):
+                return blob
+
+        with self.assertRaisesMessage(TypeError, "encode_value"):
+            HalfCompressedField()
+
+
+class RescoreResumesCommandTests(TestCase):
+    def test_rescores_only_stale_rows(self):
+        user = User.objects.create_user(username="jane", password="password123")
+        parsed = {"contact": {"name": "Jane Doe", "email": "jane@example.com"}}
+        stale = Resume.objects.create(
+            user=user, file_name="old.pdf", parsed_data=parsed, resume_health={"score": 0}
+        )
+        current = Resume.objects.create(
+            user=user,
+            file_name="new.pdf",
+            parsed_data=parsed,
+            resume_health={"score": 99},
+            health_version=HEALTH_RULES_VERSION,
+        )
+
+        call_command("rescore_resumes", chunk_size=1, stdout=StringIO())
+
+        stale.refresh_from_db()
+        current.refresh_from_db()
+        self.assertEqual(stale.health_version, HEALTH_RULES_VERSION)
+        self.assertEqual(stale.resume_health, score_resume(parsed))
+        self.assertEqual(stale.parsed_data["resume_health"], stale.resume_health)
+        self.assertEqual(current.resume_health, {"score": 99})
+
+    def test_bumps_updated_at_and_skips_rows_edited_while_scoring(self):
+        user = User.objects.create_user(username="jane", password="password123")
+        parsed = {"contact": {"name": "Jane Doe", "email": "jane@example.com"}}
+        stale = Resume.objects.create(user=user, file_name="old.pdf", parsed_data=parsed, resume_health={})
+        edited = Resume.objects.create(user=user, file_name="edited.pdf", parsed_data=parsed, resume_health={})
+        read_at = stale.updated_at
+
+        def score_and_edit(payload):
+            resume = Resume.objects.get(pk=edited.pk)
+            resume.parsed_data = {**resume.parsed_data, "summary": "user edit"}
+            resume.save()
+            return score_resume(payload)
+
+        with mock.patch("parser.management.commands.rescore_resumes.score_resume", side_effect=score_and_edit):
+            call_command("rescore_resumes", stdout=StringIO())
+
+        stale.refresh_from_db()
+        edited.refresh_from_db()
+        self.assertEqual(stale.health_version, HEALTH_RULES_VERSION)
+        self.assertGreater(stale.updated_at, read_at)
+        self.assertEqual(edited.parsed_data["summary"], "user edit")
+        self.assertNotEqual(edited.health_version, HEALTH_RULES_VERSION)
+
+
+class ResumeReparseTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="jane", password="password123")
+
+    def _resume(self, **kwargs):
+        return Resume.objects.create(
+            user=self.user,
+            file_name="cv.pdf",
+            raw_text="Jane Doe\njane@example.com\nSkills\nPython, Django",
+            parsed_data={"contact": {}},
+            resume_health={},
+            parser_version="0-old",
+            **kwargs,
+        )
+
+    def test_stale_resume_is_reparsed_from_raw_text(self):
+        resume = self._resume()
+        self.assertTrue(ResumeReparseService().reparse(resume))
+
+        resume.refresh_from_db()
+        self.assertEqual(resume.parser_version, current_parser_version())
+        self.assertEqual(resume.parsed_data["contact"]["email"], "jane@example.com")
+        self.assertIn("Python", resume.parsed_data["skills"]["categories"]["programming_languages"])
+
+    def test_reads_queue_stale_resumes_instead_of_reparsing(self):
+        resume = self._resume()
+        read_at = resume.updated_at
+        client = APIClient()
+        client.force_authenticate(self.user)
+        with mock.patch.object(reparse_queue, "background", False):
+            response = client.get(f"/api/resumes/{resume.pk}/")
+            self.assertEqual(response.data["parsed_data"], {"contact": {}})
+            self.assertEqual(reparse_queue.drain(), 1)
+
+        resume.refresh_from_db()
+        self.assertEqual(resume.parser_version, current_parser_version())
+        self.assertGreater(resume.updated_at, read_at)
+
+    def test_only_older_versions_are_stale(self):
+        fingerprint = current_parser_version().split("-", 1)[1]
+        service, sweeper = ResumeReparseService(), ResumeReparseService(other_taxonomies=True)
+        for version, stale, swept in [
+            (current_parser_version(), False, False),
+            ("", True, True),
+            (f"{PARSER_REVISION - 1}-{fingerprint}", True, True),
+            (f"{PARSER_REVISION + 1}-{fingerprint}", False, False),
+            (f"{PARSER_REVISION}-from-a-newer-taxonomy", False, True),
+        ]:
+            resume = Resume(parser_version=version)
+            with self.subTest(version=version):
+                self.assertEqual(service.is_stale(resume), stale)
+                self.assertEqual(sweeper.is_stale(resume), swept)
+
+        replaced = Resume(parser_version=f"{PARSER_REVISION}-replaced")
+        with mock.patch("parser.services.parser_version.is_superseded", lambda fingerprint: True):
+            self.assertTrue(service.is_stale(replaced))
+
+    def test_confirmed_and_edited_resumes_are_never_reparsed(self):
+        confirmed = self._resume(is_confirmed=True)
+        edited = self._resume(is_edited=True)
+
+        call_command("reparse_stale", rate=0, stdout=StringIO())
+
+        for resume in (confirmed, edited):
+            resume.refresh_from_db()
+            self.assertEqual(resume.parsed_data, {"contact": {}})
+            self.assertEqual(resume.parser_version, "0-old")
+
+
+class ResumeEditDiffTests(TestCase):
+    def setUp(self):
+        idempotency_store.clear()
+        self.user = User.objects.create_user(username="jane", password="password123")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        upload = SimpleUploadedFile("cv.docx", resume_docx(seed=5, pages=1))
+        self.resume_id = self.client.post("/api/parse-resume/", {"file": upload}).data["resume_id"]
+        self.url = f"/api/resumes/{self.resume_id}/edit/"
+
+    def test_rescore_reruns_only_dependent_rules(self):
+        parsed = Resume.objects.get(pk=self.resume_id).parsed_data
+        edited = {**parsed, "skills": {"categories": {"frameworks": ["Django"]}}}
+        health, rules, rerun = rescore(edited, changed_keys(parsed, edited), evaluate_rules(parsed))
+        self.assertEqual(rerun, ["skills"])
+        self.assertEqual(health, score_resume(edited))
+        self.assertEqual(rules, evaluate_rules(edited))
+
+    def test_confirming_reuses_exports_and_reports_changes(self):
+        exports = ExportCache().exports(Resume.objects.get(pk=self.resume_id))
+        with mock.patch.object(ResumeProfileExporter, "export") as export:
+            response = self.client.patch(f"{self.url}?response=changes", {"is_confirmed": True}, format="json")
+            self.assertEqual(ExportCache().exports(Resume.objects.get(pk=self.resume_id)), exports)
+        export.assert_not_called()
+        self.assertEqual(set(response.data), {"id", "version", "changed"})
+        self.assertEqual(response.data["changed"], {"is_confirmed": True})
+        self.assertEqual(response["ETag"], f'"{response.data["version"]}"')
+
+    def test_parsed_data_edit_returns_changed_keys_and_health(self):
+        parsed = Resume.objects.get(pk=self.resume_id).parsed_data
+        edited = {**parsed, "contact": {**parsed["contact"], "phone": None}}
+        first = self.client.patch(f"{self.url}?response=changes", {"parsed_data": edited}, format="json").data
+        self.assertEqual(set(first["changed"]["parsed_data"]), {"contact"})
+        self.assertIn("Missing phone number", first["changed"]["resume_health"]["warnings"])
+        self.assertIn("profile_exports", first["changed"])
+
+        edited["skills"] = {"categories": {}}
+        second = self.client.patch(f"{self.url}?response=changes", {"parsed_data": edited}, format="json").data
+        self.assertEqual(set(second["changed"]["parsed_data"]), {"skills"})
+        self.assertNotEqual(second["version"], first["version"])
+        resume = Resume.objects.get(pk=self.resume_id)
+        self.assertEqual(resume.resume_health, score_resume(edited))
+        self.assertEqual(resume.health_rules, evaluate_rules(edited))
+
+        self.assertEqual(self.client.patch(f"{self.url}?response=diff", {}, format="json").status_code, 400)
+
+
+class BenchmarkCorpusTests(SimpleTestCase):
+    def test_generator_is_seeded_and_scales_with_pages(self):
+        self.assertEqual(generate_resume(7, 2), generate_resume(7, 2))
+        self.assertNotEqual(generate_resume(7, 2), generate_resume(8, 2))
+        self.assertGreaterEqual(len(generate_resume(7, 10)), 10 * PAGE_CHARS)
+
+    def test_generated_resume_parses_into_all_core_sections(self):
+        parsed = ResumeParser().parse(preprocess(generate_resume(3, 3)))
+        self.assertTrue(parsed["contact"]["email"])
+        self.assertTrue(parsed["experience"])
+        self.assertTrue(parsed["education"])
+        self.assertTrue(parsed["projects"])
+
+
+class PreprocessGoldenTests(SimpleTestCase):
+    TOKENS = [
+        "Jane", "Doe", "O'Neil", "S", " ", "  ", "\t", "\r", "\n", "\r\n", "\u00a0", "\x0b", "\u2022", "\u00b7",
+        "_", "*", "-", ":", "Skills", "EXPERIENCE", "Education:", "S K I L L S", "E\tD U", "ab.c-d", "A1",
+    ]
+
+    def test_matches_original_implementation_on_corpus(self):
+        for seed in range(20):
+            raw_text = generate_resume(seed, 2)
+            with self.subTest(seed=seed):
+                self.assertEqual(preprocess(raw_text), legacy_preprocess(raw_text))
+
+    def test_matches_original_implementation_on_edge_cases(self):
+        rng = random.Random(44)
+        for _ in range(5000):
+            raw_text = "".join(rng.choice(self.TOKENS) for _ in range(rng.randint(0, 16)))
+            with self.subTest(raw_text=raw_text):
+                self.assertEqual(preprocess(raw_text), legacy_preprocess(raw_text))
+
+
+class ScannerTests(SimpleTestCase):
+    CASES = [
+        (PHONE_SCANNER, PHONE_PATTERN, ["0", "7", " ", "  ", "(", ")", ".", "-", "+", "x", "\u0663"]),
+        (EMAIL_SCANNER, EMAIL_PATTERN, ["a", "Z9", ".", "_", "%", "+", "-", "@", " ", "x.io", "@b.c"]),
+        (DATE_RANGE_SCANNER, DATE_RANGE_PATTERN,
+         ["jan", "Sept", "\u017fep", "DEC", "2020", "19", " ", "\t", "-", "\u2013", "\u2014", "present", "_", "x"]),
+    ]
+
+    def test_scanners_match_reference_regexes(self):
+        rng = random.Random(43)
+        for scanner, reference, tokens in self.CASES:
+            groups = [0, *reference.groupindex]
+            for _ in range(5000):
+                text = "".join(rng.choice(tokens) for _ in range(rng.randint(0, 14)))
+                expected, actual = reference.search(text), scanner.search(text)
+                with self.subTest(pattern=reference.pattern, text=text):
+                    self.assertEqual(
+                        actual and [actual.span(group) for group in groups],
+                        expected and [expected.span(group) for group in groups],
+                    )
+                    self.assertEqual(scanner.sub("", text), reference.sub("", text))
+
+    def test_scanners_must_define_search(self):
+        class Unfinished(Scanner):
+            pass
+
+        with self.assertRaisesMessage(TypeError, "search"):
+            Unfinished()
+
+    def test_adversarial_inputs_scale_linearly(self):
+        results = regex_benchmark.run(repeat=5)
+        self.assertEqual(regex_benchmark.check(results), [])
+
+
+class CompiledTaxonomyTests(SimpleTestCase):
+    def test_lookups_match_json_sources(self):
+        skills, headers = read_sources()
+        taxonomy = Taxonomy(compile_taxonomy(skills, headers))
+        self.assertEqual(
+            taxonomy.skills_by_category(),
+            {category: [skill_entry(entry)[0] for entry in entries] for category, entries in skills.items()},
+        )
+
+        compact = {
+            section: {v.lower() for v in variants} | {re.sub(r"[^a-z]", "", v.lower()) for v in variants}
+            for section, variants in headers.items()
+        }
+        lines = [v for vs in headers.values() for v in vs]
+        lines += ["Skills & Tools:", "W O R K", "  summary :", "Hobbies", ""]
+        for line in [*lines, *(line.upper() for line in lines)]:
+            norm = line.strip().lower().rstrip(":")
+            expected = next(
+                (s for s, vs in compact.items() if norm in vs or re.sub(r"[^a-z]", "", norm) in vs), None
+            )
+            with self.subTest(line=line):
+                self.assertEqual(taxonomy.section_for_header(line), expected)
+                self.assertEqual(
+                    taxonomy.is_header_variant(norm), any(norm == v.lower() for vs in headers.values() for v in vs)
+                )
+
+    def test_skill_matching_agrees_with_a_regex_scan_over_every_term(self):
+        skills, headers = read_sources()
+        taxonomy = Taxonomy(compile_taxonomy(skills, headers))
+        terms = [
+            (category, name, normalize_skill(term), term != name)
+            for category, entries in skills.items()
+            for name, aliases in map(skill_entry, entries)
+            for term in (name, *aliases)
+        ]
+        texts = [normalize_skill(text) for text in generate_corpus(7, [1, 5], per_size=3)]
+        texts += ["c++/c#, .net; node.js", "vue.js vue", "k8s,postgres", "javascript-based", "gopher go", ""]
+        texts += ["next.js, js", "react.js/.js"]
+        for text in texts:
+            expected = {
+                (category, name) for category, name, term, alias in terms
+                if re.search(rf"(^|[^a-z0-9{'.' if alias else ''}]){re.escape(term)}([^a-z0-9]|$)", text)
+            }
+            with self.subTest(text=text[:40]):
+                self.assertEqual(set(taxonomy.match_skills(text)), expected)
+
+    def test_aliases_are_reported_as_canonical_skills(self):
+        taxonomy = Taxonomy(compile_taxonomy(
+            {"languages": [{"name": "JavaScript", "aliases": ["JS", "ECMAScript"]}, "Go"],
+             "databases": [{"name": "PostgreSQL", "aliases": ["Postgres"]}],
+             "devops": [{"name": "Kubernetes", "aliases": ["k8s"]}, {"name": "Go", "aliases": ["Golang"]}]},
+            {},
+        ))
+        self.assertEqual(
+            taxonomy.match_skills(normalize_skill("JS, Postgres and K8s; golang")),
+            [("languages", "JavaScript"), ("databases", "PostgreSQL"), ("devops", "Kubernetes"), ("devops", "Go")],
+        )
+        self.assertEqual(taxonomy.match_skills("go"), [("languages", "Go"), ("devops", "Go")])
+        self.assertEqual(taxonomy.match_skills("jsx gopher ecmascripts"), [])
+        skills = extract_skills(["Tools: JS, Postgres, k8s, GCP"])
+        self.assertEqual(skills.categories["programming_languages"], ["JavaScript"])
+        self.assertEqual(skills.categories["databases"], ["PostgreSQL"])
+        self.assertEqual(skills.categories["cloud_platforms"], ["Google Cloud"])
+
+    def test_terms_wrapped_onto_the_next_line_are_matched(self):
+        skills = extract_skills(["Deployed on Google", "Cloud Platform and Amazon Web", "Services with React"])
+        self.assertEqual(skills.categories["cloud_platforms"], ["AWS", "Google Cloud"])
+        self.assertEqual(skills.categories["frameworks"], ["React"])
+
+    def test_aliases_do_not_match_inside_dotted_names(self):
+        skills = extract_skills(["Node.js API behind a Vue.js app"])
+        self.assertEqual(skills.categories["programming_languages"], [])
+        self.assertEqual(skills.categories["frameworks"], ["Vue.js"])
+        self.assertEqual(extract_skills(["Vue.js, JS"]).categories["programming_languages"], ["JavaScript"])
+
+    def test_taxonomy_benchmark_stays_within_its_budgets(self):
+        results = taxonomy_benchmark.run(repeat=3, sizes=(1_000, 10_000))
+        self.assertEqual(taxonomy_benchmark.check(results), [])
+
+    def test_compiled_file_is_mapped_only_when_it_matches_the_sources(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "taxonomy.bin"
+            self.assertEqual(load_taxonomy(path).source, "json")
+
+            call_command("compile_taxonomy", "--output", str(path), stdout=StringIO())
+            mapped = load_taxonomy(path)
+            self.assertEqual(mapped.source, str(path))
+            self.assertEqual(mapped.section_for_header("Work Experience:"), "experience")
+            mapped.close()
+
+            skills, headers = read_sources()
+            path.write_bytes(compile_taxonomy(skills, headers, b"stale"))
+            self.assertEqual(load_taxonomy(path).source, "json")
+            path.write_bytes(b"not a taxonomy")
+            self.assertEqual(load_taxonomy(path, DATA_DIR).source, "json")
+
+
+class TaxonomyReloadTests(SimpleTestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.data = Path(tmp.name)
+        for name in SOURCE_FILES:
+            (self.data / name).write_bytes((DATA_DIR / name).read_bytes())
+        compiled = self.data / "missing.bin"
+        self.registry = TaxonomyRegistry(
+            loader=lambda: load_taxonomy(compiled, self.data),
+            stamp=lambda: source_stamp(compiled, self.data),
+            reload_interval=0.01,
+        )
+
+    def add_skill(self, name):
+        path = self.data / "skills.json"
+        skills = json.loads(path.read_text())
+        skills["frameworks"].append(name)
+        path.write_text(json.dumps(skills))
+
+    def wait_for(self, condition):
+        deadline = time.monotonic() + 5
+        while not condition():
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.01)
+            self.registry.current()
+
+    def test_changed_sources_are_swapped_in_without_disturbing_pinned_parses(self):
+        with mock.patch("parser.services.taxonomy.taxonomy_registry", self.registry):
+            before = current_parser_version()
+            lines = ["Skills", "Frameworks: Zorbflow, Django"]
+            self.assertEqual(extract_skills(lines).categories["frameworks"], ["Django"])
+            with pinned_taxonomy() as pinned:
+                self.add_skill("Zorbflow")
+                self.wait_for(lambda: self.registry.reloads == 1)
+                self.assertIs(get_taxonomy(), pinned)
+                self.assertEqual(current_parser_version(), before)
+                self.assertEqual(extract_skills(lines).categories["frameworks"], ["Django"])
+
+            self.assertIsNot(get_taxonomy(), pinned)
+            self.assertNotEqual(current_parser_version(), before)
+            self.assertTrue(is_older_version(before))
+            self.assertEqual(extract_skills(lines).categories["frameworks"], ["Django", "Zorbflow"])
+            self.assertEqual(self.registry.snapshot()["version"], get_taxonomy().fingerprint)
+
+    def test_failed_reload_keeps_the_active_version(self):
+        active = self.registry.current()
+        (self.data / "skills.json").write_text("{not json")
+        self.wait_for(lambda: self.registry.failures == 1)
+        self.assertIs(self.registry.current(), active)
+        self.assertIn("JSONDecodeError", self.registry.snapshot()["last_error"])
+
+        (self.data / "skills.json").write_bytes((DATA_DIR / "skills.json").read_bytes())
+        self.add_skill("Zorbflow")
+        self.wait_for(lambda: self.registry.reloads == 1)
+        self.assertIsNot(self.registry.current(), active)
+        self.assertIsNone(self.registry.snapshot()["last_error"])
+
+
+class ColdStartTests(SimpleTestCase):
+    def test_heavy_modules_are_not_imported_at_startup(self):
+        for target, deferred in imports_benchmark.DEFERRED_MODULES.items():
+            loaded = imports_benchmark.loaded_modules(imports_benchmark.TARGETS[target])
+            with self.subTest(target=target):
+                self.assertIn("django", loaded)
+                self.assertEqual(sorted(loaded & set(deferred)), [])
+
+    def test_import_check_reports_eagerly_imported_modules(self):
+        result = BenchResult(name="import/setup", seconds=0.1, extra={"deferred_loaded": "numpy"})
+        self.assertEqual(imports_benchmark.check([result]), ["import/setup: imports numpy before first use"])
+
+    def test_warm_up_loads_what_first_use_would(self):
+        self.assertEqual(set(warm_up()), set(WARMUP_STEPS))
+        for name in ("pdfplumber", "docx", "numpy", "cpb_api.urls"):
+            self.assertIn(name, sys.modules)
+
+
+class LoadTestReportTests(SimpleTestCase):
+    def test_summary_uses_nearest_rank_percentiles(self):
+        stats = EndpointStats(latencies_ms=[float(value) for value in range(1, 101)], errors=5)
+        summary = stats.summary(wall_seconds=10)
+        self.assertEqual((summary["p50_ms"], summary["p95_ms"], summary["p99_ms"]), (50.0, 95.0, 99.0))
+        self.assertEqual(summary["error_rate"], 0.05)
+        self.assertEqual(summary["throughput_rps"], 10.0)
+
+    def test_mix_rejects_unknown_endpoints(self):
+        self.assertEqual(parse_mix("parse=2,detail"), {"parse": 2, "detail": 1})
+        with self.assertRaises(ValueError):
+            parse_mix("upload=1")
+
+
+class CachedJWTAuthenticationTests(TestCase):
+    def setUp(self):
+        user_cache.clear()
+        self.user = User.objects.create_user(username="jane", password="password123")
+        self.client = APIClient()
+        response = self.client.post(
+            "/api/auth/login/", {"username": "jane", "password": "password123"}, format="json"
+        )
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.data['access']}")
+
+    def test_repeat_requests_skip_the_user_query(self):
+        with self.assertNumQueries(2):
+            self.client.get("/api/resumes/")
+        with self.assertNumQueries(1):
+            self.client.get("/api/resumes/")
+
+    def test_deactivated_user_is_rejected_immediately(self):
+        self.assertEqual(self.client.get("/api/resumes/").status_code, 200)
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.client.get("/api/resumes/").status_code, 401)
+
+    def test_deactivation_reaches_caches_in_other_workers(self):
+        self.assertEqual(self.client.get("/api/resumes/").status_code, 200)
+        stale = User.objects.get(pk=self.user.pk)
+        self.user.is_active = False
+        self.user.save()
+        # Another worker's cache still holds the active user.
+        user_cache.put(str(self.user.pk), stale)
+        self.assertEqual(self.client.get("/api/resumes/").status_code, 401)
+
+    def test_tokens_without_user_version_use_the_cache(self):
+        token = RefreshToken.for_user(self.user).access_token
+        self.assertNotIn("uv", token)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        with self.assertNumQueries(2):
+            self.client.get("/api/resumes/")
+        with self.assertNumQueries(1):
+            self.client.get("/api/resumes/")
+
+
+class ResponseEncodingTests(TestCase):
+    def setUp(self):
+        user_cache.clear()
+        self.user = User.objects.create_user(username="jane", password="password123")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.resume = Resume.objects.create(
+            user=self.user,
+            file_name="cv.pdf",
+            raw_text="",
+            parsed_data=ResumeParser().parse(preprocess(generate_resume(5, 2))),
+            resume_health={},
+            parser_version=current_parser_version(),
+        )
+
+    def test_fast_renderer_matches_stdlib_json(self):
+        data = {"name": "Zoë", "skills": ["Python"], 1: None, "nested": {"score": 1.5}}
+        rendered = FastJSONRenderer().render(data)
+        self.assertEqual(json.loads(rendered), json.loads(json.dumps(data)))
+
+    def test_fast_renderer_output_is_identical_to_drf(self):
+        data = {
+            "created_at": datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc),
+            "naive": datetime(2026, 1, 2, 3, 4, 5),
+            "day": datetime(2026, 1, 2).date(),
+            "time": datetime(2026, 1, 2, 3, 4, 5, 6).time(),
+            "id": uuid.UUID(int=7),
+            "text": "Zoë \u2028 <b>",
+            "values": [1, 2.5, -0.0, 1e16, True, None, (3, 4)],
+            2: {"nested": []},
+        }
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+        for value in (float("nan"), float("inf"), -float("inf")):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    JSONRenderer().render({"score": value})
+                with self.assertRaises(ValueError):
+                    FastJSONRenderer().render({"scores": [None, value]})
+
+    def test_large_responses_are_gzipped_when_accepted(self):
+        response = self.client.get("/api/resumes/", HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(json.loads(gzip.decompress(response.content))[0]["id"], self.resume.pk)
+
+        plain = self.client.get("/api/resumes/", HTTP_ACCEPT_ENCODING="identity")
+        self.assertFalse(plain.has_header("Content-Encoding"))
+
+    def test_exports_are_served_precompressed(self):
+        url = f"/api/resumes/{self.resume.pk}/exports/"
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING="gzip, br;q=0")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        payload = json.loads(gzip.decompress(response.content))
+        self.assertEqual(payload["resume_id"], self.resume.pk)
+        self.assertIn("cv_markdown", payload["profile_exports"])
+
+    def test_exports_are_compressed_only_when_a_client_asks(self):
+        cache = ExportCache()
+        with mock.patch("parser.services.export_cache.encode", wraps=encode) as encoder:
+            cache.exports(self.resume)
+            self.client.get(f"/api/resumes/{self.resume.pk}/exports/", HTTP_ACCEPT_ENCODING="identity")
+            encoder.assert_not_called()
+
+            for _ in range(2):
+                response = self.client.get(f"/api/resumes/{self.resume.pk}/exports/", HTTP_ACCEPT_ENCODING="gzip")
+            self.assertEqual(response["Content-Encoding"], "gzip")
+            self.assertEqual(encoder.call_count, 1)
+
+
+class AdmissionControllerTests(SimpleTestCase):
+    def _hold(self, controller, user_key):
+        admitted, release = threading.Event(), threading.Event()
+
+        def worker():
+            with controller.admit(user_key):
+                admitted.set()
+                release.wait(5)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        admitted.wait(5)
+        return release, thread
+
+    def test_full_queue_and_per_user_limit_are_rejected_fast(self):
+        controller = AdmissionController(max_concurrent=1, max_queue=0, queue_timeout=5, per_user_limit=1)
+        release, thread = self._hold(controller, "alice")
+        try:
+            with self.assertRaises(Throttled) as throttled:
+                with controller.admit("alice"):
+                    pass
+            with self.assertRaises(ParsingUnavailable) as busy:
+                with controller.admit("bob"):
+                    pass
+        finally:
+            release.set()
+            thread.join()
+
+        self.assertGreaterEqual(throttled.exception.wait, 1)
+        self.assertGreaterEqual(busy.exception.wait, 1)
+        snapshot = controller.snapshot()
+        self.assertEqual(snapshot["rejected_user_limit"], 1)
+        self.assertEqual(snapshot["rejected_queue_full"], 1)
+        self.assertEqual(snapshot["active"], 0)
+        self.assertEqual(controller._per_user, {})
+
+    def test_timed_out_waiters_leave_no_per_user_entry(self):
+        controller = AdmissionController(max_concurrent=1, max_queue=1, queue_timeout=0.05, per_user_limit=1)
+        release, thread = self._hold(controller, "alice")
+        try:
+            with self.assertRaises(ParsingUnavailable):
+                with controller.admit("bob"):
+                    pass
+            self.assertEqual(controller._per_user, {"alice": 1})
+        finally:
+            release.set()
+            thread.join()
+        self.assertEqual(controller.snapshot()["rejected_timeout"], 1)
+        self.assertEqual(controller._per_user, {})
+
+    def test_queued_request_runs_when_a_slot_frees(self):
+        controller = AdmissionController(max_concurrent=1, max_queue=1, queue_timeout=5, per_user_limit=1)
+        release, thread = self._hold(controller, "alice")
+        threading.Timer(0.05, release.set).start()
+        with controller.admit("bob"):
+            self.assertEqual(controller.snapshot()["active"], 1)
+        thread.join()
+        self.assertEqual(controller.snapshot()["admitted"], 2)
+        self.assertEqual(controller.snapshot()["peak_queue_depth"], 1)
+
+
+class IdempotentUploadTests(TestCase):
+    def setUp(self):
+        idempotency_store.clear()
+        self.user = User.objects.create_user(username="jane", password="password123")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.docx = resume_docx(seed=3, pages=1)
+
+    def _upload(self, key, content=None):
+        upload = SimpleUploadedFile("cv.docx", content or self.docx)
+        return self.client.post("/api/parse-resume/", {"file": upload}, HTTP_IDEMPOTENCY_KEY=key)
+
+    def test_retry_replays_the_original_response(self):
+        with mock.patch.object(
+            ResumeWorkflowService, "process_upload", autospec=True, side_effect=ResumeWorkflowService.process_upload
+        ) as process_upload:
+            first = self._upload("retry-1")
+            second = self._upload("retry-1")
+
+        self.assertEqual(first.status_code, 201)
+        self.assertEqual(second.status_code, 201)
+        self.assertEqual(second["Idempotent-Replayed"], "true")
+        self.assertEqual(second.data["resume_id"], first.data["resume_id"])
+        self.assertEqual(second.data["profile_exports"], first.data["profile_exports"])
+        self.assertEqual(process_upload.call_count, 1)
+        self.assertEqual(Resume.objects.count(), 1)
+
+    def test_key_reused_with_another_file_is_rejected(self):
+        self.assertEqual(self._upload("retry-2").status_code, 201)
+        self.assertEqual(self._upload("retry-2", resume_docx(seed=4, pages=1)).status_code, 422)
+
+    def test_replay_returns_the_stored_response_after_an_edit(self):
+        first = self._upload("retry-3")
+        Resume.objects.filter(pk=first.data["resume_id"]).update(raw_text="edited")
+
+        second = self._upload("retry-3")
+        self.assertEqual(second.status_code, 201)
+        self.assertEqual(second.data["raw_text"], first.data["raw_text"])
+
+    @override_settings(IDEMPOTENCY_WAIT_TIMEOUT=0.1)
+    def test_in_flight_key_is_seen_by_another_worker(self):
+        other_worker = IdempotencyStore(poll_interval=0.01)
+        with idempotency_store.claim(self.user.pk, "retry-4", "digest") as claim:
+            with self.assertRaises(IdempotencyKeyInProgress):
+                with other_worker.claim(self.user.pk, "retry-4", "digest"):
+                    pass
+            claim.complete(201, {"resume_id": 7})
+
+        with other_worker.claim(self.user.pk, "retry-4", "digest") as replay:
+            self.assertTrue(replay.replayed)
+            self.assertEqual((replay.status, replay.body), (201, {"resume_id": 7}))
+
+    def test_full_store_rejects_new_keys_and_keeps_in_flight_ones(self):
+        store = IdempotencyStore(max_entries=1)
+        with store.claim(self.user.pk, "retry-5", "digest") as claim:
+            with self.assertRaises(IdempotencyStoreFull):
+                with store.claim(self.user.pk, "retry-6", "digest"):
+                    pass
+            claim.complete(201, {"resume_id": 8})
+
+        with store.claim(self.user.pk, "retry-5", "digest") as replay:
+            self.assertEqual(replay.body, {"resume_id": 8})
+
+    def test_expired_keys_are_claimed_afresh_and_cleaned_up_periodically(self):
+        store = IdempotencyStore(max_entries=2)
+        with store.claim(self.user.pk, "retry-7", "digest") as claim:
+            claim.complete(201, {"resume_id": 9})
+        IdempotencyKey.objects.update(created_at=datetime(2000, 1, 1, tzinfo=timezone.utc))
+
+        with CaptureQueriesContext(connection) as queries:
+            with store.claim(self.user.pk, "retry-8", "digest") as claim:
+                self.assertFalse(claim.replayed)
+                claim.complete(201, {"resume_id": 10})
+        self.assertFalse(any("COUNT(" in query["sql"] for query in queries.captured_queries))
+        self.assertFalse(any(query["sql"].startswith("DELETE") for query in queries.captured_queries))
+
+        with store.claim(self.user.pk, "retry-7", "digest") as claim:
+            self.assertFalse(claim.replayed)
+
+
+class NearDuplicateTests(TestCase):
+    def setUp(self):
+        idempotency_store.clear()
+        self.user = User.objects.create_user(username="jane", password="password123")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.text = generate_resume(seed=11, pages=1)
+
+    def _upload(self, text):
+        upload = SimpleUploadedFile("cv.docx", text_docx(text))
+        return self.client.post("/api/parse-resume/", {"file": upload})
+
+    def test_signature_tolerates_small_edits(self):
+        lines = preprocess(self.text)
+        edited = list(lines)
+        edited[3] = edited[3] + " today"
+        self.assertEqual(simhash(lines), simhash(list(reversed(lines))))
+        self.assertLessEqual(hamming(simhash(lines), simhash(edited)), NEAR_DUPLICATE_DISTANCE)
+        other = preprocess(generate_resume(seed=12, pages=1))
+        self.assertGreater(hamming(simhash(lines), simhash(other)), NEAR_DUPLICATE_DISTANCE)
+
+    def test_incremental_parse_matches_full_parse(self):
+        parser = ResumeParser()
+        old_lines = preprocess(self.text)
+        previous = PreviousParse(sections=split_sections(old_lines), parsed=parser.parse(old_lines))
+        new_lines = [line.replace("Python", "Pyhton", 1) if "Python" in line else line for line in old_lines]
+
+        profile, reused = parser.parse_incremental(new_lines, previous)
+        self.assertEqual(profile, parser.parse(new_lines))
+        self.assertTrue(reused)
+
+    def test_upload_reports_and_records_near_duplicate(self):
+        first = self._upload(self.text)
+        self.assertIsNone(first.data["near_duplicate_of"])
+
+        lines = self.text.split("\n")
+        lines[1] = lines[1] + " (updated)"
+        second = self._upload("\n".join(lines))
+        relationship = second.data["near_duplicate_of"]
+        self.assertEqual(relationship["resume_id"], first.data["resume_id"])
+        self.assertLessEqual(relationship["distance"], NEAR_DUPLICATE_DISTANCE)
+        self.assertIn("experience", relationship["reused_sections"])
+        resume = Resume.objects.get(pk=second.data["resume_id"])
+        self.assertEqual(resume.near_duplicate_of_id, first.data["resume_id"])
+
+        unrelated = self._upload(generate_resume(seed=12, pages=1))
+        self.assertIsNone(unrelated.data["near_duplicate_of"])
+
+
+class SectionMemoizationTests(TestCase):
+    def setUp(self):
+        idempotency_store.clear()
+        self.user = User.objects.create_user(username="jane", password="password123")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.text = generate_resume(seed=11, pages=1)
+
+    @staticmethod
+    def _edit_first_bullet(text):
+        lines = text.split("\n")
+        index = next(i for i, line in enumerate(lines) if line.startswith(("-", "\u2022", "\u25aa")))
+        lines[index] += " today"
+        return "\n".join(lines)
+
+    def test_only_changed_sections_are_recomputed(self):
+        parser = ResumeParser(section_cache=SectionCache())
+        first = parser.parse_with_report(preprocess(self.text))
+        self.assertEqual(first.reused, [])
+
+        edited = preprocess(self._edit_first_bullet(self.text))
+        outcome = parser.parse_with_report(edited)
+        self.assertEqual(outcome.recomputed, ["contact", "experience", "resume_health"])
+        self.assertEqual(sorted(outcome.reused), ["education", "projects", "skills"])
+        self.assertEqual(outcome.profile, ResumeParser(section_cache=None).parse(edited))
+
+    def test_cached_values_are_not_shared(self):
+        parser = ResumeParser(section_cache=SectionCache())
+        lines = preprocess(self.text)
+        parser.parse(lines)["experience"].append({"title": "mutated"})
+        self.assertEqual(parser.parse(lines), ResumeParser(section_cache=None).parse(lines))
+
+    def test_cache_evicts_least_recently_used_beyond_its_size(self):
+        probe = SectionCache(max_bytes=1 << 20)
+        probe.put(("a",), 1)
+        size = probe.bytes
+        cache = SectionCache(max_bytes=2 * size)
+        cache.put(("a",), 1)
+        cache.put(("b",), 2)
+        cache.get(("a",))
+        cache.put(("c",), 3)
+        self.assertEqual(cache.get(("a",)), 1)
+        self.assertIs(cache.get(("b",)), MISSING)
+        self.assertEqual(cache.snapshot()["entries"], 2)
+        self.assertEqual(cache.snapshot()["bytes"], 2 * size)
+
+    def test_reparse_keeps_the_confirmation_when_the_parse_is_unchanged(self):
+        upload = SimpleUploadedFile("cv.docx", text_docx(self.text))
+        resume_id = self.client.post("/api/parse-resume/", {"file": upload}).data["resume_id"]
+        Resume.objects.filter(pk=resume_id).update(is_confirmed=True)
+        raw_text = Resume.objects.get(pk=resume_id).raw_text
+        url = f"/api/resumes/{resume_id}/reparse/"
+
+        self.assertEqual(self.client.post(url, {"raw_text": raw_text}, format="json").status_code, 200)
+        self.assertTrue(Resume.objects.get(pk=resume_id).is_confirmed)
+
+        self.client.post(url, {"raw_text": self._edit_first_bullet(raw_text)}, format="json")
+        self.assertFalse(Resume.objects.get(pk=resume_id).is_confirmed)
+
+    def test_reparse_endpoint_reports_stages(self):
+        upload = SimpleUploadedFile("cv.docx", text_docx(self.text))
+        resume_id = self.client.post("/api/parse-resume/", {"file": upload}).data["resume_id"]
+        resume = Resume.objects.get(pk=resume_id)
+
+        edited = self._edit_first_bullet(resume.raw_text)
+        response = self.client.post(f"/api/resumes/{resume_id}/reparse/", {"raw_text": edited}, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("experience", response.data["stages"]["recomputed"])
+        self.assertIn("education", response.data["stages"]["reused"])
+
+        resume.refresh_from_db()
+        self.assertEqual(resume.raw_text, edited)
+        self.assertEqual(resume.parsed_data, ResumeParser(section_cache=None).parse(preprocess(edited)))
+        self.assertEqual(resume.simhash, simhash(preprocess(edited)))
+        self.assertEqual(ResumeStatsService().for_user(self.user).resume_count, 1)
+
+        other = User.objects.create_user(username="john", password="password123")
+        self.client.force_authenticate(other)
+        self.assertEqual(
+            self.client.post(f"/api/resumes/{resume_id}/reparse/", {"raw_text": edited}, format="json").status_code,
+            404,
+        )
+
+
+class LineCacheTests(SimpleTestCase):
+    def setUp(self):
+        line_cache.clear()
+        self.addCleanup(line_cache.clear)
+
+    def test_extractors_give_the_same_output_with_a_warm_cache(self):
+        documents = [preprocess(text) for text in generate_corpus(5, [1, 5], per_size=3)]
+        parser = ResumeParser(section_cache=None)
+        with override_settings(PARSER_LINE_CACHE_BYTES=0):
+            expected = [parser.parse(lines) for lines in documents]
+        for _ in range(2):
+            self.assertEqual([parser.parse(lines) for lines in documents], expected)
+
+        kinds = line_cache.snapshot()["kinds"]
+        self.assertEqual(set(kinds), {"dates", "skills", "urls"})
+        for stats in kinds.values():
+            self.assertGreater(stats["hit_rate"], 0.5)
+
+    def test_cache_evicts_least_recently_used_lines_once_over_its_byte_budget(self):
+        cache = LineCache(max_bytes=1400)
+        calls = []
+
+        def compute(line):
+            calls.append(line)
+            return (line.upper(),)
+
+        for line in ("a", "b", "a", "c", "d", "a", "b"):
+            cache.lookup("test", line, compute)
+        self.assertEqual(calls, ["a", "b", "c", "d", "b"])
+        snapshot = cache.snapshot()
+        self.assertLessEqual(snapshot["bytes"], 1400)
+        self.assertEqual((snapshot["hits"], snapshot["misses"]), (2, 5))
+        self.assertEqual(snapshot["kinds"]["test"]["hit_rate"], round(2 / 7, 4))
+
+        self.assertEqual(cache.lookup("test", "a", compute, version="other"), ("A",))
+        self.assertEqual(calls[-1], "a")
+        LineCache(max_bytes=0).lookup("test", "a", compute)
+        self.assertEqual(len(calls), 7)
+
+    def test_line_cache_benchmark_shows_a_warm_cache_pays_off(self):
+        results = line_cache_benchmark.run(repeat=2, resumes=10)
+        self.assertEqual(line_cache_benchmark.check(results), [])
+
+
+class SelectiveExtractionTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="jane", password="password123")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.lines = preprocess(generate_resume(seed=8, pages=2))
+
+    def test_only_required_stages_run(self):
+        self.assertEqual(required_stages(["contact"]), {"contact"})
+        self.assertEqual(required_stages(["projects"]), {"sections", "projects"})
+        self.assertIn("experience", required_stages(["resume_health"]))
+
+        skills = mock.Mock(side_effect=ResumeParser().skills_extractor)
+        projects = mock.Mock()
+        parser = ResumeParser(section_cache=None, skills_extractor=skills, projects_extractor=projects)
+        profile = parser.parse(self.lines, fields=["skills", "contact"])
+        self.assertEqual(list(profile), ["contact", "skills"])
+        full = ResumeParser(section_cache=None).parse(self.lines)
+        self.assertEqual(profile, {"contact": full["contact"], "skills": full["skills"]})
+        projects.assert_not_called()
+
+    def test_first_page_only_for_docx(self):
+        document = Document()
+        document.add_paragraph("Jane Doe")
+        paragraph = document.add_paragraph()
+        paragraph.add_run("jane@example.com")._r.append(OxmlElement("w:lastRenderedPageBreak"))
+        paragraph.add_run(" continued")
+        document.add_paragraph("Second page")
+        buffer = BytesIO()
+        document.save(buffer)
+        self.assertEqual(extract_text("cv.docx", buffer.getvalue(), max_pages=1), "Jane Doe\njane@example.com")
+        self.assertIn("Second page", extract_text("cv.docx", buffer.getvalue()))
+
+    def test_fields_option_returns_subset_without_storing(self):
+        upload = SimpleUploadedFile("cv.docx", resume_docx(seed=8, pages=1))
+        response = self.client.post("/api/parse-resume/?fields=contact,skills", {"file": upload})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.data), {"contact", "skills"})
+        self.assertTrue(response.data["contact"]["email"])
+        self.assertFalse(Resume.objects.exists())
+
+        upload = SimpleUploadedFile("cv.docx", resume_docx(seed=8, pages=1))
+        response = self.client.post("/api/parse-resume/?fields=contact,salary", {"file": upload})
+        self.assertEqual(response.status_code, 400)
+
+
+class ParseDeadlineTests(TestCase):
+    def setUp(self):
+        idempotency_store.clear()
+        self.user = User.objects.create_user(username="jane", password="password123")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def _upload(self):
+        upload = SimpleUploadedFile("cv.docx", resume_docx(seed=6, pages=1))
+        return self.client.post("/api/parse-resume/", {"file": upload})
+
+    def test_stages_after_deadline_are_skipped(self):
+        default = ResumeParser().contact_extractor
+
+        def slow_contact(lines):
+            time.sleep(0.05)
+            return default(lines)
+
+        parser = ResumeParser(section_cache=None, contact_extractor=slow_contact)
+        lines = preprocess(generate_resume(seed=6, pages=1))
+        outcome = parser.parse_with_report(lines, deadline=Deadline.after(0.01))
+        self.assertEqual(outcome.incomplete, ["skills", "education", "experience", "projects"])
+        self.assertEqual(outcome.profile["incomplete"], outcome.incomplete)
+        self.assertEqual(outcome.profile["resume_health"]["incomplete"], outcome.incomplete)
+        self.assertIn("email", outcome.profile["contact"])
+        self.assertNotIn("skills", outcome.profile)
+        self.assertNotIn("incomplete", parser.parse(lines))
+
+    @override_settings(PARSE_TIME_BUDGET=0.2)
+    def test_partial_parse_is_stored_and_finished_later(self):
+        def slow_preprocess(raw_text, deadline=None):
+            lines = preprocess(raw_text, deadline)
+            time.sleep(0.3)
+            return lines
+
+        with mock.patch.object(resume_workflow, "preprocess", slow_preprocess):
+            response = self._upload()
+        self.assertEqual(response.status_code, 201)
+        self.assertIn("experience", response.data["incomplete"])
+        resume = Resume.objects.get(pk=response.data["resume_id"])
+        self.assertEqual(resume.parser_version, "")
+        self.assertEqual(resume.resume_health["incomplete"], response.data["incomplete"])
+
+        self.assertTrue(ResumeReparseService().reparse(resume))
+        resume.refresh_from_db()
+        self.assertNotIn("incomplete", resume.parsed_data)
+        self.assertTrue(resume.parsed_data["experience"])
+
+    @override_settings(PARSE_TIME_BUDGET=0)
+    def test_exhausted_budget_during_extraction_is_unavailable(self):
+        response = self._upload()
+        self.assertEqual(response.status_code, 503)
+        self.assertIn("Retry-After", response)
+        self.assertFalse(Resume.objects.exists())
+
+
+class ResumeRankingTests(TestCase):
+    def setUp(self):
+        rank_indexes.clear()
+        self.user = User.objects.create_user(username="jane", password="password123")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.django = self._resume("django.pdf", ["Python", "Django"], ["PostgreSQL"], "Built Django REST APIs")
+        self.react = self._resume("react.pdf", ["JavaScript", "React"], [], "Built React dashboards")
+        self.flask = self._resume("flask.pdf", ["Python", "Flask"], [], "Built Flask services")
+
+    def _resume(self, name, languages_and_frameworks, databases, text):
+        categories = {
+            "programming_languages": [skill for skill in languages_and_frameworks if skill in ("Python", "JavaScript")],
+            "frameworks": [skill for skill in languages_and_frameworks if skill not in ("Python", "JavaScript")],
+            "databases": databases,
+        }
+        return Resume.objects.create(
+            user=self.user, file_name=name, raw_text=text, parsed_data={"skills": {"categories": categories}},
+            resume_health={},
+        )
+
+    def _rank(self, job_description, top_k=3):
+        response = self.client.post(
+            "/api/resumes/rank/", {"job_description": job_description, "top_k": top_k}, format="json"
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_ranks_by_skill_overlap_with_breakdown(self):
+        data = self._rank("We need a Python developer with Django and PostgreSQL experience.")
+        self.assertEqual(data["total"], 3)
+        self.assertEqual(set(data["query_skills"]), {"Python", "Django", "PostgreSQL"})
+        ids = [result["resume_id"] for result in data["results"]]
+        self.assertEqual(ids, [self.django.pk, self.flask.pk, self.react.pk])
+        top = data["results"][0]
+        self.assertEqual(set(top["matched_skills"]), {"Python", "Django", "PostgreSQL"})
+        self.assertEqual(data["results"][1]["missing_skills"], ["Django", "PostgreSQL"])
+        # One stored entry per resume skill, not one per vocabulary column.
+        self.assertEqual(len(rank_indexes.loaded(self.user.pk)._skill_indices), 7)
+
+    def test_index_follows_edits_and_deletes(self):
+        self._rank("React developer")
+        self.client.patch(
+            f"/api/resumes/{self.flask.pk}/edit/",
+            {"parsed_data": {"skills": {"categories": {"frameworks": ["React"]}}}},
+            format="json",
+        )
+        self.client.delete(f"/api/resumes/{self.react.pk}/")
+
+        data = self._rank("React developer", top_k=1)
+        self.assertEqual(data["total"], 2)
+        self.assertEqual(data["results"][0]["resume_id"], self.flask.pk)
+
+    def test_rows_written_by_other_processes_are_picked_up(self):
+        self._rank("Rust developer")
+        # QuerySet.update bypasses signals, like a write from another worker.
+        Resume.objects.filter(pk=self.react.pk).update(
+            parsed_data={"skills": {"categories": {"programming_languages": ["Rust"]}}}, parser_version="other"
+        )
+        self.assertEqual(self._rank("Rust developer", top_k=1)["results"][0]["resume_id"], self.react.pk)
+
+
+class ResumeStatsTests(TestCase):
+    def setUp(self):
+        idempotency_store.clear()
+        self.user = User.objects.create_user(username="jane", password="password123")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def _upload(self, seed):
+        upload = SimpleUploadedFile("cv.docx", resume_docx(seed=seed, pages=1))
+        return self.client.post("/api/parse-resume/", {"file": upload}).data["resume_id"]
+
+    def _assert_matches_rebuild(self):
+        stored = UserResumeStats.objects.get(user=self.user)
+        fresh = ResumeStatsService().rebuild([self.user.pk])[self.user.pk]
+        for name in ("resume_count", "scored_count", "score_sum", "score_histogram", "skill_counts",
+                     "warning_counts", "section_counts"):
+            self.assertEqual(getattr(stored, name), getattr(fresh, name), name)
+
+    def test_aggregates_follow_create_edit_and_delete(self):
+        first = self._upload(1)
+        second = self._upload(2)
+        self._assert_matches_rebuild()
+
+        self.client.patch(
+            f"/api/resumes/{first}/edit/",
+            {"parsed_data": {"skills": {"categories": {"frameworks": ["Django"]}}, "sections_found": ["skills"]}},
+            format="json",
+        )
+        self._assert_matches_rebuild()
+        self.client.delete(f"/api/resumes/{second}/")
+        self._assert_matches_rebuild()
+
+        data = self.client.get("/api/resumes/stats/").data
+        self.assertEqual(data["resume_count"], 1)
+        self.assertEqual(data["skills"], {"frameworks": {"Django": 1}})
+        self.assertEqual(sum(data["score_histogram"].values()), 1)
+        self.assertIn("Missing email", data["warnings"])
+
+    def test_stats_for_existing_resumes_are_built_on_first_read(self):
+        Resume.objects.create(
+            user=self.user, file_name="old.pdf", raw_text="", resume_health={"score": 42, "warnings": ["Missing name"]},
+            parsed_data={"skills": {"categories": {"databases": ["MySQL"]}}},
+        )
+        data = self.client.get("/api/resumes/stats/").data
+        self.assertEqual(data["resume_count"], 1)
+        self.assertEqual(data["average_score"], 42.0)
+        self.assertEqual(data["score_histogram"]["40-49"], 1)
+
+    def test_rebuild_command_detects_and_repairs_drift(self):
+        self._upload(3)
+        UserResumeStats.objects.filter(user=self.user).update(resume_count=7)
+        with self.assertRaises(CommandError):
+            call_command("rebuild_resume_stats", "--check", stdout=StringIO())
+        call_command("rebuild_resume_stats", stdout=StringIO())
+        call_command("rebuild_resume_stats", "--check", stdout=StringIO())
+        self.assertEqual(UserResumeStats.objects.get(user=self.user).resume_count, 1)
+
+
+class SkillAnalyticsTests(TestCase):
+    def test_chunked_accumulation_matches_naive_counts(self):
+        rng = random.Random(7)
+        rows = [
+            (datetime(2025, rng.randint(1, 12), 1, tzinfo=timezone.utc), sorted(rng.sample(range(20), rng.randint(0, 5))))
+            for _ in range(300)
+        ]
+        accumulator = SkillAnalyticsAccumulator()
+        for start in range(0, len(rows), 64):
+            accumulator.add_chunk(rows[start:start + 64])
+        snapshot = accumulator.snapshot()
+
+        stored = snapshot.cooccurrence
+        cooccurrence = dict(zip(zip(stored["rows"], stored["columns"]), stored["counts"]))
+        self.assertTrue(all(a <= b and count for (a, b), count in cooccurrence.items()))
+        for a, b in [(0, 0), (1, 2), (3, 17), (5, 19)]:
+            expected = sum(1 for _, codes in rows if a in codes and b in codes)
+            self.assertEqual(cooccurrence.get((a, b), 0), expected)
+        self.assertEqual(snapshot.periods, sorted(snapshot.periods))
+        march = snapshot.periods.index("2025-03")
+        self.assertEqual(snapshot.period_totals[march], sum(1 for created, _ in rows if created.month == 3))
+        stored = snapshot.frequencies
+        frequencies = dict(zip(zip(stored["periods"], stored["columns"]), stored["counts"]))
+        self.assertEqual(frequencies[march, 4], sum(1 for created, codes in rows if created.month == 3 and 4 in codes))
+
+    def test_summary_of_sparse_and_legacy_dense_snapshots_agree(self):
+        rows = [(datetime(2025, month, 1, tzinfo=timezone.utc), codes)
+                for month, codes in [(1, [0, 1]), (1, [0, 1, 2]), (2, [1, 2]), (3, [])]]
+        accumulator = SkillAnalyticsAccumulator()
+        accumulator.add_chunk(rows)
+        sparse = accumulator.snapshot()
+        width = len(accumulator.vocabulary)
+        cooccurrence = [[0] * width for _ in range(width)]
+        for (a, b), count in zip(zip(sparse.cooccurrence["rows"], sparse.cooccurrence["columns"]),
+                                 sparse.cooccurrence["counts"]):
+            cooccurrence[a][b] = cooccurrence[b][a] = count
+        frequencies = [[0] * width for _ in sparse.periods]
+        for period, column, count in zip(*sparse.frequencies.values()):
+            frequencies[period][column] = count
+        dense = SkillAnalyticsSnapshot(**{
+            **{name: getattr(sparse, name) for name in ("bucket", "resume_count", "skills", "periods", "period_totals")},
+            "cooccurrence": cooccurrence,
+            "frequencies": frequencies,
+        })
+
+        names = [name for _, name in sparse.skills]
+        for skill in (None, names[1]):
+            with self.subTest(skill=skill):
+                self.assertEqual(summarize(sparse, skill), summarize(dense, skill))
+        summary = summarize(sparse)
+        self.assertEqual(summary["pairs"][0], {"skills": names[:2], "count": 2, "jaccard": round(2 / 3, 4)})
+        self.assertEqual(summary["trends"]["skills"][names[1]], [2, 1, 0])
+
+    def test_command_snapshot_is_served_to_staff(self):
+        user = User.objects.create_user(username="jane", password="password123")
+        for skills in (["Python", "Django"], ["Python", "Django"], ["Python", "Flask"]):
+            categories = {"programming_languages": skills[:1], "frameworks": skills[1:]}
+            Resume.objects.create(
+                user=user, file_name="cv.pdf", raw_text="", resume_health={},
+                parsed_data={"skills": {"categories": categories}},
+            )
+        call_command("skill_analytics", "--chunk-size", "2", stdout=StringIO())
+
+        client = APIClient()
+        client.force_authenticate(user)
+        self.assertEqual(client.get("/api/analytics/skills/").status_code, 403)
+        client.force_authenticate(User.objects.create_superuser(username="admin", password="password123"))
+        data = client.get("/api/analytics/skills/", {"skill": "Python"}).data
+        self.assertEqual(data["resume_count"], 3)
+        self.assertEqual(data["pairs"][0], {"skills": ["Python", "Django"], "count": 2, "jaccard": 0.6667})
+        self.assertEqual(sum(data["trends"]["skills"]["Python"]), 3)
@@ -0,0 +1,51 @@
+"""Optional warmup for servers that load the application before forking workers.
+
+The parser loads its heavy dependencies on first use: the URLconf (and with
+it NumPy for ranking), ``pdfplumber`` and ``python-docx``, and the skill
+taxonomy. ``warm_up`` loads them up front. Called from ``cpb_api.wsgi`` when
+``PARSER_WARMUP`` is set, under ``gunicorn --preload``, it runs once in the
+master process: forked workers share the loaded modules and the taxonomy
+mapping copy-on-write, and their first request does not pay for them.
+"""
+
+from __future__ import annotations
+
+import importlib
+import time
+from typing import Callable, Dict
+
+
+def _load_urls() -> None:
+    from django.urls import get_resolver
+
+    get_resolver().url_patterns
+
+
+def _load_document_libraries() -> None:
+    importlib.import_module("pdfplumber")
+    importlib.import_module("docx")
+
+
+def _load_taxonomy() -> None:
+    from parser.services.ranking import skill_vocabulary
+    from parser.services.taxonomy import taxonomy_registry
+
+    taxonomy_registry.current()
+    skill_vocabulary()
+
+
+WARMUP_STEPS: Dict[str, Callable[[], None]] = {
+    "urls": _load_urls,
+    "document_libraries": _load_document_libraries,
+    "taxonomy": _load_taxonomy,
+}
+
+
+def warm_up() -> Dict[str, float]:
+    """Run every warmup step; returns the seconds each one took."""
+    timings = {}
+    for name, step in WARMUP_STEPS.items():
+        started = time.perf_counter()
+        step()
+        timings[name] = time.perf_counter() - started
+    return timings